@@ -0,0 +1,60 @@
+"""
+Measures the cold import time and the resident memory of pybird.
+
+Each sample runs 'import pybird' in a fresh interpreter, so that nothing is
+cached in sys.modules. Run it from the repository root:
+
+    python benchmarks/import_time.py --runs 10 --out import_time.json
+"""
+import json
+import subprocess
+import sys
+from argparse import ArgumentParser
+from statistics import mean, median
+
+_script = """
+import resource, sys, time
+sys.path.insert(0, './src')
+rss0 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+t0 = time.perf_counter()
+import {module}
+t1 = time.perf_counter()
+rss1 = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+heavy = sorted(m for m in ['numpy', 'scipy', 'gmsh', 'vtkmodules', 'matplotlib'] if m in sys.modules)
+print(t1 - t0, rss0, rss1, ','.join(heavy))
+"""
+
+def sample(module: str) -> dict:
+    out = subprocess.run([sys.executable, '-c', _script.format(module=module)], stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    time, rss0, rss1, heavy = (out.stdout.strip().split(' ') + [''])[:4]
+    # ru_maxrss is given in kilobytes on Linux
+    return {'time': float(time), 'rss': int(rss1) / 1024, 'rss_import': (int(rss1) - int(rss0)) / 1024, 'heavy': heavy}
+
+if __name__ == '__main__':
+
+    parser = ArgumentParser()
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--module', type=str, default='pybird')
+    parser.add_argument('--out', type=str, default=None)
+    args = parser.parse_args()
+
+    samples = [sample(args.module) for _ in range(args.runs)]
+
+    times = [s['time'] * 1e3 for s in samples]
+    rss = [s['rss'] for s in samples]
+
+    result = {
+        'module': args.module,
+        'runs': args.runs,
+        'time_ms': {'mean': mean(times), 'median': median(times), 'min': min(times), 'max': max(times)},
+        'max_rss_mb': {'mean': mean(rss), 'max': max(rss)},
+        'import_rss_mb': mean([s['rss_import'] for s in samples]),
+        'heavy_modules': samples[0]['heavy'].split(',') if samples[0]['heavy'] else [],
+    }
+
+    print('import {}: {:.1f} ms (median), {:.1f} MB max rss, heavy modules loaded: {}'.format(
+        args.module, result['time_ms']['median'], result['max_rss_mb']['max'], ', '.join(result['heavy_modules']) or 'none'))
+
+    if args.out is not None:
+        with open(args.out, 'w') as f:
+            json.dump(result, f, indent=2)
@@ -1,10 +1,14 @@
-from pybird.models import case_model as _case_model
-from pybird.modules.geo.geo import Geometry as _Geo
-from pybird.modules.mesh.mesh import Mesh as _Mesh
-from pybird.modules.view.view import View as _View
+from concurrent.futures import Executor
 
 from pybird.models import refinement_model as refinement
 from pybird.models.enums import TailShape
+from pybird.modules.builder.builder import Builder, Result
+from pybird.modules.builder.builder import build_many as _build_many
+from pybird.modules.mesh.session import session as _session
+
+# The functions below work on a default builder. Its case and outputs are also
+# available as pybird.model, pybird.vt, pybird.fc and pybird.te. Use Builder
+# directly to hold several cases or to build them in threads.
 
 def init() -> None:
     """
@@ -13,8 +17,10 @@ def init() -> None:
     Initialize global parameters. This must be called before any call to the other
     functions.
     """
-    global model
-    model = _case_model.CaseModel()
+    global _builder, model, vt, fc, te
+    _builder = Builder()
+    model = _builder.model
+    vt, fc, te = None, None, None
     return
 
 def load(file: str) -> None:
@@ -27,10 +33,8 @@ def load(file: str) -> None:
     -----------
     - file: geometric parameters
     """
-    new = _case_model.from_file(file)
-    model.name = new.name
-    model.description = new.description
-    model.geo = new.geo
+    _builder.model = model
+    _builder.load(file)
     return
 
 def save(file: str) -> None:
@@ -43,49 +47,143 @@ def save(file: str) -> None:
     -----------
     - file: output file
     """
-    _case_model.to_file(model, file)
+    _builder.model = model
+    _builder.save(file)
     return
 
-def build(ref: refinement.model, view: bool = False) -> None:
+def set_geometry_cache(directory: str = None, max_bytes: int = 2 ** 30, max_entries: int = 1000, memory_entries: int = 16) -> None:
     """
-    pybird.build(ref, view=True)
+    pybird.set_geometry_cache(directory=None, max_bytes=2 ** 30, max_entries=1000, memory_entries=16)
 
-    Save a file.case with the geometric parameters.
+    Store the built geometries by a hash of the geometric parameters and of the
+    foil files, so that pybird.build does not build the same geometry twice.
 
     Parameters:
     -----------
-    - ref: mesh refinament information
-    - view: show gmsh mesh
+    - directory: folder used to persist the geometries between runs (None keeps them only in memory)
+    - max_bytes: maximum size of the folder
+    - max_entries: maximum number of geometries in the folder
+    - memory_entries: number of geometries kept in memory (0 and no directory disables the cache)
+    """
+    _builder.set_geometry_cache(directory, max_bytes, max_entries, memory_entries)
+    return
+
+def set_mesh_cache(directory: str = None, max_bytes: int = 2 ** 32, max_entries: int = 1000, memory_entries: int = 4, mmap: bool = True) -> None:
     """
-    geo = _Geo(model.geo)
-    geo.build()
+    pybird.set_mesh_cache(directory=None, max_bytes=2 ** 32, max_entries=1000, memory_entries=4, mmap=True)
 
-    mesh = _Mesh(geo)
-    mesh.build(ref, view)
+    Store the built meshes by a hash of the geometry and of the refinement, so
+    that pybird.build does not mesh the same case twice. The cache is not used
+    when the mesh is shown.
 
-    global vt
-    vt = mesh.vertices
-    vt[:, 0] = - vt[:, 0]
-    vt[:, 1] = - vt[:, 1]
+    Parameters:
+    -----------
+    - directory: folder used to persist the meshes between runs (None keeps them only in memory)
+    - max_bytes: maximum size of the folder
+    - max_entries: maximum number of meshes in the folder
+    - memory_entries: number of meshes kept in memory (0 and no directory disables the cache)
+    - mmap: read the meshes from the folder as read-only memory maps
+    """
+    _builder.set_mesh_cache(directory, max_bytes, max_entries, memory_entries, mmap)
+    return
 
-    global fc
-    fc = mesh.faces
+def set_gmsh_options(num_threads: int = None, verbosity: int = None, options: dict = None) -> None:
+    """
+    pybird.set_gmsh_options(num_threads=None, verbosity=None, options=None)
 
-    global te
-    te = mesh.trailing_edge
+    gmsh is initialized once per process and each mesh is created in a new
+    model. This sets the options of the gmsh session (also used by the
+    processes of pybird.build_many). The defaults are one thread and
+    verbosity 1.
 
+    Parameters:
+    -----------
+    - num_threads: number of threads used by gmsh (General.NumThreads)
+    - verbosity: gmsh verbosity level (General.Verbosity)
+    - options: other gmsh options, as a dict of names and numbers or strings
+    """
+    _session().set_options(num_threads, verbosity, options)
     return
 
-def gen_vtk(file: str) -> None:
+def build(ref: refinement.model, view: bool = False, backend: str = 'gmsh', executor: Executor = None) -> None:
     """
-    pybird.gen_vtk(file)
+    pybird.build(ref, view=False, backend='gmsh', executor=None)
+
+    Build the geometry and the mesh. The geometry and the mesh model are kept,
+    so a new build with other refinement and the same geometry only meshes
+    the model again.
+
+    Parameters:
+    -----------
+    - ref: mesh refinament information
+    - view: show gmsh mesh
+    - backend: 'gmsh' meshes with gmsh and 'structured' fills the transfinite patches directly with numpy (faster, approximate, cannot be shown)
+    - executor: thread or process pool (concurrent.futures) that builds the wings,
+      their foil sections, the body, the head and the tail at the same time
+    """
+    global vt, fc, te
+    _builder.model = model
+    _builder.build(ref, view, backend, executor)
+    vt, fc, te = _builder.vt, _builder.fc, _builder.te
+    return
+
+def build_ladder(ref: refinement.model, factors: list, backend: str = 'gmsh', tol: float = 0.1) -> list:
+    """
+    pybird.build_ladder(ref, factors, backend='gmsh', tol=0.1)
+
+    Build the mesh at several resolutions, for multigrid or multi-fidelity
+    solvers. The geometry is built once and a single model is meshed with the
+    number of intervals of each curve multiplied by each factor (see
+    pybird.refinement.scale). When a factor is an integer multiple of the
+    previous one, the vertices of the previous level are also vertices of the
+    new one. This does not change pybird.vt, fc or te.
+
+    Parameters:
+    -----------
+    - ref: mesh refinament information of the factor 1
+    - factors: scale factors, for example [1, 2, 4]
+    - backend: mesh backend (see pybird.build)
+    - tol: distance, relative to the shortest edge, within which a vertex of a level matches one of the previous level
+
+    Returns a list with the levels (factor, ref, vertices, faces,
+    trailing_edge, parent), where parent holds the index in the level of each
+    vertex of the previous one (-1 when there is none).
+    """
+    _builder.model = model
+    return _builder.build_ladder(ref, factors, backend, tol)
+
+def gen_vtk(file: str, binary: bool = False, backend: str = 'native') -> None:
+    """
+    pybird.gen_vtk(file, binary=False, backend='native')
 
     Create a vtp file with the geometric and mesh information.
 
     Parameters:
     -----------
     - file: output file
+    - binary: write the data as raw appended binary instead of base64
+    - backend: 'native' uses the built-in xml writer and 'vtk' uses the vtk package
     """
-    view = _View(vt, fc)
-    view.gen_vtp_file(file)
+    _builder.vt, _builder.fc = vt, fc
+    _builder.gen_vtk(file, binary, backend)
     return
+
+def build_many(cases: list, refinements: refinement.model, workers: int = None, ordered: bool = True, max_pending: int = None, backend: str = 'gmsh'):
+    """
+    pybird.build_many(cases, refinements, workers=None, ordered=True, max_pending=None, backend='gmsh')
+
+    Build many cases in a pool of processes and yield the results (index,
+    name, vt, fc, te) as they are ready. Since the cases run in other
+    processes, this does not change pybird.model, vt, fc or te.
+
+    Parameters:
+    -----------
+    - cases: iterable of file.case paths or case models
+    - refinements: mesh refinament information, the same for all cases or one per case
+      (ValueError if there are fewer refinements than cases)
+    - workers: number of processes (None uses all the cores)
+    - ordered: yield the results in the order of the cases
+    - max_pending: maximum number of cases being built or waiting to be yielded (None uses 2 * workers)
+    - backend: mesh backend (see pybird.build)
+    """
+    return _build_many(cases, refinements, workers, ordered, max_pending, backend)
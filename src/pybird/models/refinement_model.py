@@ -1,3 +1,4 @@
+from math import ceil
 from typing import List, NamedTuple
 
 class wing_section(NamedTuple):
@@ -49,4 +50,26 @@ class model:
         self.head = head
         self.tail = tail
         
-        return
\ No newline at end of file
+        return
+
+def scale(ref: model, factor: float) -> model:
+    """Returns the refinement with the number of intervals of each curve multiplied by factor. The progression
+    ratios are taken to the power 1 / factor, so that the nodes of a curve are kept for integer factors"""
+
+    assert factor > 0
+
+    def nodes(n: int) -> int:
+        return max(1, round((n - 1) * factor)) + 1
+
+    def ratio(coef: float) -> float:
+        return (1.0 if coef >= 0 else -1.0) * abs(coef) ** (1 / factor)
+
+    sections = [wing_section(nodes(s.nodes), s.ref_type, ratio(s.coef) if s.ref_type == 'Progression' else s.coef) for s in ref.wing.sections]
+
+    return model(
+        wing=wing(sections, nodes(ref.wing.n_chord_le), nodes(ref.wing.n_chord_te), ratio(ref.wing.coef_te), ratio(ref.wing.coef_le)),
+        # Each half of the body cross section has ceil(n_cross_body / 2) intervals
+        body=body(2 * max(1, round(ceil(ref.body.n_cross_body / 2) * factor)), ratio(ref.body.coef_cross_body), nodes(ref.body.n_head), ratio(ref.body.coef_head), nodes(ref.body.n_tail), ratio(ref.body.coef_tail)),
+        head=head(nodes(ref.head.n_1), ratio(ref.head.coef_1), nodes(ref.head.n_2), ratio(ref.head.coef_2)),
+        tail=tail(nodes(ref.tail.n_edge), ratio(ref.tail.coef_edge_le), ratio(ref.tail.coef_edge_te), ratio(ref.tail.coef_tip), nodes(ref.tail.n_1), nodes(ref.tail.n_2)),
+    )
@@ -0,0 +1,206 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from os import cpu_count
+from threading import RLock
+from typing import Any, Iterable, Iterator, NamedTuple, Union
+
+from pybird.models import case_model
+from pybird.models import refinement_model as refinement
+from pybird.modules.mesh.session import session
+
+# The geometry, mesh and view modules are imported by the methods that
+# use them, so that importing pybird does not load numpy, scipy or gmsh.
+
+class Builder:
+    """
+    Owns a case, its geometry, mesh and outputs. Builders do not share state,
+    so several of them can be used at the same time in one process (only the
+    gmsh meshing step runs one at a time).
+
+    Attributes:
+    -----------
+    - model: case model
+    - vt: mesh vertices
+    - fc: mesh faces
+    - te: trailing edge vertices
+    """
+
+    def __init__(self) -> None:
+        self.model = case_model.CaseModel()
+        self.vt = None
+        self.fc = None
+        self.te = None
+        self.__geometry = None
+        self.__geometry_cache = None
+        self.__mesh_cache = None
+        self.__mesh = None
+        self.__lock = RLock()
+        return
+
+    def load(self, file: str) -> None:
+        """Upload the a file.case with the geometric parameters"""
+        new = case_model.from_file(file)
+        self.model.name = new.name
+        self.model.description = new.description
+        self.model.geo = new.geo
+        return
+
+    def save(self, file: str) -> None:
+        """Save a file.case with the geometric parameters"""
+        case_model.to_file(self.model, file)
+        return
+
+    def set_geometry_cache(self, directory: str = None, max_bytes: int = 2 ** 30, max_entries: int = 1000, memory_entries: int = 16) -> None:
+        """Store the built geometries (see pybird.set_geometry_cache)"""
+        from pybird.modules.cache.cache import Cache
+
+        with self.__lock:
+            self.__geometry = None
+            self.__geometry_cache = None if directory is None and memory_entries == 0 else Cache(directory, max_bytes, max_entries, memory_entries)
+        return
+
+    def set_mesh_cache(self, directory: str = None, max_bytes: int = 2 ** 32, max_entries: int = 1000, memory_entries: int = 4, mmap: bool = True) -> None:
+        """Store the built meshes (see pybird.set_mesh_cache)"""
+        from pybird.modules.cache.cache import Cache
+
+        with self.__lock:
+            self.__mesh = None
+            self.__mesh_cache = None if directory is None and memory_entries == 0 else Cache(directory, max_bytes, max_entries, memory_entries, mmap)
+        return
+
+    def build(self, ref: refinement.model, view: bool = False, backend: str = 'gmsh', executor: Executor = None) -> None:
+        """Build the geometry and the mesh of the case (see pybird.build)"""
+        from numpy import array
+        from pybird.modules.geo.geo import Geometry
+        from pybird.modules.mesh.mesh import Mesh
+
+        with self.__lock:
+
+            # The geometry is kept between builds, so that only the parts whose
+            # parameters changed are built again
+            if self.__geometry is None or self.__geometry[0] is not self.model.geo:
+                self.__geometry = [self.model.geo, Geometry(self.model.geo, self.__geometry_cache)]
+
+            geo = self.__geometry[1]
+            geo.build(executor)
+
+            # The mesh model is also kept, so that a new refinement of the same
+            # geometry only meshes it again
+            if self.__mesh is None or self.__mesh[0] is not geo or self.__mesh[1] != backend:
+                self.__mesh = [geo, backend, Mesh(geo, self.__mesh_cache)]
+                self.__mesh[2].build(ref, view, backend)
+            else:
+                self.__mesh[2].remesh(ref, view)
+
+            mesh = self.__mesh[2]
+
+            # The mesh arrays are read-only (or memory maps) when they come from
+            # the cache, so the outputs are copies
+            self.vt = mesh.vertices * [-1., -1., 1.]
+            self.fc = array(mesh.faces)
+            self.te = array(mesh.trailing_edge)
+
+        return
+
+    def build_ladder(self, ref: refinement.model, factors: list, backend: str = 'gmsh', tol: float = 0.1) -> list:
+        """Build the meshes of the case with the refinement scaled by each factor (see pybird.build_ladder)"""
+        from numpy import array
+        from pybird.modules.geo.geo import Geometry
+        from pybird.modules.mesh.ladder import build_ladder
+
+        with self.__lock:
+
+            if self.__geometry is None or self.__geometry[0] is not self.model.geo:
+                self.__geometry = [self.model.geo, Geometry(self.model.geo, self.__geometry_cache)]
+
+            geo = self.__geometry[1]
+            geo.build()
+
+            levels = build_ladder(geo, ref, factors, backend, self.__mesh_cache, tol)
+
+        return [level._replace(vertices=level.vertices * [-1., -1., 1.], faces=array(level.faces), trailing_edge=array(level.trailing_edge)) for level in levels]
+
+    def gen_vtk(self, file: str, binary: bool = False, backend: str = 'native') -> None:
+        """Create a vtp file with the geometric and mesh information"""
+        from pybird.modules.view.view import View
+
+        view = View(self.vt, self.fc)
+        view.gen_vtp_file(file, binary, backend)
+        return
+
+class Result(NamedTuple):
+    index: int         # position of the case in the input
+    name: str          # case name
+    vt: Any            # mesh vertices
+    fc: Any            # mesh faces
+    te: Any            # trailing edge vertices
+
+# Builder of each worker process, reused between its cases
+_worker = None
+
+def _init_worker(options: dict) -> None:
+    global _worker
+    _worker = Builder()
+    session().set_options(options=options)
+    return
+
+def _build_case(index: int, case: Union[str, case_model.CaseModel], ref: refinement.model, backend: str) -> Result:
+    if isinstance(case, str):
+        _worker.load(case)
+    else:
+        _worker.model = case
+    _worker.build(ref, backend=backend)
+    return Result(index, _worker.model.name, _worker.vt, _worker.fc, _worker.te)
+
+def build_many(cases: Iterable[Union[str, case_model.CaseModel]],
+               refinements: Union[refinement.model, Iterable[refinement.model]],
+               workers: int = None,
+               ordered: bool = True,
+               max_pending: int = None,
+               backend: str = 'gmsh') -> Iterator[Result]:
+    """Builds the cases in a pool of processes, each one with its own gmsh session (with the options of the
+    calling process), and yields the results as they are ready. Cases are read lazily and at most max_pending
+    of them are in flight or waiting to be yielded"""
+
+    workers = (cpu_count() or 1) if workers is None else workers
+    max_pending = 2 * workers if max_pending is None else max_pending
+    assert workers > 0 and max_pending > 0
+
+    # A single refinement is used for all the cases
+    cases = iter(cases)
+    single = isinstance(refinements, refinement.model)
+    ref = refinements if single else None
+    refinements = None if single else iter(refinements)
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(session().options,)) as executor:
+
+        pending = deque()
+        index = 0
+
+        def submit() -> bool:
+            nonlocal index
+            case = next(cases, None)
+            if case is None: return False
+            case_ref = ref if single else next(refinements, None)
+            if case_ref is None: raise ValueError('one refinement per case is required')
+            pending.append(executor.submit(_build_case, index, case, case_ref, backend))
+            index += 1
+            return True
+
+        while len(pending) < max_pending and submit(): pass
+
+        while len(pending) > 0:
+
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+
+            result = future.result()
+            submit()
+
+            yield result
+
+    return
@@ -0,0 +1,237 @@
+from collections import OrderedDict
+from hashlib import sha256
+from json import dumps, loads
+from os import fdopen, listdir, makedirs, path, remove, replace, stat, utime
+from tempfile import mkstemp
+from threading import RLock
+from typing import Any, Dict, List, Union
+from numpy import array, ascontiguousarray, double, dtype, frombuffer, memmap, ndarray
+
+from pybird.models import geo_model
+from pybird.models.geo_model import GeoModel
+
+# Entry file: MAGIC, header size (8 bytes, little endian), json header and the
+# arrays, each one starting at a multiple of ALIGN bytes
+MAGIC = b'PYBIRDC1'
+ALIGN = 64
+EXTENSION = '.bin'
+
+# Part of every key. Increase it when the arrays built from the same
+# parameters change, so that old entries are not used
+VERSION = 2
+
+def geometry_key(data: GeoModel) -> str:
+    """Returns a hash of the geometry parameters and of the contents of the foil files"""
+
+    h = sha256()
+    h.update('geometry-{}'.format(VERSION).encode('utf-8'))
+    h.update(dumps(geo_model.to_dict(data), sort_keys=True).encode('utf-8'))
+
+    for file in list(data.wing.foils) + [data.tail.foil]:
+        with open(file, 'rb') as f:
+            h.update(sha256(f.read()).digest())
+
+    return h.hexdigest()
+
+def mesh_key(geo: Any, ref: Any, backend: str = 'gmsh') -> str:
+    """Returns a hash of the geometry points and curves, of the refinement and of the mesher"""
+
+    h = sha256()
+    h.update('mesh-{}'.format(VERSION).encode('utf-8'))
+    for name, value in sorted(vars(geo).items()):
+        if name.startswith('_'): continue
+        value = ascontiguousarray(value, dtype=double)
+        h.update(name.encode('utf-8'))
+        h.update(str(value.shape).encode('utf-8'))
+        h.update(value.tobytes())
+
+    h.update(repr([tuple(ref.wing), tuple(ref.body), tuple(ref.head), tuple(ref.tail)]).encode('utf-8'))
+    h.update(backend.encode('utf-8'))
+
+    return h.hexdigest()
+
+def _pad(size: int) -> int:
+    return (ALIGN - size % ALIGN) % ALIGN
+
+def write_entry(file: str, arrays: Dict[str, ndarray]) -> None:
+    """Writes the arrays to a single binary file. The file is written to a unique temporary name and then moved,
+    if another writer moves its file first the last one wins"""
+
+    arrays = {name: ascontiguousarray(arr) for name, arr in arrays.items()}
+
+    index, offset = [], 0
+    for name, arr in arrays.items():
+        index.append([name, arr.dtype.str, list(arr.shape), offset])
+        offset += arr.nbytes + _pad(arr.nbytes)
+
+    header = dumps(index).encode('utf-8')
+    start = len(MAGIC) + 8 + len(header)
+    header += b' ' * _pad(start)
+
+    fd, tmp = mkstemp(dir=path.dirname(file), suffix='.tmp')
+    try:
+        with fdopen(fd, 'wb') as f:
+            f.write(MAGIC)
+            f.write(len(header).to_bytes(8, 'little'))
+            f.write(header)
+            for arr in arrays.values():
+                f.write(arr.tobytes())
+                f.write(b'\0' * _pad(arr.nbytes))
+        replace(tmp, file)
+    except FileNotFoundError:
+        pass
+    finally:
+        if path.exists(tmp): remove(tmp)
+
+    return
+
+def read_entry(file: str, mmap: bool = False) -> Dict[str, ndarray]:
+    """Reads the arrays of an entry file. If mmap is True the arrays are read-only memory maps of the file"""
+
+    with open(file, 'rb') as f:
+        assert f.read(len(MAGIC)) == MAGIC, 'invalid cache file'
+        size = int.from_bytes(f.read(8), 'little')
+        index = loads(f.read(size).decode('utf-8'))
+        start = len(MAGIC) + 8 + size
+        data = None if mmap else f.read()
+
+    out = {}
+    for name, dt, shape, offset in index:
+        dt = dtype(dt)
+        count = 1
+        for n in shape: count *= n
+        if count == 0:
+            out[name] = frombuffer(b'', dtype=dt).reshape(shape)
+        elif mmap:
+            out[name] = memmap(file, dtype=dt, mode='r', offset=start + offset, shape=tuple(shape))
+        else:
+            out[name] = frombuffer(data, dtype=dt, count=count, offset=offset).reshape(shape)
+
+    return out
+
+class Cache:
+    """Stores groups of arrays by key in a directory, with a LRU memory tier on top. The least recently used
+    files are removed when the directory exceeds max_bytes or max_entries"""
+
+    def __init__(self, directory: Union[str, None] = None,
+                       max_bytes: int = 2 ** 30,
+                       max_entries: int = 1000,
+                       memory_entries: int = 16,
+                       mmap: bool = False) -> None:
+
+        assert max_bytes > 0 and max_entries > 0 and memory_entries >= 0
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.mmap = mmap
+
+        self.__memory = OrderedDict()
+        self.__lock = RLock()
+
+        if directory is not None:
+            makedirs(directory, exist_ok=True)
+
+        return
+
+    def __file(self, key: str) -> str:
+        return path.join(self.directory, key + EXTENSION)
+
+    def __remember(self, key: str, arrays: Dict[str, ndarray]) -> None:
+        if self.memory_entries == 0: return
+        with self.__lock:
+            self.__memory[key] = arrays
+            self.__memory.move_to_end(key)
+            while len(self.__memory) > self.memory_entries:
+                self.__memory.popitem(last=False)
+        return
+
+    def get(self, key: str) -> Union[Dict[str, ndarray], None]:
+        """Returns the arrays stored with key or None"""
+
+        with self.__lock:
+            arrays = self.__memory.get(key)
+            if arrays is not None:
+                self.__memory.move_to_end(key)
+                return arrays
+
+        if self.directory is None: return None
+
+        file = self.__file(key)
+        try:
+            arrays = read_entry(file, self.mmap)
+            utime(file)
+        except (OSError, AssertionError, ValueError):
+            return None
+
+        for arr in arrays.values():
+            arr.flags.writeable = False
+
+        self.__remember(key, arrays)
+
+        return arrays
+
+    def put(self, key: str, arrays: Dict[str, ndarray]) -> None:
+        """Stores a copy of the arrays with key"""
+
+        arrays = {name: array(arr, order='C') for name, arr in arrays.items()}
+        for arr in arrays.values():
+            arr.flags.writeable = False
+
+        self.__remember(key, arrays)
+
+        if self.directory is not None:
+            write_entry(self.__file(key), arrays)
+            self.evict()
+
+        return
+
+    def entries(self) -> List[List]:
+        """Returns [key, size, last use] of the entries in the directory, from the least to the most recently used"""
+
+        out = []
+        for name in listdir(self.directory):
+            if not name.endswith(EXTENSION): continue
+            try:
+                info = stat(path.join(self.directory, name))
+            except OSError:
+                continue
+            out.append([name[:-len(EXTENSION)], info.st_size, info.st_mtime_ns])
+
+        out.sort(key=lambda x: x[2])
+
+        return out
+
+    def evict(self) -> None:
+        """Removes the least recently used files until the directory respects max_bytes and max_entries"""
+
+        if self.directory is None: return
+
+        entries = self.entries()
+        total = sum(e[1] for e in entries)
+
+        while len(entries) > 0 and (total > self.max_bytes or len(entries) > self.max_entries):
+            key, size, _ = entries.pop(0)
+            try:
+                remove(self.__file(key))
+            except OSError:
+                pass
+            total -= size
+
+        return
+
+    def clear(self) -> None:
+        """Removes all the entries"""
+
+        with self.__lock:
+            self.__memory.clear()
+
+        if self.directory is not None:
+            for key, _, _ in self.entries():
+                try:
+                    remove(self.__file(key))
+                except OSError:
+                    pass
+
+        return
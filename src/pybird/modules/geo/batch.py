@@ -0,0 +1,240 @@
+from dataclasses import fields, replace
+from typing import Any, List
+from numpy import array, asarray, broadcast_to, ndarray
+
+from pybird.models.geo_model import GeoModel
+from pybird.modules.geo.utils import points, sections
+from pybird.modules.geo.utils.system import BaseSystem, WingSystem
+
+def stack(models: List[GeoModel]) -> GeoModel:
+    """Returns a GeoModel whose numeric fields are arrays with one value per model. All models must use the same foils and tail shape"""
+
+    assert len(models) > 0
+
+    def merge(items: List[Any]) -> Any:
+        out = {}
+        for field in fields(items[0]):
+            values = [getattr(item, field.name) for item in items]
+            if isinstance(values[0], (int, float)) and not isinstance(values[0], bool):
+                out[field.name] = array(values, dtype=float)
+            else:
+                assert all(value == values[0] for value in values), '{} must be the same for all models'.format(field.name)
+                out[field.name] = values[0]
+        return replace(items[0], **out)
+
+    return GeoModel(
+        wing=merge([model.wing for model in models]),
+        body=merge([model.body for model in models]),
+        head=merge([model.head for model in models]),
+        tail=merge([model.tail for model in models]),
+    )
+
+class GeometryBatch:
+    """Builds the wings, the body and the head of N designs at once, with the same point functions as Geometry.
+    The numeric fields of the models can be arrays of shape (N,) (see stack) and every output has a leading design
+    axis. The surface curves between sections and the tail are only built by Geometry"""
+
+    def __init__(self, data: GeoModel) -> None:
+        self.__data = data
+        self.__base_system = BaseSystem()
+        self.n = 1
+        for model in (data.wing, data.body, data.head, data.tail):
+            for field in fields(model):
+                value = getattr(model, field.name)
+                if isinstance(value, ndarray) and value.ndim > 0:
+                    assert self.n == 1 or value.shape[0] == self.n, 'all the parameter arrays must have the same size'
+                    self.n = value.shape[0]
+        return
+
+    def __columns(self, model: Any) -> Any:
+        """Returns a copy of the model with each numeric field as a (N, 1) array"""
+        out = {}
+        for field in fields(model):
+            value = getattr(model, field.name)
+            if isinstance(value, ndarray) or (isinstance(value, (int, float)) and not isinstance(value, bool)):
+                out[field.name] = broadcast_to(asarray(value, dtype=float).reshape(-1, 1), (self.n, 1))
+        return replace(model, **out)
+
+    def __symmetrical(self, a: ndarray) -> ndarray:
+        return a * array([1., -1., 1.])
+
+    def build(self) -> None:
+        wing, body, head = self.__columns(self.__data.wing), self.__columns(self.__data.body), self.__columns(self.__data.head)
+        self.__build_wing(wing, True)
+        self.__build_wing(wing, False)
+        self.__build_body(wing, body)
+        self.__build_head(head)
+        return
+
+    def __build_wing(self, wing: Any, isLeft: bool) -> None:
+
+        side = 'e' if isLeft else 'd'
+        theta = lambda i: getattr(wing, 'theta{}_{}'.format(i, side))
+
+        # Wing systems
+        system = WingSystem(
+            thetaRootY=wing.thetaRootY,
+            theta1=theta(1),
+            theta2=theta(2),
+            theta3=theta(3),
+            theta4=theta(4),
+            theta5=theta(5),
+            theta6=theta(6),
+            theta7=theta(7),
+            x0=self.__base_system.x0,
+            y0=self.__base_system.y0,
+            z0=self.__base_system.z0,
+        )
+
+        # Countor points. As in Geometry, p1 and p13 always use the left wing angles
+        p0 = points.p0(wing, system)
+        l1 = points.l1(wing, system, p0)
+        l2 = points.l2(wing, system, l1)
+        l3 = points.l3(wing, system, l2)
+        p1 = points.p1(wing, system, p0, True)
+        p3Line = points.p3Line(wing, system, l2)
+        aux1 = points.aux1(wing, system, l1, p1, p3Line)
+        p2 = points.p2(p1, aux1, p3Line)
+        p3 = points.p3(wing, system, l2)
+        p4 = points.p4(wing, system, l2)
+        p5 = points.p5(wing, system, l3)
+        p7 = points.p7(wing, system, p5)
+        tp6 = 0.8
+        aux2 = points.aux2(wing, system, p5, p7)
+        p6 = points.p6(p5, aux2, p7, tp6)
+        p10_11_aux = points.p10_11_aux(wing, system, p4, p3)
+        aux3 = points.aux3(wing, system, p7, p10_11_aux)
+        p10 = points.p10(wing, p10_11_aux, p7, aux3)
+        tp8 = 0.08
+        p8 = points.p8(p7, aux3, p10_11_aux, tp8)
+        tp9 = 0.5 if isLeft else 0.6
+        p9 = points.p9(p7, aux3, p10_11_aux, tp9)
+        p13 = points.p13(wing, system, p0, True)
+        aux4 = points.aux4(wing, system, p10_11_aux, p13)
+        p11 = points.p11(wing, p10_11_aux, p13, aux4)
+        p12 = points.p12(p10_11_aux, aux4, p13)
+
+        # Control points
+        c1 = points.c1(p1, aux1, p3Line)
+        c2 = points.c2(wing, p1, p2, p3)
+        c3 = points.c3(wing, system, p2, p3, p4)
+        c4 = points.c4(wing, system, p3, p4)
+        c5 = points.c5(wing, system, p3, p4)
+        c6, c7 = points.c6_c7(p5, aux2, p7, tp6)
+        c8, c9 = points.c8_c9(p5, aux2, p7, tp6)
+        c10, c11 = points.c10_c11(p7, aux3, p10, tp8)
+        c12, c13 = points.c12_c13(p7, aux3, p10, tp8, tp9)
+        c14, c15 = points.c14_c15(p7, aux3, p10, tp9)
+        c16 = points.c16(wing, p10, p11, c15)
+        c18, c19 = points.c18_c19(p11, aux4, p13, 0.5)
+        c17 = points.c17(wing, p10, p11, c18)
+        c20, c21 = points.c20_c21(p11, aux4, p13, 0.5)
+
+        # Sections, one call per section for all the designs. The right wing uses the opposite x axis in some of them
+        s = 1 if isLeft else -1
+        foils = wing.foils
+        p14, p15, curve13, curve14, curve15, curve16 = sections.process_sections(foils[0], p1, p13, s * system.x1, system.z1, n=100)
+        data1 = sections.process_sections(foils[0], p2, p12, s * system.x1, system.z1, n=100)
+        data2 = sections.process_sections(foils[1], p2, p12, s * system.x1, system.z1, n=100)
+        p16, p17, curve19, curve20, curve21, curve22 = [0.5 * (a + b) for a, b in zip(data1, data2)]
+        p18, p19, curve25, curve26, curve27, curve28 = sections.process_sections(foils[1], p3, p11, system.x2Tip, system.z2Tip, n=100)
+        p20, p21, curve31, curve32, curve33, curve34 = sections.process_sections(foils[1], p4, p10, system.x3, system.z3, n=100)
+        data1 = sections.process_sections(foils[1], p5, p9, s * system.x3, system.z3, n=100)
+        data2 = sections.process_sections(foils[2], p5, p9, s * system.x3, system.z3, n=100)
+        p22, p23, curve37, curve38, curve39, curve40 = [tp9 * a + (1 - tp9) * b for a, b in zip(data1, data2)]
+        p24, p25, curve43, curve44, curve45, curve46 = sections.process_sections(foils[1], p6, p8, s * system.x3, system.z3, n=100)
+
+        # Save
+        out = {
+            'p0': p0, 'p1': p1, 'aux1': aux1, 'p2': p2, 'p3': p3, 'p4': p4, 'p5': p5, 'p6': p6, 'p7': p7, 'p8': p8, 'p9': p9, 'p10': p10, 'p11': p11, 'p12': p12, 'p13': p13,
+            'aux2': aux2, 'aux3': aux3, 'aux4': aux4,
+            'c1': c1, 'c2': c2, 'c3': c3, 'c4': c4, 'c5': c5, 'c6': c6, 'c7': c7, 'c8': c8, 'c9': c9, 'c10': c10, 'c11': c11,
+            'c12': c12, 'c13': c13, 'c14': c14, 'c15': c15, 'c16': c16, 'c17': c17, 'c18': c18, 'c19': c19, 'c20': c20, 'c21': c21,
+            'p14': p14, 'p15': p15, 'p16': p16, 'p17': p17, 'p18': p18, 'p19': p19, 'p20': p20, 'p21': p21, 'p22': p22, 'p23': p23, 'p24': p24, 'p25': p25,
+            'curve13': curve13, 'curve14': curve14, 'curve15': curve15, 'curve16': curve16,
+            'curve19': curve19, 'curve20': curve20, 'curve21': curve21, 'curve22': curve22,
+            'curve25': curve25, 'curve26': curve26, 'curve27': curve27, 'curve28': curve28,
+            'curve31': curve31, 'curve32': curve32, 'curve33': curve33, 'curve34': curve34,
+            'curve37': curve37, 'curve38': curve38, 'curve39': curve39, 'curve40': curve40,
+            'curve43': curve43, 'curve44': curve44, 'curve45': curve45, 'curve46': curve46,
+        }
+
+        for name, value in out.items():
+            setattr(self, name + side, value if isLeft else self.__symmetrical(value))
+
+        return
+
+    def __build_body(self, wing: Any, body: Any) -> None:
+
+        system = self.__base_system
+
+        self.p26e = points.p26(wing, body, system)
+        self.p27e = points.p27(wing, body, system)
+        self.p26d = self.__symmetrical(self.p26e)
+        self.p27d = self.__symmetrical(self.p27e)
+        self.p28 = points.p28(wing, body, system)
+        self.p29 = points.p29(wing, body, system)
+        self.p31 = points.p31(wing, body, system)
+        aux5 = points.aux5(body, system, self.p29, self.p31)
+        aux6 = points.aux6(body, system, self.p29, self.p31)
+        self.p30, t30 = points.p30(self.p29, aux5, aux6, self.p31, self.p14e)
+        self.p32 = points.p32(wing, body, system)
+        self.p33 = points.p33(wing, body, system)
+        self.p34 = points.p34(wing, body, system)
+        self.p36 = points.p36(wing, body, system)
+        aux7 = points.aux7(body, system, self.p34, self.p36)
+        aux8 = points.aux8(body, system, self.p34, self.p36)
+        self.p35, t35 = points.p35(self.p34, aux7, aux8, self.p36, self.p14e)
+        self.p37 = points.p37(wing, body, system)
+
+        self.c22e = points.c22(body, system, self.p26e, self.p1e)
+        self.c23e = points.c23(body, system, self.p26e, self.p1e)
+        self.c24e = points.c24(body, system, self.p13e, self.p27e)
+        self.c25e = points.c25(body, system, self.p13e, self.p27e)
+        self.c26 = points.c26(body, system, self.p28, self.p29)
+        self.c27 = points.c27(body, system, self.p28, self.p29)
+        self.c28, self.c29 = points.c28_29(self.p29, aux5, aux6, self.p31, t30)
+        self.c30, self.c31 = points.c30_31(self.p29, aux5, aux6, self.p31, t30)
+        self.c32 = points.c32(body, system, self.p31, self.p32)
+        self.c33 = points.c33(body, system, self.p31, self.p32)
+        self.c34 = points.c34(body, system, self.p33, self.p34)
+        self.c35 = points.c35(body, system, self.p33, self.p34)
+        self.c36, self.c37 = points.c36_37(self.p34, aux7, aux8, self.p36, t35)
+        self.c38, self.c39 = points.c38_39(self.p34, aux7, aux8, self.p36, t35)
+        self.c40 = points.c40(body, system, self.p36, self.p37)
+        self.c41 = points.c41(body, system, self.p37, self.p37)
+        self.c42e = points.c42(body, system, self.p1e, self.p29)
+        self.c43e = points.c43(body, system, self.p1e, self.p29)
+        self.c44e = points.c44(body, system, self.p1e, self.p34)
+        self.c45e = points.c45(body, system, self.p1e, self.p34)
+        self.c46e, self.c47e, self.c48e, self.c49e = points.c46_47_48_49(body, system, self.p30, self.p14e, self.p15e, self.p35, t30)
+        self.c50e = points.c50(body, system, self.p13e, self.p31)
+        self.c51e = points.c51(body, system, self.p13e, self.p31)
+        self.c52e = points.c52(body, system, self.p13e, self.p36)
+        self.c53e = points.c53(body, system, self.p13e, self.p36)
+
+        for name in ['c22', 'c23', 'c24', 'c25', 'c42', 'c43', 'c44', 'c45', 'c46', 'c47', 'c48', 'c49', 'c50', 'c51', 'c52', 'c53']:
+            setattr(self, name + 'd', self.__symmetrical(getattr(self, name + 'e')))
+
+        return
+
+    def __build_head(self, head: Any) -> None:
+
+        system = self.__base_system
+        center = 0.5 * (self.p26e + self.p26d)
+
+        self.p38 = points.p38(head, system, center)
+        self.p39 = points.p39(head, system, center)
+        self.p41e = points.p41e(head, system, center)
+        self.p41d = points.p41d(head, system, center)
+        self.p42 = points.p42(head, system, center)
+        self.c54 = points.c54(head, system, self.p28)
+        self.c55 = points.c55(head, system, self.p33)
+        self.c56e = points.c56e(head, system, self.p26e)
+        self.c56d = points.c56d(head, system, self.p26d)
+        self.c57 = points.c57(head, system, self.p38)
+        self.c58 = points.c58(head, system, self.p39)
+        self.c59e = points.c59e(head, system, self.p41e)
+        self.c59d = points.c59d(head, system, self.p41d)
+
+        return
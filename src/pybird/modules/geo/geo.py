@@ -1,522 +1,491 @@
 from abc import ABC
-from numpy import array, linspace, zeros_like, ndarray
+from concurrent.futures import Executor, Future
+from dataclasses import fields
+from os import stat
+from typing import Any, Callable, List
+from numpy import array, array_equal, linspace, ndarray
 
 from pybird.models.geo_model import GeoModel
 from pybird.models.enums import TailShape
+from pybird.models.wing_model import WingModel
+from pybird.models.body_model import BodyModel
+from pybird.models.head_model import HeadModel
+from pybird.models.tail_model import TailModel
 from pybird.modules.geo.utils.system import BaseSystem, TailSystem, WingSystem
 from pybird.modules.geo.utils import points, sections, surface, bezier
+from pybird.modules.cache.cache import Cache, geometry_key
+
+# Points of the previous parts read by each part. A part is built again when one of them changes
+_INPUTS = {
+    'body': ['p1e', 'p13e', 'p14e', 'p15e'],
+    'head': ['p26e', 'p26d', 'p28', 'p33'],
+    'tail': ['p27e', 'p27d', 'p32', 'p37'],
+}
+
+# Countor and control points of each wing, without the side suffix
+_WING_POINTS = ['p0', 'p1', 'aux1', 'p2', 'p3', 'p4', 'p5', 'p7', 'aux2', 'p6', 'aux3', 'p10', 'p8', 'p9', 'p13', 'aux4', 'p11', 'p12'] + ['c{}'.format(i) for i in range(1, 22)]
 
 class GEOMETRY_ABS(ABC):
-    
-    def __init__(self, data: GeoModel) -> None:
-        """Stores the geometry model"""
+
+    def __init__(self, data: GeoModel, cache: Cache = None) -> None:
+        """Stores the geometry model and the cache used to store built geometries"""
         pass
 
-    def build(self) -> None:
-        """Build the geometry"""
+    def build(self, executor: Executor = None) -> None:
+        """Build the geometry, running the independent tasks in the executor (a thread or process pool) if one is
+        given. Only the parts whose parameters changed are built again"""
         pass
 
 class Geometry(GEOMETRY_ABS):
-    
-    def __init__(self, data: GeoModel) -> None:
+
+    def __init__(self, data: GeoModel, cache: Cache = None) -> None:
         self.__data = data
         self.__base_system = BaseSystem()
+        self.__cache = cache
+        self.__snapshot = None
+        self.__left_wing = None
         return
-    
-    def build(self) -> None:
-        self.__build_wing()
-        self.__build_body()
-        self.__build_head()
-        self.__build_tail()
-        return
-    
-    def __symmetrical_point(self, a: ndarray) -> ndarray:
-        return array([a[0], -a[1], a[2]])
-    
-    def __symmetrical_curve(self, a: ndarray) -> ndarray:
-        out = zeros_like(a)
-        for i in range(len(a[:, 0])):
-            out[i, :] = self.__symmetrical_point(a[i, :])
-        return out
-    
-    def __build_wing(self) -> None:
-        
-        # Left wing
-
-        # Wing systems
-        leftSystem = WingSystem(
-            thetaRootY=self.__data.wing.thetaRootY,
-            theta1=self.__data.wing.theta1_e,
-            theta2=self.__data.wing.theta2_e,
-            theta3=self.__data.wing.theta3_e,
-            theta4=self.__data.wing.theta4_e,
-            theta5=self.__data.wing.theta5_e,
-            theta6=self.__data.wing.theta6_e,
-            theta7=self.__data.wing.theta7_e,
-            x0=self.__base_system.x0,
-            y0=self.__base_system.y0,
-            z0=self.__base_system.z0,
-        )
-
-        # Countor points
-        self.p0e = points.p0(self.__data.wing, leftSystem)
-        l1 = points.l1(self.__data.wing, leftSystem, self.p0e)
-        l2 = points.l2(self.__data.wing, leftSystem, l1)
-        l3 = points.l3(self.__data.wing, leftSystem, l2)
-        self.p1e = points.p1(self.__data.wing, leftSystem, self.p0e, True)
-        p3eLine = points.p3Line(self.__data.wing, leftSystem, l2)
-        self.aux1e = points.aux1(self.__data.wing, leftSystem, l1, self.p1e, p3eLine)
-        self.p2e = points.p2(self.p1e, self.aux1e, p3eLine)
-        self.p3e = points.p3(self.__data.wing, leftSystem, l2)
-        self.p4e = points.p4(self.__data.wing, leftSystem, l2)
-        self.p5e = points.p5(self.__data.wing, leftSystem, l3)
-        self.p7e = points.p7(self.__data.wing, leftSystem, self.p5e)
-        tp6e = 0.8
-        self.aux2e = points.aux2(self.__data.wing, leftSystem, self.p5e, self.p7e)
-        self.p6e = points.p6(self.p5e, self.aux2e, self.p7e, tp6e)
-        p10_11_aux = points.p10_11_aux(self.__data.wing, leftSystem, self.p4e, self.p3e)
-        self.aux3e = points.aux3(self.__data.wing, leftSystem, self.p7e, p10_11_aux)
-        self.p10e = points.p10(self.__data.wing, p10_11_aux, self.p7e, self.aux3e)
-        tp8e = 0.08
-        self.p8e = points.p8(self.p7e, self.aux3e, p10_11_aux, tp8e)
-        tp9e = 0.5
-        self.p9e = points.p9(self.p7e, self.aux3e, p10_11_aux, tp9e)
-        self.p13e = points.p13(self.__data.wing, leftSystem, self.p0e, True)
-        self.aux4e = points.aux4(self.__data.wing, leftSystem, p10_11_aux, self.p13e)
-        self.p11e = points.p11(self.__data.wing, p10_11_aux, self.p13e, self.aux4e)
-        self.p12e = points.p12(p10_11_aux, self.aux4e, self.p13e)
-
-        # Control points
-        self.c1e = points.c1(self.p1e, self.aux1e, p3eLine)
-        self.c2e = points.c2(self.__data.wing, self.p1e, self.p2e, self.p3e)
-        self.c3e = points.c3(self.__data.wing, leftSystem, self.p2e, self.p3e, self.p4e)
-        self.c4e = points.c4(self.__data.wing, leftSystem, self.p3e, self.p4e)
-        self.c5e = points.c5(self.__data.wing, leftSystem, self.p3e, self.p4e)
-        self.c6e, self.c7e = points.c6_c7(self.p5e, self.aux2e, self.p7e, tp6e)
-        self.c8e, self.c9e = points.c8_c9(self.p5e, self.aux2e, self.p7e, tp6e)
-        self.c10e, self.c11e = points.c10_c11(self.p7e, self.aux3e, self.p10e, tp8e)
-        self.c12e, self.c13e = points.c12_c13(self.p7e, self.aux3e, self.p10e, tp8e, tp9e)
-        self.c14e, self.c15e = points.c14_c15(self.p7e, self.aux3e, self.p10e, tp9e)
-        self.c16e = points.c16(self.__data.wing, self.p10e, self.p11e, self.c15e)
-        self.c18e, self.c19e = points.c18_c19(self.p11e, self.aux4e, self.p13e, 0.5)
-        self.c17e = points.c17(self.__data.wing, self.p10e, self.p11e, self.c18e)
-        self.c20e, self.c21e = points.c20_c21(self.p11e, self.aux4e, self.p13e, 0.5)
-
-        # Sections
-        self.p14e, self.p15e, self.curve13e, self.curve14e, self.curve15e, self.curve16e = sections.process_section(self.__data.wing.foils[0], self.p1e, self.p13e, leftSystem.x1, leftSystem.z1, n=100)
-        p16e1, p17e1, curve19e1, curve20e1, curve21e1, curve22e1 = sections.process_section(self.__data.wing.foils[0], self.p2e, self.p12e, leftSystem.x1, leftSystem.z1, n=100)
-        
-        p16e2, p17e2, curve19e2, curve20e2, curve21e2, curve22e2 = sections.process_section(self.__data.wing.foils[1], self.p2e, self.p12e, leftSystem.x1, leftSystem.z1, n=100)
-        self.p16e, self.p17e = 0.5 * (p16e1 + p16e2), 0.5 * (p17e1 + p17e2)
-        self.curve19e, self.curve20e = 0.5 * (curve19e1 + curve19e2), 0.5 * (curve20e1 + curve20e2)
-        self.curve21e, self.curve22e = 0.5 * (curve21e1 + curve21e2), 0.5 * (curve22e1 + curve22e2)
-
-        self.p18e, self.p19e, self.curve25e, self.curve26e, self.curve27e, self.curve28e = sections.process_section(self.__data.wing.foils[1], self.p3e, self.p11e, leftSystem.x2Tip, leftSystem.z2Tip, n=100)
-        self.p20e, self.p21e, self.curve31e, self.curve32e, self.curve33e, self.curve34e = sections.process_section(self.__data.wing.foils[1], self.p4e, self.p10e, leftSystem.x3, leftSystem.z3, n=100)
-        
-        dataAux1 = sections.process_section(self.__data.wing.foils[1], self.p5e, self.p9e, leftSystem.x3, leftSystem.z3, n=100)
-        dataAux2 = sections.process_section(self.__data.wing.foils[2], self.p5e, self.p9e, leftSystem.x3, leftSystem.z3, n=100)
-        self.p22e, self.p23e, self.curve37e, self.curve38e, self.curve39e, self.curve40e = tp9e * dataAux1[0] + (1 - tp9e) * dataAux2[0], tp9e * dataAux1[1] + (1 - tp9e) * dataAux2[1], tp9e * dataAux1[2] + (1 - tp9e) * dataAux2[2], tp9e * dataAux1[3] + (1 - tp9e) * dataAux2[3], tp9e * dataAux1[4] + (1 - tp9e) * dataAux2[4], tp9e * dataAux1[5] + (1 - tp9e) * dataAux2[5]
-        
-        self.p24e, self.p25e, self.curve43e, self.curve44e, self.curve45e, self.curve46e = sections.process_section(self.__data.wing.foils[1], self.p6e, self.p8e, leftSystem.x3, leftSystem.z3, n=100)
-
-        # Curves between sections
-        self.curve17e = surface.interpolate_curve(
-            self.p14e,
-            self.p16e,
-            bezier.quadratic([self.p1e, self.c1e, self.p2e], linspace(0, 1, num=50)),
-            bezier.cubic([self.p13e, self.c21e, self.c20e, self.p12e], linspace(0, 1, num=50)),
-        )
-        self.curve18e = surface.interpolate_curve(
-            self.p15e,
-            self.p17e,
-            bezier.quadratic([self.p1e, self.c1e, self.p2e], linspace(0, 1, num=50)),
-            bezier.cubic([self.p13e, self.c21e, self.c20e, self.p12e], linspace(0, 1, num=50)),
-        )
-
-        self.curve23e = surface.interpolate_curve(
-            self.p16e,
-            self.p18e,
-            bezier.cubic([self.p2e, self.c2e, self.c3e, self.p3e], linspace(0, 1, num=50)),
-            bezier.cubic([self.p12e, self.c19e, self.c18e, self.p11e], linspace(0, 1, num=50)),
-        )
-        self.curve24e = surface.interpolate_curve(
-            self.p17e,
-            self.p19e,
-            bezier.cubic([self.p2e, self.c2e, self.c3e, self.p3e], linspace(0, 1, num=50)),
-            bezier.cubic([self.p12e, self.c19e, self.c18e, self.p11e], linspace(0, 1, num=50)),
-        )
-
-        self.curve29e = surface.interpolate_curve(
-            self.p18e,
-            self.p20e,
-            bezier.cubic([self.p3e, self.c4e, self.c5e, self.p4e], linspace(0, 1, num=50)),
-            bezier.cubic([self.p11e, self.c17e, self.c16e, self.p10e], linspace(0, 1, num=50)),
-        )
-        self.curve30e = surface.interpolate_curve(
-            self.p19e,
-            self.p21e,
-            bezier.cubic([self.p3e, self.c4e, self.c5e, self.p4e], linspace(0, 1, num=50)),
-            bezier.cubic([self.p11e, self.c17e, self.c16e, self.p10e], linspace(0, 1, num=50)),
-        )
-
-        self.curve35e = surface.interpolate_curve(
-            self.p20e,
-            self.p22e,
-            bezier.quadratic([self.p4e, 0.5 * (self.p4e + self.p5e), self.p5e], linspace(0, 1, num=50)),
-            bezier.cubic([self.p10e, self.c15e, self.c14e, self.p9e], linspace(0, 1, num=50)),
-        )
-        self.curve36e = surface.interpolate_curve(
-            self.p21e,
-            self.p23e,
-            bezier.quadratic([self.p4e, 0.5 * (self.p4e + self.p5e), self.p5e], linspace(0, 1, num=50)),
-            bezier.cubic([self.p10e, self.c15e, self.c14e, self.p9e], linspace(0, 1, num=50)),
-        )
-
-        self.curve41e = surface.interpolate_curve(
-            self.p22e,
-            self.p24e,
-            bezier.cubic([self.p5e, self.c6e, self.c7e, self.p6e], linspace(0, 1, num=50)),
-            bezier.cubic([self.p9e, self.c13e, self.c12e, self.p8e], linspace(0, 1, num=50)),
-        )
-        self.curve42e = surface.interpolate_curve(
-            self.p23e,
-            self.p25e,
-            bezier.cubic([self.p5e, self.c6e, self.c7e, self.p6e], linspace(0, 1, num=50)),
-            bezier.cubic([self.p9e, self.c13e, self.c12e, self.p8e], linspace(0, 1, num=50)),
-        )
-        self.curve47e = surface.interpolate_tip_curve(self.p24e, self.p7e)
-        self.curve48e = surface.interpolate_tip_curve(self.p25e, self.p7e)
-
-        # Right wing
-        
-        # Wing systems
-        rightSystem = WingSystem(
-            thetaRootY=self.__data.wing.thetaRootY,
-            theta1=self.__data.wing.theta1_d,
-            theta2=self.__data.wing.theta2_d,
-            theta3=self.__data.wing.theta3_d,
-            theta4=self.__data.wing.theta4_d,
-            theta5=self.__data.wing.theta5_d,
-            theta6=self.__data.wing.theta6_d,
-            theta7=self.__data.wing.theta7_d,
-            x0=self.__base_system.x0,
-            y0=self.__base_system.y0,
-            z0=self.__base_system.z0,
-        )
-
-        # Countor points
-        p0d = points.p0(self.__data.wing, rightSystem)
-        l1 = points.l1(self.__data.wing, rightSystem, p0d)
-        l2 = points.l2(self.__data.wing, rightSystem, l1)
-        l3 = points.l3(self.__data.wing, rightSystem, l2)
-        p1d = points.p1(self.__data.wing, rightSystem, p0d, True)
-        p3dLine = points.p3Line(self.__data.wing, rightSystem, l2)
-        aux1d = points.aux1(self.__data.wing, rightSystem, l1, p1d, p3dLine)
-        p2d = points.p2(p1d, aux1d, p3dLine)
-        p3d = points.p3(self.__data.wing, rightSystem, l2)
-        p4d = points.p4(self.__data.wing, rightSystem, l2)
-        p5d = points.p5(self.__data.wing, rightSystem, l3)
-        p7d = points.p7(self.__data.wing, rightSystem, p5d)
-        tp6d = 0.8
-        aux2d = points.aux2(self.__data.wing, rightSystem, p5d, p7d)
-        p6d = points.p6(p5d, aux2d, p7d, tp6d)
-        p10_11_aux = points.p10_11_aux(self.__data.wing, rightSystem, p4d, p3d)
-        aux3d = points.aux3(self.__data.wing, rightSystem, p7d, p10_11_aux)
-        p10d = points.p10(self.__data.wing, p10_11_aux, p7d, aux3d)
-        tp8d = 0.08
-        p8d = points.p8(p7d, aux3d, p10_11_aux, tp8d)
-        tp9d = 0.6
-        p9d = points.p9(p7d, aux3d, p10_11_aux, tp9d)
-        p13d = points.p13(self.__data.wing, rightSystem, p0d, True)
-        aux4d = points.aux4(self.__data.wing, rightSystem, p10_11_aux, p13d)
-        p11d = points.p11(self.__data.wing, p10_11_aux, p13d, aux4d)
-        p12d = points.p12(p10_11_aux, aux4d, p13d)
-
-        # Control points
-        c1d = points.c1(p1d, aux1d, p3dLine)
-        c2d = points.c2(self.__data.wing, p1d, p2d, p3d)
-        c3d = points.c3(self.__data.wing, rightSystem, p2d, p3d, p4d)
-        c4d = points.c4(self.__data.wing, rightSystem, p3d, p4d)
-        c5d = points.c5(self.__data.wing, rightSystem, p3d, p4d)
-        c6d, c7d = points.c6_c7(p5d, aux2d, p7d, tp6d)
-        c8d, c9d = points.c8_c9(p5d, aux2d, p7d, tp6d)
-        c10d, c11d = points.c10_c11(p7d, aux3d, p10d, tp8d)
-        c12d, c13d = points.c12_c13(p7d, aux3d, p10d, tp8d, tp9d)
-        c14d, c15d = points.c14_c15(p7d, aux3d, p10d, tp9d)
-        c16d = points.c16(self.__data.wing, p10d, p11d, c15d)
-        c18d, c19d = points.c18_c19(p11d, aux4d, p13d, 0.5)
-        c17d = points.c17(self.__data.wing, p10d, p11d, c18d)
-        c20d, c21d = points.c20_c21(p11d, aux4d, p13d, 0.5)
-
-        # Sections
-        p14d, p15d, curve13d, curve14d, curve15d, curve16d = sections.process_section(self.__data.wing.foils[0], p1d, p13d, -rightSystem.x1, rightSystem.z1, n=100)
-
-        p16d1, p17d1, curve19d1, curve20d1, curve21d1, curve22d1 = sections.process_section(self.__data.wing.foils[0], p2d, p12d, -rightSystem.x1, rightSystem.z1, n=100)
-        p16d2, p17d2, curve19d2, curve20d2, curve21d2, curve22d2 = sections.process_section(self.__data.wing.foils[1], p2d, p12d, -rightSystem.x1, rightSystem.z1, n=100)
-        p16d, p17d = 0.5 * (p16d1 + p16d2), 0.5 * (p17d1 + p17d2)
-        curve19d, curve20d = 0.5 * (curve19d1 + curve19d2), 0.5 * (curve20d1 + curve20d2)
-        curve21d, curve22d = 0.5 * (curve21d1 + curve21d2), 0.5 * (curve22d1 + curve22d2)
-
-        p18d, p19d, curve25d, curve26d, curve27d, curve28d = sections.process_section(self.__data.wing.foils[1], p3d, p11d, rightSystem.x2Tip, rightSystem.z2Tip, n=100)
-        p20d, p21d, curve31d, curve32d, curve33d, curve34d = sections.process_section(self.__data.wing.foils[1], p4d, p10d, rightSystem.x3, rightSystem.z3, n=100)
-        
-        dataAux1 = sections.process_section(self.__data.wing.foils[1], p5d, p9d, -rightSystem.x3, rightSystem.z3, n=100)
-        dataAux2 = sections.process_section(self.__data.wing.foils[2], p5d, p9d, -rightSystem.x3, rightSystem.z3, n=100)
-        p22d, p23d, curve37d, curve38d, curve39d, curve40d = tp9d * dataAux1[0] + (1 - tp9d) * dataAux2[0], tp9d * dataAux1[1] + (1 - tp9d) * dataAux2[1], tp9d * dataAux1[2] + (1 - tp9d) * dataAux2[2], tp9d * dataAux1[3] + (1 - tp9d) * dataAux2[3], tp9d * dataAux1[4] + (1 - tp9d) * dataAux2[4], tp9d * dataAux1[5] + (1 - tp9d) * dataAux2[5]
-        
-        p24d, p25d, curve43d, curve44d, curve45d, curve46d = sections.process_section(self.__data.wing.foils[1], p6d, p8d, -rightSystem.x3, rightSystem.z3, n=100)
-
-        # Curves between sections
-        curve17d = surface.interpolate_curve(
-            p14d,
-            p16d,
-            bezier.quadratic([p1d, c1d, p2d], linspace(0, 1, num=50)),
-            bezier.cubic([p13d, c21d, c20d, p12d], linspace(0, 1, num=50)),
-        )
-        curve18d = surface.interpolate_curve(
-            p15d,
-            p17d,
-            bezier.quadratic([p1d, c1d, p2d], linspace(0, 1, num=50)),
-            bezier.cubic([p13d, c21d, c20d, p12d], linspace(0, 1, num=50)),
-        )
-
-        curve23d = surface.interpolate_curve(
-            p16d,
-            p18d,
-            bezier.cubic([p2d, c2d, c3d, p3d], linspace(0, 1, num=50)),
-            bezier.cubic([p12d, c19d, c18d, p11d], linspace(0, 1, num=50)),
-        )
-        curve24d = surface.interpolate_curve(
-            p17d,
-            p19d,
-            bezier.cubic([p2d, c2d, c3d, p3d], linspace(0, 1, num=50)),
-            bezier.cubic([p12d, c19d, c18d, p11d], linspace(0, 1, num=50)),
-        )
-
-        curve29d = surface.interpolate_curve(
-            p18d,
-            p20d,
-            bezier.cubic([p3d, c4d, c5d, p4d], linspace(0, 1, num=50)),
-            bezier.cubic([p11d, c17d, c16d, p10d], linspace(0, 1, num=50)),
-        )
-        curve30d = surface.interpolate_curve(
-            p19d,
-            p21d,
-            bezier.cubic([p3d, c4d, c5d, p4d], linspace(0, 1, num=50)),
-            bezier.cubic([p11d, c17d, c16d, p10d], linspace(0, 1, num=50)),
-        )
-
-        curve35d = surface.interpolate_curve(
-            p20d,
-            p22d,
-            bezier.quadratic([p4d, 0.5 * (p4d + p5d), p5d], linspace(0, 1, num=50)),
-            bezier.cubic([p10d, c15d, c14d, p9d], linspace(0, 1, num=50)),
-        )
-        curve36d = surface.interpolate_curve(
-            p21d,
-            p23d,
-            bezier.quadratic([p4d, 0.5 * (p4d + p5d), p5d], linspace(0, 1, num=50)),
-            bezier.cubic([p10d, c15d, c14d, p9d], linspace(0, 1, num=50)),
-        )
-
-        curve41d = surface.interpolate_curve(
-            p22d,
-            p24d,
-            bezier.cubic([p5d, c6d, c7d, p6d], linspace(0, 1, num=50)),
-            bezier.cubic([p9d, c13d, c12d, p8d], linspace(0, 1, num=50)),
-        )
-        curve42d = surface.interpolate_curve(
-            p23d,
-            p25d,
-            bezier.cubic([p5d, c6d, c7d, p6d], linspace(0, 1, num=50)),
-            bezier.cubic([p9d, c13d, c12d, p8d], linspace(0, 1, num=50)),
-        )
-        curve47d = surface.interpolate_tip_curve(p24d, p7d)
-        curve48d = surface.interpolate_tip_curve(p25d, p7d)
-
-        # Symetrical points and curves
-        self.p0d = self.__symmetrical_point(p0d)
-        self.p1d = self.__symmetrical_point(p1d)
-        self.aux1d = self.__symmetrical_point(aux1d)
-        self.p2d = self.__symmetrical_point(p2d)
-        self.p3d = self.__symmetrical_point(p3d)
-        self.p4d = self.__symmetrical_point(p4d)
-        self.p5d = self.__symmetrical_point(p5d)
-        self.p7d = self.__symmetrical_point(p7d)
-        self.aux2d = self.__symmetrical_point(aux2d)
-        self.p6d = self.__symmetrical_point(p6d)
-        self.aux3d = self.__symmetrical_point(aux3d)
-        self.p10d = self.__symmetrical_point(p10d)
-        self.p8d = self.__symmetrical_point(p8d)
-        self.p9d = self.__symmetrical_point(p9d)
-        self.p13d = self.__symmetrical_point(p13d)
-        self.aux4d = self.__symmetrical_point(aux4d)
-        self.p11d = self.__symmetrical_point(p11d)
-        self.p12d = self.__symmetrical_point(p12d)
-
-        self.c1d = self.__symmetrical_point(c1d)
-        self.c2d = self.__symmetrical_point(c2d)
-        self.c3d = self.__symmetrical_point(c3d)
-        self.c4d = self.__symmetrical_point(c4d)
-        self.c5d = self.__symmetrical_point(c5d)
-        self.c6d, self.c7d = self.__symmetrical_point(c6d), self.__symmetrical_point(c7d)
-        self.c8d, self.c9d = self.__symmetrical_point(c8d), self.__symmetrical_point(c9d)
-        self.c10d, self.c11d = self.__symmetrical_point(c10d), self.__symmetrical_point(c11d)
-        self.c12d, self.c13d = self.__symmetrical_point(c12d), self.__symmetrical_point(c13d)
-        self.c14d, self.c15d = self.__symmetrical_point(c14d), self.__symmetrical_point(c15d)
-        self.c16d = self.__symmetrical_point(c16d)
-        self.c18d, self.c19d = self.__symmetrical_point(c18d), self.__symmetrical_point(c19d)
-        self.c17d = self.__symmetrical_point(c17d)
-        self.c20d, self.c21d = self.__symmetrical_point(c20d), self.__symmetrical_point(c21d)
-
-        self.p14d, self.p15d = self.__symmetrical_point(p14d), self.__symmetrical_point(p15d)
-        self.curve13d, self.curve14d, self.curve15d, self.curve16d = self.__symmetrical_curve(curve13d), self.__symmetrical_curve(curve14d), self.__symmetrical_curve(curve15d), self.__symmetrical_curve(curve16d)
-
-        self.p16d, self.p17d = self.__symmetrical_point(p16d), self.__symmetrical_point(p17d)
-        self.curve19d, self.curve20d, self.curve21d, self.curve22d = self.__symmetrical_curve(curve19d), self.__symmetrical_curve(curve20d), self.__symmetrical_curve(curve21d), self.__symmetrical_curve(curve22d)
-
-        self.p18d, self.p19d = self.__symmetrical_point(p18d), self.__symmetrical_point(p19d)
-        self.curve25d, self.curve26d, self.curve27d, self.curve28d = self.__symmetrical_curve(curve25d), self.__symmetrical_curve(curve26d), self.__symmetrical_curve(curve27d), self.__symmetrical_curve(curve28d)
-
-        self.p20d, self.p21d = self.__symmetrical_point(p20d), self.__symmetrical_point(p21d)
-        self.curve31d, self.curve32d, self.curve33d, self.curve34d = self.__symmetrical_curve(curve31d), self.__symmetrical_curve(curve32d), self.__symmetrical_curve(curve33d), self.__symmetrical_curve(curve34d)
-
-        self.p22d, self.p23d = self.__symmetrical_point(p22d), self.__symmetrical_point(p23d)
-        self.curve37d, self.curve38d, self.curve39d, self.curve40d = self.__symmetrical_curve(curve37d), self.__symmetrical_curve(curve38d), self.__symmetrical_curve(curve39d), self.__symmetrical_curve(curve40d)
-
-        self.p24d, self.p25d = self.__symmetrical_point(p24d), self.__symmetrical_point(p25d)
-        self.curve43d, self.curve44d, self.curve45d, self.curve46d = self.__symmetrical_curve(curve43d), self.__symmetrical_curve(curve44d), self.__symmetrical_curve(curve45d), self.__symmetrical_curve(curve46d)
-
-        self.curve17d = self.__symmetrical_curve(curve17d)
-        self.curve18d = self.__symmetrical_curve(curve18d)
-        self.curve23d = self.__symmetrical_curve(curve23d)
-        self.curve24d = self.__symmetrical_curve(curve24d)
-        self.curve29d = self.__symmetrical_curve(curve29d)
-        self.curve30d = self.__symmetrical_curve(curve30d)
-        self.curve35d = self.__symmetrical_curve(curve35d)
-        self.curve36d = self.__symmetrical_curve(curve36d)
-        self.curve41d = self.__symmetrical_curve(curve41d)
-        self.curve42d = self.__symmetrical_curve(curve42d)
-        self.curve47d = self.__symmetrical_curve(curve47d)
-        self.curve48d = self.__symmetrical_curve(curve48d)
-        
+
+    def build(self, executor: Executor = None) -> None:
+        """Builds the parts whose parameters changed since the last build, or all of them in the first build. The
+        parts return their arrays, so the result does not depend on the executor"""
+
+        snapshot = self.__take_snapshot()
+        dirty = self.__dirty_parts(snapshot)
+
+        if len(dirty) == 0:
+            return
+
+        key = None
+        if self.__cache is not None:
+            key = geometry_key(self.__data)
+            arrays = self.__cache.get(key)
+            if arrays is not None:
+                for name, value in arrays.items():
+                    setattr(self, name, array(value))
+                self.__snapshot = snapshot
+                self.__left_wing = None
+                return
+
+        self.__build_parts(dirty, executor)
+        self.__snapshot = snapshot
+
+        if key is not None:
+            self.__cache.put(key, {name: value for name, value in vars(self).items() if not name.startswith('_')})
+
         return
-    
-    def __build_body(self) -> None:
-
-        self.p26e = points.p26(self.__data.wing, self.__data.body, self.__base_system)
-        self.p27e = points.p27(self.__data.wing, self.__data.body, self.__base_system)
-        self.p26d = self.__symmetrical_point(self.p26e)
-        self.p27d = self.__symmetrical_point(self.p27e)
-        self.p28 = points.p28(self.__data.wing, self.__data.body, self.__base_system)
-        self.p29 = points.p29(self.__data.wing, self.__data.body, self.__base_system)
-        self.p31 = points.p31(self.__data.wing, self.__data.body, self.__base_system)
-        aux5 = points.aux5(self.__data.body, self.__base_system, self.p29, self.p31)
-        aux6 = points.aux6(self.__data.body, self.__base_system, self.p29, self.p31)
-        self.p30, t30 = points.p30(self.p29, aux5, aux6, self.p31, self.p14e)
-        self.p32 = points.p32(self.__data.wing, self.__data.body, self.__base_system)
-        self.p33 = points.p33(self.__data.wing, self.__data.body, self.__base_system)
-        self.p34 = points.p34(self.__data.wing, self.__data.body, self.__base_system)
-        self.p36 = points.p36(self.__data.wing, self.__data.body, self.__base_system)
-        aux7 = points.aux7(self.__data.body, self.__base_system, self.p34, self.p36)
-        aux8 = points.aux8(self.__data.body, self.__base_system, self.p34, self.p36)
-        self.p35, t35 = points.p35(self.p34, aux7, aux8, self.p36, self.p14e)
-        self.p37 = points.p37(self.__data.wing, self.__data.body, self.__base_system)
-
-        self.c22e = points.c22(self.__data.body, self.__base_system, self.p26e, self.p1e)
-        self.c23e = points.c23(self.__data.body, self.__base_system, self.p26e, self.p1e)
-        self.c24e = points.c24(self.__data.body, self.__base_system, self.p13e, self.p27e)
-        self.c25e = points.c25(self.__data.body, self.__base_system, self.p13e, self.p27e)
-        self.c22d = self.__symmetrical_point(self.c22e)
-        self.c23d = self.__symmetrical_point(self.c23e)
-        self.c24d = self.__symmetrical_point(self.c24e)
-        self.c25d = self.__symmetrical_point(self.c25e)
-        self.c26 = points.c26(self.__data.body, self.__base_system, self.p28, self.p29)
-        self.c27 = points.c27(self.__data.body, self.__base_system, self.p28, self.p29)
-        self.c28, self.c29 = points.c28_29(self.p29, aux5, aux6, self.p31, t30)
-        self.c30, self.c31 = points.c30_31(self.p29, aux5, aux6, self.p31, t30)
-        self.c32 = points.c32(self.__data.body, self.__base_system, self.p31, self.p32)
-        self.c33 = points.c33(self.__data.body, self.__base_system, self.p31, self.p32)
-        self.c34 = points.c34(self.__data.body, self.__base_system, self.p33, self.p34)
-        self.c35 = points.c35(self.__data.body, self.__base_system, self.p33, self.p34)
-        self.c36, self.c37 = points.c36_37(self.p34, aux7, aux8, self.p36, t35)
-        self.c38, self.c39 = points.c38_39(self.p34, aux7, aux8, self.p36, t35)
-        self.c40 = points.c40(self.__data.body, self.__base_system, self.p36, self.p37)
-        self.c41 = points.c41(self.__data.body, self.__base_system, self.p37, self.p37)
-
-        self.c42e = points.c42(self.__data.body, self.__base_system, self.p1e, self.p29)
-        self.c43e = points.c43(self.__data.body, self.__base_system, self.p1e, self.p29)
-        self.c44e = points.c44(self.__data.body, self.__base_system, self.p1e, self.p34)
-        self.c45e = points.c45(self.__data.body, self.__base_system, self.p1e, self.p34)
-        self.c42d = self.__symmetrical_point(self.c42e)
-        self.c43d = self.__symmetrical_point(self.c43e)
-        self.c44d = self.__symmetrical_point(self.c44e)
-        self.c45d = self.__symmetrical_point(self.c45e)
-
-        self.c46e, self.c47e, self.c48e, self.c49e = points.c46_47_48_49(self.__data.body, self.__base_system, self.p30, self.p14e, self.p15e, self.p35, t30)
-        self.c46d = self.__symmetrical_point(self.c46e)
-        self.c47d = self.__symmetrical_point(self.c47e)
-        self.c48d = self.__symmetrical_point(self.c48e)
-        self.c49d = self.__symmetrical_point(self.c49e)
-
-        self.c50e = points.c50(self.__data.body, self.__base_system, self.p13e, self.p31)
-        self.c51e = points.c51(self.__data.body, self.__base_system, self.p13e, self.p31)
-        self.c52e = points.c52(self.__data.body, self.__base_system, self.p13e, self.p36)
-        self.c53e = points.c53(self.__data.body, self.__base_system, self.p13e, self.p36)
-        self.c50d = self.__symmetrical_point(self.c50e)
-        self.c51d = self.__symmetrical_point(self.c51e)
-        self.c52d = self.__symmetrical_point(self.c52e)
-        self.c53d = self.__symmetrical_point(self.c53e)
-        
+
+    def __build_parts(self, dirty: set, executor: Executor) -> None:
+        """Builds the dirty parts, and the parts whose input points changed. The wing points, the sections of each
+        foil and the surface of each wing, the body, the head and the tail run in the executor as soon as their
+        inputs are ready"""
+
+        data, base = self.__data, self.__base_system
+        symmetric = self.__is_symmetric()
+        inputs = {name: getattr(self, name, None) for names in _INPUTS.values() for name in names}
+
+        def changed(part: str) -> bool:
+            return part in dirty or any(not array_equal(inputs[name], getattr(self, name)) for name in _INPUTS[part])
+
+        # Wing points. The right wing of a symmetric bird reuses the left one
+        left = _run(executor, _wing_points, data.wing, base, False) if 'left_wing' in dirty else None
+        right = _run(executor, _wing_points, data.wing, base, True) if 'right_wing' in dirty and not symmetric else None
+
+        if left is not None:
+            self.__left_wing = left.result()
+            left = [self.__left_wing, [_run(executor, sections.process_sections, *args) for args in _wing_sections(data.wing, self.__left_wing, False, False)]]
+
+        if 'right_wing' in dirty:
+            right = right.result() if right is not None else _run(executor, _wing_points, data.wing, base, True, self.__left_wing).result()
+            right = [right, [_run(executor, sections.process_sections, *args) for args in _wing_sections(data.wing, right, True, symmetric)]]
+
+        # Wing surfaces. The sections at p3 and p4 of a symmetric right wing are the left ones
+        if left is not None:
+            left_sections = [task.result() for task in left[1]]
+            left = _run(executor, _wing_surface, left[0], left_sections)
+
+        if right is not None:
+            reused = None
+            if symmetric:
+                names = ['p18', 'p19', 'curve25', 'curve26', 'curve27', 'curve28', 'p20', 'p21', 'curve31', 'curve32', 'curve33', 'curve34']
+                reused = [out[1] for out in left_sections[1]] + [out[2] for out in left_sections[1]] if left is not None else [getattr(self, name + 'e') for name in names]
+            right = _run(executor, _right_wing_surface, right[0], [task.result() for task in right[1]], reused)
+
+        if left is not None: self.__set(left.result(), 'e')
+
+        # The body needs the left wing and the head and the tail need the body
+        if changed('body'): self.__set(_run(executor, _body, data.wing, data.body, base, self.p1e, self.p13e, self.p14e, self.p15e).result())
+        head = _run(executor, _head, data.head, base, self.p26e, self.p26d, self.p28, self.p33) if changed('head') else None
+        tail = _run(executor, _tail, data.body, data.tail, self.p27e, self.p27d, self.p32, self.p37) if changed('tail') else None
+
+        if right is not None: self.__set(right.result(), 'd')
+        if head is not None: self.__set(head.result())
+        if tail is not None: self.__set(tail.result())
+
         return
-    
-    def __build_head(self) -> None:
-
-        center = 0.5 * (self.p26e + self.p26d)
-        self.p38 = points.p38(self.__data.head, self.__base_system, center)
-        self.p39 = points.p39(self.__data.head, self.__base_system, center)
-        self.p41e = points.p41e(self.__data.head, self.__base_system, center)
-        self.p41d = points.p41d(self.__data.head, self.__base_system, center)
-        self.p42 = points.p42(self.__data.head, self.__base_system, center)
-        self.c54 = points.c54(self.__data.head, self.__base_system, self.p28)
-        self.c55 = points.c55(self.__data.head, self.__base_system, self.p33)
-        self.c56e = points.c56e(self.__data.head, self.__base_system, self.p26e)
-        self.c56d = points.c56d(self.__data.head, self.__base_system, self.p26d)
-        self.c57 = points.c57(self.__data.head, self.__base_system, self.p38)
-        self.c58 = points.c58(self.__data.head, self.__base_system, self.p39)
-        self.c59e = points.c59e(self.__data.head, self.__base_system, self.p41e)
-        self.c59d = points.c59d(self.__data.head, self.__base_system, self.p41d)
 
+    def __set(self, arrays: dict, suffix: str = '') -> None:
+        for name, value in arrays.items():
+            setattr(self, name + suffix, value)
         return
+
+    def __take_snapshot(self) -> dict:
+        """Returns a copy of the parameters of each model. Foil files are stored with their modification time"""
+
+        def values(model) -> dict:
+            out = {}
+            for field in fields(model):
+                value = getattr(model, field.name)
+                if field.name in ['foils', 'foil']:
+                    value = tuple((file, stat(file).st_mtime_ns) for file in (value if isinstance(value, list) else [value]))
+                elif isinstance(value, list):
+                    value = tuple(value)
+                out[field.name] = value
+            return out
+
+        return {
+            'wing': values(self.__data.wing),
+            'body': values(self.__data.body),
+            'head': values(self.__data.head),
+            'tail': values(self.__data.tail),
+            'symmetric': self.__is_symmetric(),
+        }
+
+    def __dirty_parts(self, snapshot: dict) -> set:
+        """Returns the parts that must be built again"""
+
+        if self.__snapshot is None:
+            return {'left_wing', 'right_wing', 'body', 'head', 'tail'}
+
+        def changed(name: str) -> set:
+            old, new = self.__snapshot[name], snapshot[name]
+            return {key for key in new if old[key] != new[key]}
+
+        wing, body, head, tail = changed('wing'), changed('body'), changed('head'), changed('tail')
+        right_angles = {'theta{}_d'.format(i) for i in range(1, 8)}
+        left_angles = {'theta{}_e'.format(i) for i in range(1, 8)}
+
+        dirty = set()
+
+        if len(wing - right_angles) > 0: dirty.add('left_wing')
+        if len(wing - left_angles) > 0 or snapshot['symmetric'] != self.__snapshot['symmetric'] or (snapshot['symmetric'] and 'left_wing' in dirty): dirty.add('right_wing')
+
+        # A symmetric right wing needs the left wing system, which is not stored in the cache
+        if 'right_wing' in dirty and snapshot['symmetric'] and self.__left_wing is None: dirty.add('left_wing')
+
+        # Besides their own parameters, the body reads the wing heights and root angle and the tail reads
+        # h11 of the body. The points they read from the previous parts are checked while building
+        if len(body) > 0 or len(wing & {'h1', 'h7', 'thetaRootZ'}) > 0: dirty.add('body')
+        if len(head) > 0: dirty.add('head')
+        if len(tail) > 0 or 'h11' in body: dirty.add('tail')
+
+        return dirty
     
-    def __build_tail(self) -> None:
-
-        system = TailSystem(
-            theta8=self.__data.tail.theta8,
-            theta9=self.__data.tail.theta9,
-            theta10=self.__data.tail.theta10,
-        )
-
-        center = 0.5 * (self.p32 + self.p37)
-        self.p47e = points.p47e(self.__data.tail, system, center)
-        self.p49e = points.p49e(self.__data.body, self.__data.tail, system, center)
-        self.p51 = points.p51(self.__data.tail, system, center)
-        self.p49d = points.p49d(self.__data.body, self.__data.tail, system, center)
-        self.p47d = points.p47d(self.__data.tail, system, center)
-
-        self.p43e, self.p44e, self.curve84e, self.curve85e, self.curve86e, self.curve87e = sections.process_section(self.__data.tail.foil, self.p27e, self.p49e, -system.x4, system.z4, n=100)
-        self.p43d, self.p44d, self.curve84d, self.curve85d, self.curve86d, self.curve87d = sections.process_section(self.__data.tail.foil, self.p27d, self.p49d, -system.x4, system.z4, n=100)
-        
-        self.p45 = points.p45(self.p32, self.p51)
-        self.p46 = points.p46(self.p37, self.p51)
-
-        self.curve82e = points.curve82e(self.__data.body, self.__data.tail, system, center, 100)
-        self.curve82d = points.curve82d(self.__data.body, self.__data.tail, system, center, 100)
-        self.curve83e = points.curve83e(self.__data.body, self.__data.tail, system, center, 50)
-        self.curve83d = points.curve83d(self.__data.body, self.__data.tail, system, center, 50)
-
-        if self.__data.tail.shape == TailShape.rounded:
-            self.p51 = 0.5 * (self.curve83e[49, :] + self.curve83d[49, :])
-        
-        return
+
+    def __is_symmetric(self) -> bool:
+        """Checks if the left and right wings have the same angles"""
+        wing = self.__data.wing
+        return all(getattr(wing, 'theta{}_e'.format(i)) == getattr(wing, 'theta{}_d'.format(i)) for i in range(1, 8))
+
+def _run(executor: Executor, fn: Callable, *args: Any) -> Future:
+    """Runs fn in the executor, or right away when there is none"""
+
+    if executor is not None:
+        return executor.submit(fn, *args)
+
+    future = Future()
+    future.set_result(fn(*args))
+    return future
+
+def _symmetrical(a: ndarray) -> ndarray:
+    return a * array([1., -1., 1.])
+
+def _wing_points(wing: WingModel, base: BaseSystem, right: bool, left: dict = None) -> dict:
+    """Returns the system and the countor and control points of a wing, before the right one is mirrored. The right
+    wing of a symmetric bird is built from the left one (left), since only tp9 differs"""
+
+    if left is not None:
+        w = dict(left)
+        w['tp9'] = 0.6
+        w['p9'] = points.p9(w['p7'], w['aux3'], w['p10_11_aux'], w['tp9'])
+        w['c12'], w['c13'] = points.c12_c13(w['p7'], w['aux3'], w['p10'], w['tp8'], w['tp9'])
+        w['c14'], w['c15'] = points.c14_c15(w['p7'], w['aux3'], w['p10'], w['tp9'])
+        w['c16'] = points.c16(wing, w['p10'], w['p11'], w['c15'])
+        return w
+
+    # Wing systems
+    side = 'd' if right else 'e'
+    system = WingSystem(
+        thetaRootY=wing.thetaRootY,
+        theta1=getattr(wing, 'theta1_' + side),
+        theta2=getattr(wing, 'theta2_' + side),
+        theta3=getattr(wing, 'theta3_' + side),
+        theta4=getattr(wing, 'theta4_' + side),
+        theta5=getattr(wing, 'theta5_' + side),
+        theta6=getattr(wing, 'theta6_' + side),
+        theta7=getattr(wing, 'theta7_' + side),
+        x0=base.x0,
+        y0=base.y0,
+        z0=base.z0,
+    )
+
+    # Countor points
+    w = {'system': system, 'tp6': 0.8, 'tp8': 0.08, 'tp9': 0.6 if right else 0.5}
+    w['p0'] = points.p0(wing, system)
+    l1 = points.l1(wing, system, w['p0'])
+    l2 = points.l2(wing, system, l1)
+    l3 = points.l3(wing, system, l2)
+    w['p1'] = points.p1(wing, system, w['p0'], True)
+    p3Line = points.p3Line(wing, system, l2)
+    w['aux1'] = points.aux1(wing, system, l1, w['p1'], p3Line)
+    w['p2'] = points.p2(w['p1'], w['aux1'], p3Line)
+    w['p3'] = points.p3(wing, system, l2)
+    w['p4'] = points.p4(wing, system, l2)
+    w['p5'] = points.p5(wing, system, l3)
+    w['p7'] = points.p7(wing, system, w['p5'])
+    w['aux2'] = points.aux2(wing, system, w['p5'], w['p7'])
+    w['p6'] = points.p6(w['p5'], w['aux2'], w['p7'], w['tp6'])
+    w['p10_11_aux'] = points.p10_11_aux(wing, system, w['p4'], w['p3'])
+    w['aux3'] = points.aux3(wing, system, w['p7'], w['p10_11_aux'])
+    w['p10'] = points.p10(wing, w['p10_11_aux'], w['p7'], w['aux3'])
+    w['p8'] = points.p8(w['p7'], w['aux3'], w['p10_11_aux'], w['tp8'])
+    w['p9'] = points.p9(w['p7'], w['aux3'], w['p10_11_aux'], w['tp9'])
+    w['p13'] = points.p13(wing, system, w['p0'], True)
+    w['aux4'] = points.aux4(wing, system, w['p10_11_aux'], w['p13'])
+    w['p11'] = points.p11(wing, w['p10_11_aux'], w['p13'], w['aux4'])
+    w['p12'] = points.p12(w['p10_11_aux'], w['aux4'], w['p13'])
+
+    # Control points
+    w['c1'] = points.c1(w['p1'], w['aux1'], p3Line)
+    w['c2'] = points.c2(wing, w['p1'], w['p2'], w['p3'])
+    w['c3'] = points.c3(wing, system, w['p2'], w['p3'], w['p4'])
+    w['c4'] = points.c4(wing, system, w['p3'], w['p4'])
+    w['c5'] = points.c5(wing, system, w['p3'], w['p4'])
+    w['c6'], w['c7'] = points.c6_c7(w['p5'], w['aux2'], w['p7'], w['tp6'])
+    w['c8'], w['c9'] = points.c8_c9(w['p5'], w['aux2'], w['p7'], w['tp6'])
+    w['c10'], w['c11'] = points.c10_c11(w['p7'], w['aux3'], w['p10'], w['tp8'])
+    w['c12'], w['c13'] = points.c12_c13(w['p7'], w['aux3'], w['p10'], w['tp8'], w['tp9'])
+    w['c14'], w['c15'] = points.c14_c15(w['p7'], w['aux3'], w['p10'], w['tp9'])
+    w['c16'] = points.c16(wing, w['p10'], w['p11'], w['c15'])
+    w['c18'], w['c19'] = points.c18_c19(w['p11'], w['aux4'], w['p13'], 0.5)
+    w['c17'] = points.c17(wing, w['p10'], w['p11'], w['c18'])
+    w['c20'], w['c21'] = points.c20_c21(w['p11'], w['aux4'], w['p13'], 0.5)
+
+    return w
+
+def _wing_sections(wing: WingModel, w: dict, right: bool, symmetric: bool) -> List[list]:
+    """Returns the arguments of the process_sections call of each foil. The second foil is placed at p2, p3, p4, p5
+    and p6, without p3 and p4 in the right wing of a symmetric bird, which reuses the left ones"""
+
+    system, sign = w['system'], -1. if right else 1.
+
+    def call(k: int, places: List[tuple]) -> list:
+        return [wing.foils[k], [w[a] for a, b, x, z in places], [w[b] for a, b, x, z in places], [x for a, b, x, z in places], [z for a, b, x, z in places], 100]
+
+    second = [('p2', 'p12', sign * system.x1, system.z1), ('p3', 'p11', system.x2Tip, system.z2Tip), ('p4', 'p10', system.x3, system.z3),
+              ('p5', 'p9', sign * system.x3, system.z3), ('p6', 'p8', sign * system.x3, system.z3)]
+
+    return [
+        call(0, [('p1', 'p13', sign * system.x1, system.z1), ('p2', 'p12', sign * system.x1, system.z1)]),
+        call(1, second[:1] + second[3:] if right and symmetric else second),
+        call(2, [('p5', 'p9', sign * system.x3, system.z3)]),
+    ]
+
+def _wing_surface(w: dict, foils: List[list], reused: List[ndarray] = None) -> dict:
+    """Returns the points, the sections and the curves between sections of a wing, given the placed sections of each
+    foil (see _wing_sections). reused are the sections at p3 and p4 when they are not placed again"""
+
+    out = {name: w[name] for name in _WING_POINTS}
+    sections0, sections1, sections2 = foils
+
+    out['p14'], out['p15'], out['curve13'], out['curve14'], out['curve15'], out['curve16'] = [o[0] for o in sections0]
+    p161, p171, curve191, curve201, curve211, curve221 = [o[1] for o in sections0]
+
+    p162, p172, curve192, curve202, curve212, curve222 = [o[0] for o in sections1]
+    out['p16'], out['p17'] = 0.5 * (p161 + p162), 0.5 * (p171 + p172)
+    out['curve19'], out['curve20'] = 0.5 * (curve191 + curve192), 0.5 * (curve201 + curve202)
+    out['curve21'], out['curve22'] = 0.5 * (curve211 + curve212), 0.5 * (curve221 + curve222)
+
+    if reused is None:
+        out['p18'], out['p19'], out['curve25'], out['curve26'], out['curve27'], out['curve28'] = [o[1] for o in sections1]
+        out['p20'], out['p21'], out['curve31'], out['curve32'], out['curve33'], out['curve34'] = [o[2] for o in sections1]
+        sections1 = [o[3:] for o in sections1]
+    else:
+        out['p18'], out['p19'], out['curve25'], out['curve26'], out['curve27'], out['curve28'] = reused[:6]
+        out['p20'], out['p21'], out['curve31'], out['curve32'], out['curve33'], out['curve34'] = reused[6:]
+        sections1 = [o[1:] for o in sections1]
+
+    tp9 = w['tp9']
+    dataAux1 = [o[0] for o in sections1]
+    dataAux2 = [o[0] for o in sections2]
+    out['p22'], out['p23'], out['curve37'], out['curve38'], out['curve39'], out['curve40'] = [tp9 * a + (1 - tp9) * b for a, b in zip(dataAux1, dataAux2)]
+
+    out['p24'], out['p25'], out['curve43'], out['curve44'], out['curve45'], out['curve46'] = [o[1] for o in sections1]
+
+    # Curves between sections
+    out['curve17'], out['curve18'] = surface.interpolate_curves(
+        [out['p14'], out['p15']],
+        [out['p16'], out['p17']],
+        bezier.quadratic([w['p1'], w['c1'], w['p2']], linspace(0, 1, num=50)),
+        bezier.cubic([w['p13'], w['c21'], w['c20'], w['p12']], linspace(0, 1, num=50)),
+    )
+
+    out['curve23'], out['curve24'] = surface.interpolate_curves(
+        [out['p16'], out['p17']],
+        [out['p18'], out['p19']],
+        bezier.cubic([w['p2'], w['c2'], w['c3'], w['p3']], linspace(0, 1, num=50)),
+        bezier.cubic([w['p12'], w['c19'], w['c18'], w['p11']], linspace(0, 1, num=50)),
+    )
+
+    out['curve29'], out['curve30'] = surface.interpolate_curves(
+        [out['p18'], out['p19']],
+        [out['p20'], out['p21']],
+        bezier.cubic([w['p3'], w['c4'], w['c5'], w['p4']], linspace(0, 1, num=50)),
+        bezier.cubic([w['p11'], w['c17'], w['c16'], w['p10']], linspace(0, 1, num=50)),
+    )
+
+    out['curve35'], out['curve36'] = surface.interpolate_curves(
+        [out['p20'], out['p21']],
+        [out['p22'], out['p23']],
+        bezier.quadratic([w['p4'], 0.5 * (w['p4'] + w['p5']), w['p5']], linspace(0, 1, num=50)),
+        bezier.cubic([w['p10'], w['c15'], w['c14'], w['p9']], linspace(0, 1, num=50)),
+    )
+
+    out['curve41'], out['curve42'] = surface.interpolate_curves(
+        [out['p22'], out['p23']],
+        [out['p24'], out['p25']],
+        bezier.cubic([w['p5'], w['c6'], w['c7'], w['p6']], linspace(0, 1, num=50)),
+        bezier.cubic([w['p9'], w['c13'], w['c12'], w['p8']], linspace(0, 1, num=50)),
+    )
+    out['curve47'] = surface.interpolate_tip_curve(out['p24'], w['p7'])
+    out['curve48'] = surface.interpolate_tip_curve(out['p25'], w['p7'])
+
+    return out
+
+def _right_wing_surface(w: dict, foils: List[list], reused: List[ndarray] = None) -> dict:
+    """Returns the arrays of the right wing, which is built as the left one and mirrored"""
+    return {name: _symmetrical(value) for name, value in _wing_surface(w, foils, reused).items()}
+
+def _body(wing: WingModel, body: BodyModel, base: BaseSystem, p1e: ndarray, p13e: ndarray, p14e: ndarray, p15e: ndarray) -> dict:
+
+    out = {}
+    out['p26e'] = points.p26(wing, body, base)
+    out['p27e'] = points.p27(wing, body, base)
+    out['p26d'] = _symmetrical(out['p26e'])
+    out['p27d'] = _symmetrical(out['p27e'])
+    out['p28'] = points.p28(wing, body, base)
+    out['p29'] = points.p29(wing, body, base)
+    out['p31'] = points.p31(wing, body, base)
+    aux5 = points.aux5(body, base, out['p29'], out['p31'])
+    aux6 = points.aux6(body, base, out['p29'], out['p31'])
+    out['p30'], t30 = points.p30(out['p29'], aux5, aux6, out['p31'], p14e)
+    out['p32'] = points.p32(wing, body, base)
+    out['p33'] = points.p33(wing, body, base)
+    out['p34'] = points.p34(wing, body, base)
+    out['p36'] = points.p36(wing, body, base)
+    aux7 = points.aux7(body, base, out['p34'], out['p36'])
+    aux8 = points.aux8(body, base, out['p34'], out['p36'])
+    out['p35'], t35 = points.p35(out['p34'], aux7, aux8, out['p36'], p14e)
+    out['p37'] = points.p37(wing, body, base)
+
+    out['c22e'] = points.c22(body, base, out['p26e'], p1e)
+    out['c23e'] = points.c23(body, base, out['p26e'], p1e)
+    out['c24e'] = points.c24(body, base, p13e, out['p27e'])
+    out['c25e'] = points.c25(body, base, p13e, out['p27e'])
+    out['c22d'] = _symmetrical(out['c22e'])
+    out['c23d'] = _symmetrical(out['c23e'])
+    out['c24d'] = _symmetrical(out['c24e'])
+    out['c25d'] = _symmetrical(out['c25e'])
+    out['c26'] = points.c26(body, base, out['p28'], out['p29'])
+    out['c27'] = points.c27(body, base, out['p28'], out['p29'])
+    out['c28'], out['c29'] = points.c28_29(out['p29'], aux5, aux6, out['p31'], t30)
+    out['c30'], out['c31'] = points.c30_31(out['p29'], aux5, aux6, out['p31'], t30)
+    out['c32'] = points.c32(body, base, out['p31'], out['p32'])
+    out['c33'] = points.c33(body, base, out['p31'], out['p32'])
+    out['c34'] = points.c34(body, base, out['p33'], out['p34'])
+    out['c35'] = points.c35(body, base, out['p33'], out['p34'])
+    out['c36'], out['c37'] = points.c36_37(out['p34'], aux7, aux8, out['p36'], t35)
+    out['c38'], out['c39'] = points.c38_39(out['p34'], aux7, aux8, out['p36'], t35)
+    out['c40'] = points.c40(body, base, out['p36'], out['p37'])
+    out['c41'] = points.c41(body, base, out['p37'], out['p37'])
+
+    out['c42e'] = points.c42(body, base, p1e, out['p29'])
+    out['c43e'] = points.c43(body, base, p1e, out['p29'])
+    out['c44e'] = points.c44(body, base, p1e, out['p34'])
+    out['c45e'] = points.c45(body, base, p1e, out['p34'])
+    out['c42d'] = _symmetrical(out['c42e'])
+    out['c43d'] = _symmetrical(out['c43e'])
+    out['c44d'] = _symmetrical(out['c44e'])
+    out['c45d'] = _symmetrical(out['c45e'])
+
+    out['c46e'], out['c47e'], out['c48e'], out['c49e'] = points.c46_47_48_49(body, base, out['p30'], p14e, p15e, out['p35'], t30)
+    out['c46d'] = _symmetrical(out['c46e'])
+    out['c47d'] = _symmetrical(out['c47e'])
+    out['c48d'] = _symmetrical(out['c48e'])
+    out['c49d'] = _symmetrical(out['c49e'])
+
+    out['c50e'] = points.c50(body, base, p13e, out['p31'])
+    out['c51e'] = points.c51(body, base, p13e, out['p31'])
+    out['c52e'] = points.c52(body, base, p13e, out['p36'])
+    out['c53e'] = points.c53(body, base, p13e, out['p36'])
+    out['c50d'] = _symmetrical(out['c50e'])
+    out['c51d'] = _symmetrical(out['c51e'])
+    out['c52d'] = _symmetrical(out['c52e'])
+    out['c53d'] = _symmetrical(out['c53e'])
+
+    return out
+
+def _head(head: HeadModel, base: BaseSystem, p26e: ndarray, p26d: ndarray, p28: ndarray, p33: ndarray) -> dict:
+
+    out = {}
+    center = 0.5 * (p26e + p26d)
+    out['p38'] = points.p38(head, base, center)
+    out['p39'] = points.p39(head, base, center)
+    out['p41e'] = points.p41e(head, base, center)
+    out['p41d'] = points.p41d(head, base, center)
+    out['p42'] = points.p42(head, base, center)
+    out['c54'] = points.c54(head, base, p28)
+    out['c55'] = points.c55(head, base, p33)
+    out['c56e'] = points.c56e(head, base, p26e)
+    out['c56d'] = points.c56d(head, base, p26d)
+    out['c57'] = points.c57(head, base, out['p38'])
+    out['c58'] = points.c58(head, base, out['p39'])
+    out['c59e'] = points.c59e(head, base, out['p41e'])
+    out['c59d'] = points.c59d(head, base, out['p41d'])
+
+    return out
+
+def _tail(body: BodyModel, tail: TailModel, p27e: ndarray, p27d: ndarray, p32: ndarray, p37: ndarray) -> dict:
+
+    system = TailSystem(
+        theta8=tail.theta8,
+        theta9=tail.theta9,
+        theta10=tail.theta10,
+    )
+
+    out = {}
+    center = 0.5 * (p32 + p37)
+    circleCenter = points.tail_circle_center(tail, system, center) if tail.shape == TailShape.rounded else None
+
+    out['p47e'] = points.p47e(tail, system, center)
+    out['p49e'] = points.p49e(body, tail, system, center, circleCenter)
+    out['p51'] = points.p51(tail, system, center)
+    out['p49d'] = points.p49d(body, tail, system, center, circleCenter)
+    out['p47d'] = points.p47d(tail, system, center)
+
+    tailSections = sections.process_sections(tail.foil, [p27e, p27d], [out['p49e'], out['p49d']], [-system.x4, -system.x4], [system.z4, system.z4], n=100)
+    out['p43e'], out['p44e'], out['curve84e'], out['curve85e'], out['curve86e'], out['curve87e'] = [o[0] for o in tailSections]
+    out['p43d'], out['p44d'], out['curve84d'], out['curve85d'], out['curve86d'], out['curve87d'] = [o[1] for o in tailSections]
+
+    out['p45'] = points.p45(p32, out['p51'])
+    out['p46'] = points.p46(p37, out['p51'])
+
+    out['curve82e'] = points.curve82e(body, tail, system, center, 100, circleCenter)
+    out['curve82d'] = points.curve82d(body, tail, system, center, 100, circleCenter)
+    out['curve83e'] = points.curve83e(body, tail, system, center, 50, circleCenter)
+    out['curve83d'] = points.curve83d(body, tail, system, center, 50, circleCenter)
+
+    if tail.shape == TailShape.rounded:
+        out['p51'] = 0.5 * (out['curve83e'][49, :] + out['curve83d'][49, :])
+
+    return out
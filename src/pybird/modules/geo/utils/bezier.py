@@ -1,204 +1,241 @@
-from math import fabs
-from tabnanny import check
+from functools import lru_cache
+from math import factorial
 from typing import Any, List
-from matplotlib import bezier
-from numpy import dot, linspace, zeros, ndarray
-from scipy.optimize import minimize, minimize_scalar
+from numpy import arange, argmin, array, concatenate, fabs, flatnonzero, lexsort, ascontiguousarray, asarray, broadcast_to, dot, double, einsum, frombuffer, linspace, ravel, stack, where, zeros, ndarray
+from numpy.linalg import pinv
+from numpy.polynomial.polynomial import polyroots
 
 from pybird.modules.geo.utils import vector
 
-def quadratic(points: List[ndarray], t: Any) -> Any:
-    """Returns a ndarray or ndarray depending on t"""
-
-    def func(i: float) -> ndarray:
-        return (1 - i) * (1 - i) * points[0] + 2 * i * (1 - i) * points[1] + i * i * points[2]
-
-    if isinstance(t, ndarray):
+def bernstein(degree: int, t: Any) -> ndarray:
+    """Returns the Bernstein basis of a given degree evaluated at t, with shape t.shape + (degree + 1,)"""
+    t = asarray(t, dtype=double)[..., None]
+    i = arange(degree + 1)
+    binomial = array([factorial(degree) // (factorial(j) * factorial(degree - j)) for j in i], dtype=double)
+    return binomial * t ** i * (1 - t) ** (degree - i)
+
+def bernstein_derivative(degree: int, t: Any) -> ndarray:
+    """Returns the derivative of the Bernstein basis of a given degree evaluated at t, with shape t.shape + (degree + 1,)"""
+    b = degree * bernstein(degree - 1, t)
+    out = zeros(b.shape[:-1] + (degree + 1,))
+    out[..., 1:] += b
+    out[..., :-1] -= b
+    return out
+
+@lru_cache(maxsize=64)
+def _basis_matrix(degree: int, derivative: bool, n: int, data: bytes) -> ndarray:
+    t = frombuffer(data, dtype=double, count=n)
+    out = bernstein_derivative(degree, t) if derivative else bernstein(degree, t)
+    out.setflags(write=False)
+    return out
+
+def basis_matrix(degree: int, t: ndarray, derivative: bool = False) -> ndarray:
+    """Returns the (n, degree + 1) Bernstein matrix of t. Matrices are cached, since the same t vectors are used over and over"""
+    t = ascontiguousarray(t, dtype=double)
+    return _basis_matrix(degree, derivative, t.size, t.tobytes())
+
+def evaluate_curves(curves: ndarray, t: ndarray, derivative: bool = False) -> ndarray:
+    """Evaluates K Bezier curves of the same degree at once. curves has shape (K, degree + 1, 3), t has shape (n,) and the output (K, n, 3)"""
+    curves = asarray(curves, dtype=double)
+    return einsum('nm,kmj->knj', basis_matrix(curves.shape[1] - 1, t, derivative), curves)
 
-        n = len(t)
-        out = zeros((n, 3))
-
-        for i in range(n):
-            out[i, :] = func(t[i])
-        
-        return out
+def quadratic(points: List[ndarray], t: Any) -> Any:
+    """Returns the points at the samples t (n,), or at t if it is a float or a (N, 1) array with one value per curve"""
 
+    if isinstance(t, ndarray) and t.ndim == 1:
+        return dot(basis_matrix(2, t), asarray(points, dtype=double))
     else:
-
-        return func(t)
+        return (1 - t) * (1 - t) * points[0] + 2 * t * (1 - t) * points[1] + t * t * points[2]
 
 def quadratic_derivative(points: List[ndarray], t: Any) -> Any:
-    """Returns a ndarray or ndarray depending on t"""
-
-    def func(i: float) -> ndarray:
-        return 2 * (1 - i) * (points[1] - points[0]) + 2 * i * (points[2] - points[1])
-
-    if isinstance(t, ndarray):
-
-        n = len(t)
-        out = zeros((n, 3))
-
-        for i in range(n):
-            out[i, :] = func(t[i])
-        
-        return out
+    """Returns the points at the samples t (n,), or at t if it is a float or a (N, 1) array with one value per curve"""
 
+    if isinstance(t, ndarray) and t.ndim == 1:
+        return dot(basis_matrix(2, t, derivative=True), asarray(points, dtype=double))
     else:
-
-        return func(t)
+        return 2 * (1 - t) * (points[1] - points[0]) + 2 * t * (points[2] - points[1])
 
 def cubic_derivative(points: List[ndarray], t: Any) -> Any:
-    """Returns a ndarray or ndarray depending on t"""
-
-    def func(i: float) -> ndarray:
-        return 3 * (1 - i) * (1 - i) * (points[1] - points[0]) + 6 * (1 - i) * i * (points[2] - points[1]) + 3 * i * i * (points[3] - points[2])
-
-    if isinstance(t, ndarray):
-
-        n = len(t)
-        out = zeros((n, 3))
-
-        for i in range(n):
-            out[i, :] = func(t[i])
-        
-        return out
+    """Returns the points at the samples t (n,), or at t if it is a float or a (N, 1) array with one value per curve"""
 
+    if isinstance(t, ndarray) and t.ndim == 1:
+        return dot(basis_matrix(3, t, derivative=True), asarray(points, dtype=double))
     else:
-
-        return func(t)
+        return 3 * (1 - t) * (1 - t) * (points[1] - points[0]) + 6 * (1 - t) * t * (points[2] - points[1]) + 3 * t * t * (points[3] - points[2])
 
 def cubic(points: List[ndarray], t: Any) -> Any:
-    """Returns a ndarray or ndarray depending on t"""
-
-    def func(i: float) -> ndarray:
-        return (1 - i) * (1 - i) * (1 - i) * points[0] + 3 * i * (1 - i) * (1 - i) * points[1] + 3 * i * i * (1 - i) * points[2] + i * i * i * points[3]
-
-    if isinstance(t, ndarray):
+    """Returns the points at the samples t (n,), or at t if it is a float or a (N, 1) array with one value per curve"""
 
-        n = len(t)
-        out = zeros((n, 3))
-
-        for i in range(n):
-            out[i, :] = func(t[i])
-        
-        return out
-
-    else:
-        
-        return func(t)
-
-def fit_curbic_curve(curve: List[ndarray], t1: float, t2: float) -> List[ndarray]:
-    """Finds the control points that best fit a cubic curve into part of a quadratic curve"""
-    
-    def func(x, *args):
-        t, p1, p2, dp1dt, dp2dt, curve, f = args
-
-        c1, c2 = p1 + x[0] * dp1dt, p2 + x[1] * dp2dt
-        points = [p1, c1, c2, p2]
-        value = [0, 0, 0]
-
-        for i in range(len(t)):
-            f2 = f(points, t[i])
-            value[0] = value[0] + (curve[i][0] - f2[0]) ** 2
-            value[1] = value[1] + (curve[i][1] - f2[1]) ** 2
-            value[2] = value[2] + (curve[i][2] - f2[2]) ** 2
-
-        return value[0] + value[1] + value[2]
-
-    if len(curve) == 3:
-        p1 = quadratic(curve, t1)
-        p2 = quadratic(curve, t2)
-        dp1dt = quadratic_derivative(curve, t1)
-        dp2dt = quadratic_derivative(curve, t2)
+    if isinstance(t, ndarray) and t.ndim == 1:
+        return dot(basis_matrix(3, t), asarray(points, dtype=double))
     else:
-        p1 = cubic(curve, t1)
-        p2 = cubic(curve, t2)
-        dp1dt = cubic_derivative(curve, t1)
-        dp2dt = cubic_derivative(curve, t2)
-
-    n = 20
-    tquad = linspace(t1, t2, num=n)
-    tcub = linspace(0, 1, num=n)
-
-    if len(curve) == 3:
-        ref_curve = [quadratic(curve, tquad[i]) for i in range(n)]
-    else:
-        ref_curve = [cubic(curve, tquad[i]) for i in range(n)]
-    
-    sol = minimize(func, [0, 0], args=(tcub, p1, p2, dp1dt, dp2dt, ref_curve, cubic,))
-
-    return [p1 + sol.x[0] * dp1dt, p2 + sol.x[1] * dp2dt]
+        return (1 - t) * (1 - t) * (1 - t) * points[0] + 3 * t * (1 - t) * (1 - t) * points[1] + 3 * t * t * (1 - t) * points[2] + t * t * t * points[3]
 
-def fit_quadratic_curve(curve: List[ndarray], t1: float, t2: float, useLast: bool) -> ndarray:
-    """Finds the control point that best fit a quadratic curve into part of a quadratic curve"""
-    
-    def func(x, *args):
-        t, p1, p2, dpdt, curve, f, check = args
+def fit_cubic_curves(curves: ndarray, t1: Any, t2: Any) -> ndarray:
+    """Finds the control points that best fit cubic curves into part of K quadratic or cubic curves at once.
+    curves has shape (K, 3 or 4, 3), t1 and t2 are floats or have shape (K,) and the output has shape (K, 2, 3)"""
 
-        c = p2 + x[0] * dpdt if check else p1 + x[0] * dpdt
-        points = [p1, c, p2]
-        value = [0, 0, 0]
+    curves = asarray(curves, dtype=double)
+    degree = curves.shape[1] - 1
+    t1 = broadcast_to(asarray(t1, dtype=double), curves.shape[:1])
+    t2 = broadcast_to(asarray(t2, dtype=double), curves.shape[:1])
 
-        for i in range(len(t)):
-            f2 = f(points, t[i])
-            value[0] = value[0] + (curve[i][0] - f2[0]) ** 2
-            value[1] = value[1] + (curve[i][1] - f2[1]) ** 2
-            value[2] = value[2] + (curve[i][2] - f2[2]) ** 2
-
-        return value[0] + value[1] + value[2]
-
-    p1 = quadratic(curve, t1)
-    p2 = quadratic(curve, t2)
-    dpdt = quadratic_derivative(curve, t2) if useLast else quadratic_derivative(curve, t1)
+    p1 = einsum('km,kmj->kj', bernstein(degree, t1), curves)
+    p2 = einsum('km,kmj->kj', bernstein(degree, t2), curves)
+    dp1dt = einsum('km,kmj->kj', bernstein_derivative(degree, t1), curves)
+    dp2dt = einsum('km,kmj->kj', bernstein_derivative(degree, t2), curves)
 
     n = 20
-    tquad = linspace(t1, t2, num=n)
+    tcub = linspace(0, 1, num=n)
+    tref = t1[:, None] + (t2 - t1)[:, None] * tcub[None, :]
+    ref_curve = einsum('knm,kmj->knj', bernstein(degree, tref), curves)
 
-    ref_curve = []
-    for i in range(n):
-        ref_curve.append(quadratic(curve, tquad[i]))
-    
+    # With c1 = p1 + x1 * dp1dt and c2 = p2 + x2 * dp2dt the cubic curve is
+    # linear in (x1, x2), so the best fit solves a 2x2 linear system
+    b = bernstein(3, tcub)
+    r = ref_curve - (b[:, 0] + b[:, 1])[None, :, None] * p1[:, None, :] - (b[:, 2] + b[:, 3])[None, :, None] * p2[:, None, :]
 
-    sol = minimize(func, [0], args=(linspace(0, 1, num=n), p1, p2, dpdt, ref_curve, quadratic, useLast))
+    a11 = dot(b[:, 1], b[:, 1]) * einsum('kj,kj->k', dp1dt, dp1dt)
+    a12 = dot(b[:, 1], b[:, 2]) * einsum('kj,kj->k', dp1dt, dp2dt)
+    a22 = dot(b[:, 2], b[:, 2]) * einsum('kj,kj->k', dp2dt, dp2dt)
+    a = stack([stack([a11, a12], axis=-1), stack([a12, a22], axis=-1)], axis=-2)
 
-    if useLast:
-        return p2 + sol.x[0] * dpdt
-    else:
-        return p1 + sol.x[0] * dpdt
+    rhs = stack([einsum('n,knj,kj->k', b[:, 1], r, dp1dt), einsum('n,knj,kj->k', b[:, 2], r, dp2dt)], axis=-1)
 
-def find_plane_intersection(curve: List[ndarray], p: ndarray) -> List[ndarray]:
-    """Finds the intersection between the Bezier curve and a plane with p beeing a point in the plane"""
-    
-    def func(x, *args):
-        p, curve, f, dfdt = args
+    x = einsum('kij,kj->ki', pinv(a), rhs)
 
-        aux = f(curve, x)
-        der = dfdt(curve, x)
+    return stack([p1 + x[:, 0:1] * dp1dt, p2 + x[:, 1:2] * dp2dt], axis=1)
 
-        v = p - aux
+def fit_quadratic_curves(curves: ndarray, t1: Any, t2: Any, useLast: bool) -> ndarray:
+    """Finds the control point that best fit quadratic curves into part of K quadratic curves at once.
+    curves has shape (K, 3, 3), t1 and t2 are floats or have shape (K,) and the output has shape (K, 3)"""
 
-        val = fabs(dot(v / vector.norm(v), der / vector.norm(der)))
+    curves = asarray(curves, dtype=double)
+    degree = curves.shape[1] - 1
+    t1 = broadcast_to(asarray(t1, dtype=double), curves.shape[:1])
+    t2 = broadcast_to(asarray(t2, dtype=double), curves.shape[:1])
 
-        return val
-    
-    f = cubic if len(curve) == 4 else quadratic
-    dfdt = cubic_derivative if len(curve) == 4 else quadratic_derivative
-    sol = minimize_scalar(func, method='bounded', bounds=(0, 1), args=(p, curve, f, dfdt))
+    p1 = einsum('km,kmj->kj', bernstein(degree, t1), curves)
+    p2 = einsum('km,kmj->kj', bernstein(degree, t2), curves)
+    dpdt = einsum('km,kmj->kj', bernstein_derivative(degree, t2 if useLast else t1), curves)
+    base = p2 if useLast else p1
 
-    return sol.x
+    n = 20
+    tquad = linspace(0, 1, num=n)
+    tref = t1[:, None] + (t2 - t1)[:, None] * tquad[None, :]
+    ref_curve = einsum('knm,kmj->knj', bernstein(degree, tref), curves)
+
+    # With c = base + x * dpdt the quadratic curve is linear in x
+    b = bernstein(2, tquad)
+    r = ref_curve - b[None, :, 0, None] * p1[:, None, :] - b[None, :, 1, None] * base[:, None, :] - b[None, :, 2, None] * p2[:, None, :]
+
+    a = dot(b[:, 1], b[:, 1]) * einsum('kj,kj->k', dpdt, dpdt)
+    rhs = einsum('n,knj,kj->k', b[:, 1], r, dpdt)
+
+    x = where(a > 0, rhs / where(a > 0, a, 1), 0)
+
+    return base + x[:, None] * dpdt
+
+def fit_curbic_curve(curve: List[ndarray], t1: Any, t2: Any) -> List[ndarray]:
+    """Finds the control points that best fit a cubic curve into part of a quadratic curve. The points can be (N, 3)
+    arrays of N curves, with t1 and t2 floats or (N, 1) arrays"""
+    curves = stack([asarray(p, dtype=double) for p in curve], axis=-2)
+    if curves.ndim == 2:
+        c = fit_cubic_curves(curves[None, :, :], t1, t2)[0]
+        return [c[0], c[1]]
+    c = fit_cubic_curves(curves, ravel(t1), ravel(t2))
+    return [c[:, 0], c[:, 1]]
+
+def fit_quadratic_curve(curve: List[ndarray], t1: Any, t2: Any, useLast: bool) -> ndarray:
+    """Finds the control point that best fit a quadratic curve into part of a quadratic curve. The points can be (N, 3)
+    arrays of N curves, with t1 and t2 floats or (N, 1) arrays"""
+    curves = stack([asarray(p, dtype=double) for p in curve], axis=-2)
+    if curves.ndim == 2:
+        return fit_quadratic_curves(curves[None, :, :], t1, t2, useLast)[0]
+    return fit_quadratic_curves(curves, ravel(t1), ravel(t2), useLast)
+
+@lru_cache(maxsize=8)
+def _power_matrix(degree: int) -> ndarray:
+    """Returns the matrix that converts the control points to the coefficients of the power basis (t^0, ..., t^degree)"""
+    out = zeros((degree + 1, degree + 1))
+    for k in range(degree + 1):
+        for i in range(k + 1):
+            out[k, i] = factorial(degree) // (factorial(degree - k) * factorial(i) * factorial(k - i)) * (-1) ** (k - i)
+    out.setflags(write=False)
+    return out
+
+def _real_roots(coef: ndarray) -> ndarray:
+    """Returns the real roots in [0, 1] of the polynomial with coefficients coef (increasing powers)"""
+    scale = fabs(coef).max()
+    if scale == 0: return zeros(0)
+    nonzero = flatnonzero(fabs(coef) > 1e-12 * scale)
+    coef = coef[:nonzero[-1] + 1]
+    if len(coef) < 2: return zeros(0)
+    roots = polyroots(coef)
+    roots = roots[fabs(roots.imag) < 1e-8].real
+    return roots[(roots >= -1e-10) & (roots <= 1 + 1e-10)].clip(0, 1)
+
+def _stationary_polynomials(curve: List[ndarray], p: ndarray) -> ndarray:
+    """Returns the coefficients (Q, 2 * degree) of dot(B'(t), B(t) - p) for each point p (Q, 3)"""
+    curve = asarray(curve, dtype=double)
+    degree = curve.shape[0] - 1
+    a = dot(_power_matrix(degree), curve)
+    da = a[1:] * arange(1, degree + 1)[:, None]
+    out = zeros((p.shape[0], 2 * degree))
+    for i in range(degree):
+        out[:, i:i + degree + 1] += dot(a, da[i])
+        out[:, i] -= dot(p, da[i])
+    return out
+
+def find_plane_intersections(curve: List[ndarray], p: ndarray) -> ndarray:
+    """Returns, for each point p (Q, 3), the parameter where the plane through p normal to the Bezier curve cuts the curve"""
+
+    p = asarray(p, dtype=double)
+    curve = asarray(curve, dtype=double)
+    degree = curve.shape[0] - 1
+    out = zeros(p.shape[0])
+
+    for i, coef in enumerate(_stationary_polynomials(curve, p)):
+
+        t = _real_roots(coef)
+
+        # Outside the curve the plane is the closest one
+        if len(t) == 0: t = array([0., 1.])
+
+        v = p[i] - dot(bernstein(degree, t), curve)
+        der = dot(bernstein_derivative(degree, t), curve)
+        cos = fabs(einsum('ni,ni->n', vector.unary_array(v), vector.unary_array(der)))
+        dist = einsum('ni,ni->n', v, v)
+        out[i] = t[lexsort((dist, cos.round(8)))[0]]
+
+    return out
+
+def find_plane_intersection(curve: List[ndarray], p: ndarray) -> Any:
+    """Finds the intersection between the Bezier curve and a plane with p beeing a point in the plane. With (N, 3)
+    arrays of N curves and points it returns the parameters (N, 1), solving one curve at a time"""
+    p = asarray(p, dtype=double)
+    if p.ndim == 1:
+        return find_plane_intersections(curve, p[None, :])[0]
+    curves = stack([asarray(c, dtype=double) for c in curve], axis=1)
+    return array([find_plane_intersections(curves[i], p[i:i + 1])[0] for i in range(p.shape[0])])[:, None]
+
+def closest_points(curve: List[ndarray], p: ndarray) -> List[ndarray]:
+    """Returns the parameters (Q,) and the distances (Q,) of the points of the Bezier curve closest to each point p (Q, 3)"""
+
+    p = asarray(p, dtype=double)
+    curve = asarray(curve, dtype=double)
+    degree = curve.shape[0] - 1
+    t_out, dist_out = zeros(p.shape[0]), zeros(p.shape[0])
+
+    for i, coef in enumerate(_stationary_polynomials(curve, p)):
+        t = concatenate((_real_roots(coef), [0., 1.]))
+        v = dot(bernstein(degree, t), curve) - p[i]
+        dist = einsum('ni,ni->n', v, v)
+        j = argmin(dist)
+        t_out[i], dist_out[i] = t[j], dist[j] ** 0.5
+
+    return [t_out, dist_out]
 
 def point_is_contained(curve: List[ndarray], p: ndarray) -> float:
-
-    def func(x, *args):
-        f, p, curve = args
-        pCurve = f(curve, x)
-        return (pCurve[0] - p[0]) ** 2 + (pCurve[1] - p[1]) ** 2 + (pCurve[2] - p[2]) ** 2
-    
-    f = cubic if len(curve) == 4 else quadratic
-    sol = minimize_scalar(func, method='bounded', bounds=(0, 1), args=(f, p, curve))
-
-    pCurve = f(curve, sol.x)
-
-    dist = ((pCurve[0] - p[0]) ** 2 + (pCurve[1] - p[1]) ** 2 + (pCurve[2] - p[2]) ** 2) ** 0.5
-    
-    return dist
\ No newline at end of file
+    """Returns the distance between p and the Bezier curve"""
+    return closest_points(curve, asarray(p)[None, :])[1][0]
@@ -1,25 +1,15 @@
 from math import acos
-from numpy import cross, deg2rad, dot, linspace, zeros, ndarray
-from scipy.optimize import minimize
-from scipy.spatial.transform import Rotation as R
+from numpy import cross, dot, linspace, ndarray
 
 from pybird.modules.geo.utils import vector
 
 def find_center(v1: ndarray, v2: ndarray, v3: ndarray) -> ndarray:
-
-    def func(x, *args):
-        v1, v2, v3 = args
-
-        n1 = ((v1[0] - x[0]) ** 2 + (v1[1] - x[1]) ** 2 + (v1[2] - x[2]) ** 2) ** 0.5
-        n2 = ((v2[0] - x[0]) ** 2 + (v2[1] - x[1]) ** 2 + (v2[2] - x[2]) ** 2) ** 0.5
-        n3 = ((v3[0] - x[0]) ** 2 + (v3[1] - x[1]) ** 2 + (v3[2] - x[2]) ** 2) ** 0.5
-
-        return (n1 - n2) ** 2 + (n1 - n3) ** 2 + (n2 - n3) ** 2
-    
-    x0 = (v1 + v2 + v3) / 3
-    sol = minimize(func, (x0[0], x0[1], x0[2]), args=(v1, v2, v3))
-
-    return sol.x
+    """Returns the circumcenter of three points. Raises ValueError if they are (nearly) collinear"""
+    a, b = v1 - v3, v2 - v3
+    n = cross(a, b)
+    if dot(n, n) <= 1e-24 * dot(a, a) * dot(b, b):
+        raise ValueError('the points are collinear and have no circumcenter')
+    return v3 + cross(dot(a, a) * b - dot(b, b) * a, n) / (2 * dot(n, n))
 
 def circle_arc(center: ndarray, v1: ndarray, v2: ndarray, n: int, removeEdges: bool = True) -> ndarray:
 
@@ -32,11 +22,7 @@ def circle_arc(center: ndarray, v1: ndarray, v2: ndarray, n: int, removeEdges: b
 
     angles = linspace(0, angle, num=n)
 
-    curve = zeros((n, 3))
-
-    for i in range(n):
-        rot = R.from_rotvec(angles[i] * normal)
-        curve[i, :] = center + rot.apply(c1)
+    curve = center + vector.rotate(c1, angles[:, None] * normal)
             
     if removeEdges:
         return curve[1:n - 1]
@@ -1,4 +1,5 @@
-from numpy import asarray, gradient, linspace, zeros, ndarray
+from typing import List
+from numpy import asarray, column_stack, gradient, linspace, zeros, ndarray
 from scipy.interpolate import splprep, splev
 from scipy.integrate import simpson
 
@@ -10,6 +11,12 @@ def interpolate_2D(points: ndarray, n: int) -> ndarray:
     new_points[:, 0], new_points[:, 1] = asarray(list(tulple_points[0])), asarray(list(tulple_points[1]))
     return new_points
 
+def interpolate_2D_many(curves: List[ndarray], n: int) -> List[ndarray]:
+    """Resamples several curves with n points each, sharing the parameter samples (each spline is still fitted and evaluated on its own)"""
+    u = linspace(0, 1, num=n)
+    tcks = [splprep([points[:, 0], points[:, 1]], s=0)[0] for points in curves]
+    return [column_stack(splev(u, tck)) for tck in tcks]
+
 def interpolate_3D(points: ndarray, n: int) -> ndarray:
     tck, _ = splprep([points[:, 0], points[:, 1], points[:, 2]], s=0)
     u = linspace(0, 1, num=n)
@@ -0,0 +1,162 @@
+from collections import OrderedDict
+from hashlib import sha1
+from os import fdopen, makedirs, path, remove, replace, stat
+from tempfile import mkstemp
+from threading import RLock
+from typing import NamedTuple, Union
+from numpy import argmax, array, cross, dot, flip, load as np_load, loadtxt, savez, ndarray
+
+from pybird.modules.geo.utils import vector
+from pybird.modules.geo.utils.curve import interpolate_2D, interpolate_2D_many
+
+class Surfaces(NamedTuple):
+    upper: ndarray     # (2,) upper split point
+    lower: ndarray     # (2,) lower split point
+    upper1: ndarray    # (n, 2) upper surface, from the split point to the leading edge
+    lower1: ndarray    # (n, 2) lower surface, from the split point to the leading edge
+    upper2: ndarray    # (n, 2) upper surface, from the split point to the trailing edge
+    lower2: ndarray    # (n, 2) lower surface, from the split point to the trailing edge
+
+class Foil(NamedTuple):
+    points: ndarray    # (n, 2) foil, unit chord, trailing edge at the origin and leading edge at x = 1
+    index1: int        # upper surface split
+    index2: int        # leading edge
+    index4: int        # lower surface split
+    x: ndarray         # chord direction
+    z: ndarray         # thickness direction
+
+_max_size = 32
+_cache_dir = None
+_cache = OrderedDict()
+_lock = RLock()
+
+def set_cache(max_size: int = 32, directory: Union[str, None] = None) -> None:
+    """Sets the number of foils kept in memory and the directory used to persist them (None disables the disk cache)"""
+    global _max_size, _cache_dir
+    assert max_size > 0
+    with _lock:
+        _max_size = max_size
+        _cache_dir = directory
+        while len(_cache) > _max_size:
+            _cache.popitem(last=False)
+    return
+
+def clear_cache() -> None:
+    """Removes all foils from the memory cache"""
+    with _lock:
+        _cache.clear()
+    return
+
+def _key(file: str, n: int) -> tuple:
+    file = path.abspath(file)
+    info = stat(file)
+    return (file, info.st_mtime_ns, info.st_size, n)
+
+def _process(file: str, n: int) -> Foil:
+
+    foil = interpolate_2D(loadtxt(file), n)
+
+    # Scale and center foil
+    scale = 1 / (max(foil[:, 0]) - min(foil[:, 0]))
+    foil[:, 0], foil[:, 1] = -foil[:, 0] * scale, foil[:, 1] * scale
+    foil[:, 0], foil[:, 1] = foil[:, 0] - foil[0, 0],  foil[:, 1] - foil[0, 1]
+
+    # Find leading edge index
+    index2 = int(argmax(foil[:, 0]))
+    index1 = round(index2 / 2)
+    index4 = 3 * index1
+
+    # Foil system
+    x = vector.unary(foil[index2, :] - foil[0, :])
+    z = vector.unary(cross(array([0, 0, 1]), array([x[0], x[1], 0])))[:2]
+
+    return Foil(foil, index1, index2, index4, x, z)
+
+def _disk_file(key: tuple) -> str:
+    return path.join(_cache_dir, 'foil-{}.npz'.format(sha1(repr(key).encode()).hexdigest()))
+
+def _load_disk(key: tuple) -> Union[Foil, None]:
+    if _cache_dir is None: return None
+    file = _disk_file(key)
+    if not path.exists(file): return None
+    try:
+        with np_load(file) as data:
+            index = data['index']
+            return Foil(data['points'], int(index[0]), int(index[1]), int(index[2]), data['x'], data['z'])
+    except Exception:
+        return None
+
+def _save_disk(key: tuple, foil: Foil) -> None:
+    if _cache_dir is None: return
+    makedirs(_cache_dir, exist_ok=True)
+    file = _disk_file(key)
+
+    # Each writer uses its own temporary file, the last replace wins
+    fd, tmp = mkstemp(dir=_cache_dir, suffix='.npz')
+    try:
+        with fdopen(fd, 'wb') as f:
+            savez(f, points=foil.points, index=array([foil.index1, foil.index2, foil.index4]), x=foil.x, z=foil.z)
+        replace(tmp, file)
+    except FileNotFoundError:
+        pass
+    finally:
+        if path.exists(tmp): remove(tmp)
+
+    return
+
+def load(file: str, n: int = 400) -> Foil:
+    """Returns the foil resampled with n points. Foils are cached by path and modification time, the returned arrays are read-only"""
+
+    key = _key(file, n)
+
+    with _lock:
+        foil = _cache.get(key)
+        if foil is not None:
+            _cache.move_to_end(key)
+            return foil
+
+    foil = _load_disk(key)
+    if foil is None:
+        foil = _process(file, n)
+        _save_disk(key, foil)
+
+    for arr in (foil.points, foil.x, foil.z):
+        arr.setflags(write=False)
+
+    with _lock:
+        _cache[key] = foil
+        while len(_cache) > _max_size:
+            _cache.popitem(last=False)
+
+    return foil
+
+def surfaces(file: str, n_foil: int, n: int) -> Surfaces:
+    """Returns the split points and the four surfaces of the foil, resampled with n points and written in the foil system (x, z).
+
+    Since a section is placed by a similarity transformation and the spline interpolation does not depend on it, the surfaces can be
+    resampled once per foil and then placed by a matrix product."""
+
+    key = _key(file, n_foil) + ('surfaces', n)
+
+    with _lock:
+        data = _cache.get(key)
+        if data is not None:
+            _cache.move_to_end(key)
+            return data
+
+    foil = load(file, n_foil)
+    coords = dot(foil.points, array([foil.x, foil.z]).T)
+
+    index1, index2, index4 = foil.index1, foil.index2, foil.index4
+    upper2, upper1, lower1, lower2 = interpolate_2D_many([coords[:index1 + 1], coords[index1:index2 + 1], coords[index2:index4 + 1], coords[index4:]], n + 2)
+
+    data = Surfaces(coords[index1], coords[index4], upper1[1:n + 1], flip(lower1[1:n + 1], axis=0), upper2[1:n + 1], flip(lower2[1:n + 1], axis=0))
+    for arr in data:
+        arr.setflags(write=False)
+
+    with _lock:
+        _cache[key] = data
+        while len(_cache) > _max_size:
+            _cache.popitem(last=False)
+
+    return data
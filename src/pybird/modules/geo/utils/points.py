@@ -1,8 +1,6 @@
-from math import cos, fabs
-from typing import List
-from numpy import cross, deg2rad, dot, linspace, zeros, ndarray
-from numpy.linalg import norm
-from scipy.spatial.transform import Rotation as R
+from math import cos
+from typing import Any, List
+from numpy import cos as np_cos, cross, deg2rad, dot, fabs, linspace, ndim, where, zeros, ndarray
 
 from pybird.models.wing_model import WingModel
 from pybird.models.body_model import BodyModel
@@ -29,28 +27,33 @@ def p0(wing: WingModel, system: WingSystem) -> ndarray:
     p = wing.l0 * system.y0
     return p
 
-def p1(wing: WingModel, system: WingSystem, p0: ndarray, isLeft: bool) -> ndarray:
+def _rotate(v: ndarray, theta: Any, axis: ndarray, skip: Any) -> ndarray:
+    """Rotates v by theta (degrees) about axis, unless skip is True. theta and skip can be (N, 1) arrays"""
+    if ndim(theta) == 0:
+        return v if skip else dot(vector.rotation_matrix(deg2rad(theta) * axis), v)
+    return vector.transform(vector.rotation_matrix(deg2rad(where(skip, 0, theta)) * axis), v)
+
+def _root_vector(wing: WingModel, system: WingSystem, v: ndarray, isLeft: bool) -> ndarray:
 
     x, y, z = system.x0, system.y0, system.z0
-    v = wing.h1 * system.x0
-    
-    if not (-1e-8 < wing.thetaRootZ < 1e-8):
-        r1 = R.from_rotvec(deg2rad(wing.thetaRootZ) * z)
-        v = r1.apply(v)
-        x = r1.apply(x)
-        y = r1.apply(y)
-
-    if not (-1e-8 < wing.theta2_e if isLeft else wing.theta2_d < 1e-8):
-        r2 = R.from_rotvec(-deg2rad(wing.theta2_e if isLeft else wing.theta2_d) * x)
-        v = r2.apply(v)
-        y = r2.apply(y)
-
-    if not (-1e-8 < wing.thetaRootY < 1e-8):
-        r3 = R.from_rotvec(-deg2rad(wing.thetaRootY) * y)
-        v = r3.apply(v)
-    
-    p = p0 + v
-    
+
+    skip = (-1e-8 < wing.thetaRootZ) & (wing.thetaRootZ < 1e-8)
+    v = _rotate(v, wing.thetaRootZ, z, skip)
+    x = _rotate(x, wing.thetaRootZ, z, skip)
+    y = _rotate(y, wing.thetaRootZ, z, skip)
+
+    theta2 = wing.theta2_e if isLeft else wing.theta2_d
+    skip = (-1e-8 < theta2) if isLeft else (theta2 < 1e-8)
+    v = _rotate(v, -theta2, x, skip)
+    y = _rotate(y, -theta2, x, skip)
+
+    skip = (-1e-8 < wing.thetaRootY) & (wing.thetaRootY < 1e-8)
+    v = _rotate(v, -wing.thetaRootY, y, skip)
+
+    return v
+
+def p1(wing: WingModel, system: WingSystem, p0: ndarray, isLeft: bool) -> ndarray:
+    p = p0 + _root_vector(wing, system, wing.h1 * system.x0, isLeft)
     return p
 
 def p2(p1: ndarray, aux1: ndarray, p3Line: ndarray) -> ndarray:
@@ -96,12 +99,12 @@ def p10_11_aux(wing: WingModel, system: WingSystem, p4: ndarray, p3: ndarray) ->
     return p
 
 def p10(wing: WingModel, p10_11_aux: ndarray, p7: ndarray, aux3: ndarray) -> ndarray:
-    t = wing.h2 / norm(p7 - p10_11_aux)
+    t = wing.h2 / vector.length(p7 - p10_11_aux)
     p = bezier.quadratic([p10_11_aux, aux3, p7], t)
     return p
 
 def p11(wing: WingModel, p10_11_aux: ndarray, p13: ndarray, aux4: ndarray) -> ndarray:
-    t = wing.h2 / norm(p13 - p10_11_aux)
+    t = wing.h2 / vector.length(p13 - p10_11_aux)
     p = bezier.quadratic([p10_11_aux, aux4, p13], t)
     return p
 
@@ -110,35 +113,15 @@ def p12(p11: ndarray, aux4: ndarray, p13: ndarray) -> ndarray:
     return p
 
 def p13(wing: WingModel, system: WingSystem, p0: ndarray, isLeft: bool) -> ndarray:
-    
-    x, y, z = system.x0, system.y0, system.z0
-    v = -wing.h7 * x
-
-    if not (-1e-8 < wing.thetaRootZ < 1e-8):
-        r1 = R.from_rotvec(deg2rad(wing.thetaRootZ) * z)
-        v = r1.apply(v)
-        x = r1.apply(x)
-        y = r1.apply(y)
-    
-    if not (-1e-8 < wing.theta2_e if isLeft else wing.theta2_d < 1e-8):
-        r2 = R.from_rotvec(-deg2rad(wing.theta2_e if isLeft else wing.theta2_d) * x)
-        v = r2.apply(v)
-        y = r2.apply(y)
-    
-    if not (-1e-8 < wing.thetaRootY < 1e-8):
-        r3 = R.from_rotvec(-deg2rad(wing.thetaRootY) * y)
-        v = r3.apply(v)
-    
-    p = p0 + v
-    
+    p = p0 + _root_vector(wing, system, -wing.h7 * system.x0, isLeft)
     return p
 
 def aux1(wing: WingModel, system: WingSystem, l1: ndarray, p1: ndarray, p3: ndarray) -> ndarray:
-    p = l1 + wing.delta1 * (norm(cross(l1 - p1, l1 - p3)) / norm(p3 - p1)) * vector.unary(system.x1 + system.x2Base)
+    p = l1 + wing.delta1 * (vector.length(cross(l1 - p1, l1 - p3)) / vector.length(p3 - p1)) * vector.unary(system.x1 + system.x2Base)
     return p
 
 def aux2(wing: WingModel, system: WingSystem, p5: ndarray, p7: ndarray) -> ndarray:
-    p = p5 + wing.delta3 * dot(system.y3, p7 - p5) * system.y3
+    p = p5 + wing.delta3 * vector.inner(system.y3, p7 - p5) * system.y3
     return p
 
 def aux3(wing: WingModel, system: WingSystem, p7: ndarray, p10: ndarray) -> ndarray:
@@ -146,7 +129,7 @@ def aux3(wing: WingModel, system: WingSystem, p7: ndarray, p10: ndarray) -> ndar
     return p
 
 def aux4(wing: WingModel, system: WingSystem, p11: ndarray, p13: ndarray) -> ndarray:
-    p = 0.5 * (p11 + p13) + 0.5 * wing.delta6 * (p11 - p13) + wing.delta7 * norm(p11 - p13) * vector.unary(cross(system.z2Tip + system.z2Base, p11 - p13))
+    p = 0.5 * (p11 + p13) + 0.5 * wing.delta6 * (p11 - p13) + wing.delta7 * vector.length(p11 - p13) * vector.unary(cross(system.z2Tip + system.z2Base, p11 - p13))
     return p
 
 def c1(p1: ndarray, aux1: ndarray, p3Line: ndarray) -> ndarray:
@@ -155,20 +138,20 @@ def c1(p1: ndarray, aux1: ndarray, p3Line: ndarray) -> ndarray:
 
 def c2(wing: WingModel, p1: ndarray, p2: ndarray, p3: ndarray) -> ndarray:
     v = vector.unary(p3 - p1)
-    p = p2 + wing.delta1 * dot(p3 - p1, v) * v
+    p = p2 + wing.delta1 * vector.inner(p3 - p1, v) * v
     return p
 
 def c3(wing: WingModel, system: WingSystem, p2: ndarray, p3: ndarray, p4: ndarray) -> ndarray:
     v = -system.y2Tip
-    p = p3 + wing.delta1 * dot(p2 - p3, v) * v
+    p = p3 + wing.delta1 * vector.inner(p2 - p3, v) * v
     return p
 
 def c4(wing: WingModel, system: WingSystem, p3: ndarray, p4: ndarray) -> ndarray:
-    p = p3 + wing.delta2 * 0.5 * dot(p4 - p3, system.y2Tip) * system.y2Tip
+    p = p3 + wing.delta2 * 0.5 * vector.inner(p4 - p3, system.y2Tip) * system.y2Tip
     return p
 
 def c5(wing: WingModel, system: WingSystem, p3: ndarray, p4: ndarray) -> ndarray:
-    p = p4 + wing.delta2 * 0.5 * dot(p3 - p4, -system.y3) * (-system.y3)
+    p = p4 + wing.delta2 * 0.5 * vector.inner(p3 - p4, -system.y3) * (-system.y3)
     return p
 
 def c6_c7(p5: ndarray, aux2: ndarray, p7: ndarray, tmax: float) -> ndarray:
@@ -193,12 +176,12 @@ def c14_c15(p7: ndarray, aux3: ndarray, p10: ndarray, tmin: float) -> ndarray:
 
 def c16(wing: WingModel, p10: ndarray, p11: ndarray, c15: ndarray) -> ndarray:
     v = vector.unary(p10 - c15)
-    p = p10 + wing.delta2 * 0.5 * dot(p11 - p10, v) * v
+    p = p10 + wing.delta2 * 0.5 * vector.inner(p11 - p10, v) * v
     return p
 
 def c17(wing: WingModel, p10: ndarray, p11: ndarray, c18: ndarray) -> ndarray:
     v = vector.unary(p11 - c18)
-    p = p11 + wing.delta2 * 0.5 * dot(p10 - p11, v) * v
+    p = p11 + wing.delta2 * 0.5 * vector.inner(p10 - p11, v) * v
     return p
 
 def c18_c19(p11: ndarray, aux4: ndarray, p13: ndarray, tmax: float) -> ndarray:
@@ -209,20 +192,23 @@ def c20_c21(p11: ndarray, aux4: ndarray, p13: ndarray, tmin: float) -> ndarray:
     p = bezier.fit_curbic_curve([p11, aux4, p13], tmin, 1)
     return p
 
+def _cos(a: Any) -> Any:
+    return cos(a) if ndim(a) == 0 else np_cos(a)
+
 def p26(wing: WingModel, body: BodyModel, system: BaseSystem) -> ndarray:
-    p = (wing.h1 * cos(wing.thetaRootZ * deg2RadConst) + body.h8) * system.x0 + body.h9 * system.y0
+    p = (wing.h1 * _cos(wing.thetaRootZ * deg2RadConst) + body.h8) * system.x0 + body.h9 * system.y0
     return p
 
 def p27(wing: WingModel, body: BodyModel, system: BaseSystem) -> ndarray:
-    p = - (wing.h7 * cos(wing.thetaRootZ * deg2RadConst) + body.h10) * system.x0 + body.h11 * system.y0
+    p = - (wing.h7 * _cos(wing.thetaRootZ * deg2RadConst) + body.h10) * system.x0 + body.h11 * system.y0
     return p
 
 def p28(wing: WingModel, body: BodyModel, system: BaseSystem) -> ndarray:
-    p = (wing.h1 * cos(wing.thetaRootZ * deg2RadConst) + body.h8) * system.x0 + body.h9 * system.z0
+    p = (wing.h1 * _cos(wing.thetaRootZ * deg2RadConst) + body.h8) * system.x0 + body.h9 * system.z0
     return p
 
 def p29(wing: WingModel, body: BodyModel, system: BaseSystem) -> ndarray:
-    p = wing.h1 * cos(wing.thetaRootZ * deg2RadConst) * system.x0 + body.h12 * system.z0
+    p = wing.h1 * _cos(wing.thetaRootZ * deg2RadConst) * system.x0 + body.h12 * system.z0
     return p
 
 def p30(p29: ndarray, aux5: ndarray, aux6: ndarray, p31: ndarray, p14) -> List:
@@ -233,19 +219,19 @@ def p30(p29: ndarray, aux5: ndarray, aux6: ndarray, p31: ndarray, p14) -> List:
     return p, t30
 
 def p31(wing: WingModel, body: BodyModel, system: BaseSystem) -> ndarray:
-    p = - wing.h7 * cos(wing.thetaRootZ * deg2RadConst) * system.x0 + body.h13 * system.z0
+    p = - wing.h7 * _cos(wing.thetaRootZ * deg2RadConst) * system.x0 + body.h13 * system.z0
     return p
 
 def p32(wing: WingModel, body: BodyModel, system: BaseSystem) -> ndarray:
-    p = - (wing.h7 * cos(wing.thetaRootZ * deg2RadConst) + body.h10) * system.x0 + body.h14 * system.z0
+    p = - (wing.h7 * _cos(wing.thetaRootZ * deg2RadConst) + body.h10) * system.x0 + body.h14 * system.z0
     return p
 
 def p33(wing: WingModel, body: BodyModel, system: BaseSystem) -> ndarray:
-    p = (wing.h1 * cos(wing.thetaRootZ * deg2RadConst) + body.h8) * system.x0 - body.h9 * system.z0
+    p = (wing.h1 * _cos(wing.thetaRootZ * deg2RadConst) + body.h8) * system.x0 - body.h9 * system.z0
     return p
 
 def p34(wing: WingModel, body: BodyModel, system: BaseSystem) -> ndarray:
-    p = wing.h1 * cos(wing.thetaRootZ * deg2RadConst) * system.x0 - body.h16 * system.z0
+    p = wing.h1 * _cos(wing.thetaRootZ * deg2RadConst) * system.x0 - body.h16 * system.z0
     return p
 
 def p35(p34: ndarray, aux7: ndarray, aux8: ndarray, p36: ndarray, p14) -> List:
@@ -256,16 +242,16 @@ def p35(p34: ndarray, aux7: ndarray, aux8: ndarray, p36: ndarray, p14) -> List:
     return p, t35
 
 def p36(wing: WingModel, body: BodyModel, system: BaseSystem) -> ndarray:
-    p = - wing.h7 * cos(wing.thetaRootZ * deg2RadConst) * system.x0 - body.h15 * system.z0
+    p = - wing.h7 * _cos(wing.thetaRootZ * deg2RadConst) * system.x0 - body.h15 * system.z0
     return p
 
 def p37(wing: WingModel, body: BodyModel, system: BaseSystem) -> ndarray:
-    p = - (wing.h7 * cos(wing.thetaRootZ * deg2RadConst) + body.h10) * system.x0 - body.h14 * system.z0
+    p = - (wing.h7 * _cos(wing.thetaRootZ * deg2RadConst) + body.h10) * system.x0 - body.h14 * system.z0
     return p
 
 def _body_control_point(v1: ndarray, v2: ndarray, d1: float, d2: float, ax1: ndarray, ax2: ndarray, isFirst: bool) -> ndarray:
     mult = 1 if isFirst else 2
-    return v1 + mult * (v2 - v1) / 3 + vector.norm(v2 - v1) * (d1 * ax1 + d2 * ax2)
+    return v1 + mult * (v2 - v1) / 3 + vector.length(v2 - v1) * (d1 * ax1 + d2 * ax2)
 
 def c22(body: BodyModel, system: BaseSystem, p26: ndarray, p1: ndarray) -> ndarray:
     p = _body_control_point(p26, p1, body.delta11, body.delta12, system.x0, system.y0, True)
@@ -349,41 +335,41 @@ def c41(body: BodyModel, system: BaseSystem, p36: ndarray, p37: ndarray) -> ndar
 
 def c42(body: BodyModel, system: BaseSystem, p1: ndarray, p29: ndarray) -> ndarray:
     v = p29 - p1
-    ySize = fabs(dot(v, system.y0))
-    zSize = fabs(dot(v, system.z0))
+    ySize = fabs(vector.inner(v, system.y0))
+    zSize = fabs(vector.inner(v, system.z0))
     p = p29 + (ySize * body.delta41 * system.y0 - zSize * body.delta42 * system.z0)
     return p
 
 def c43(body: BodyModel, system: BaseSystem, p1: ndarray, p29: ndarray) -> ndarray:
     v = p29 - p1
-    ySize = fabs(dot(v, system.y0))
-    zSize = fabs(dot(v, system.z0))
+    ySize = fabs(vector.inner(v, system.y0))
+    zSize = fabs(vector.inner(v, system.z0))
     p = p1 + (-ySize * body.delta43 * system.y0 + zSize * body.delta44 * system.z0)
     return p
 
 def c44(body: BodyModel, system: BaseSystem, p1: ndarray, p34: ndarray) -> ndarray:
     v = p34 - p1
-    ySize = fabs(dot(v, system.y0))
-    zSize = fabs(dot(v, system.z0))
+    ySize = fabs(vector.inner(v, system.y0))
+    zSize = fabs(vector.inner(v, system.z0))
     p = p1 + (-ySize * body.delta45 * system.y0 - zSize * body.delta46 * system.z0)
     return p
 
 def c45(body: BodyModel, system: BaseSystem, p1: ndarray, p34: ndarray) -> ndarray:
     v = p34 - p1
-    ySize = fabs(dot(v, system.y0))
-    zSize = fabs(dot(v, system.z0))
+    ySize = fabs(vector.inner(v, system.y0))
+    zSize = fabs(vector.inner(v, system.z0))
     p = p34 + (ySize * body.delta47 * system.y0 + zSize * body.delta48 * system.z0)
     return p
 
 def c46_47_48_49(body: BodyModel, system: BaseSystem, p30: ndarray, p14: ndarray, p15: ndarray, p35: ndarray, t30: float) -> List[ndarray]:
     
     v = p30 - p14
-    ySize1 = fabs(dot(v, system.y0))
-    zSize1 = fabs(dot(v, system.z0))
+    ySize1 = fabs(vector.inner(v, system.y0))
+    zSize1 = fabs(vector.inner(v, system.z0))
 
     v = p35 - p15
-    ySize2 = fabs(dot(v, system.y0))
-    zSize2 = fabs(dot(v, system.z0))
+    ySize2 = fabs(vector.inner(v, system.y0))
+    zSize2 = fabs(vector.inner(v, system.z0))
 
     # 46
     c46 = p30 + (ySize1 * body.delta57 * system.y0 - zSize1 * body.delta58 * system.z0)
@@ -401,29 +387,29 @@ def c46_47_48_49(body: BodyModel, system: BaseSystem, p30: ndarray, p14: ndarray
 
 def c50(body: BodyModel, system: BaseSystem, p13: ndarray, p31: ndarray) -> ndarray:
     v = p31 - p13
-    ySize = fabs(dot(v, system.y0))
-    zSize = fabs(dot(v, system.z0))
+    ySize = fabs(vector.inner(v, system.y0))
+    zSize = fabs(vector.inner(v, system.z0))
     p = p31 + (ySize * body.delta49 * system.y0 - zSize * body.delta50 * system.z0)
     return p
 
 def c51(body: BodyModel, system: BaseSystem, p13: ndarray, p31: ndarray) -> ndarray:
     v = p31 - p13
-    ySize = fabs(dot(v, system.y0))
-    zSize = fabs(dot(v, system.z0))
+    ySize = fabs(vector.inner(v, system.y0))
+    zSize = fabs(vector.inner(v, system.z0))
     p = p13 + (-ySize * body.delta51 * system.y0 + zSize * body.delta52 * system.z0)
     return p
 
 def c52(body: BodyModel, system: BaseSystem, p13: ndarray, p36: ndarray) -> ndarray:
     v = p36 - p13
-    ySize = fabs(dot(v, system.y0))
-    zSize = fabs(dot(v, system.z0))
+    ySize = fabs(vector.inner(v, system.y0))
+    zSize = fabs(vector.inner(v, system.z0))
     p = p13 + (-ySize * body.delta53 * system.y0 - zSize * body.delta54 * system.z0)
     return p
 
 def c53(body: BodyModel, system: BaseSystem, p13: ndarray, p36: ndarray) -> ndarray:
     v = p36 - p13
-    ySize = fabs(dot(v, system.y0))
-    zSize = fabs(dot(v, system.z0))
+    ySize = fabs(vector.inner(v, system.y0))
+    zSize = fabs(vector.inner(v, system.z0))
     p = p36 + (ySize * body.delta55 * system.y0 + zSize * body.delta56 * system.z0)
     return p
 
@@ -496,7 +482,11 @@ def p47d(tail: TailModel, system: TailSystem, center: ndarray) -> ndarray:
     p = center + tail.h20 * system.x4 + tail.h22 * system.y4
     return p
 
-def p49e(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarray) -> ndarray:
+def tail_circle_center(tail: TailModel, system: TailSystem, center: ndarray) -> ndarray:
+    """Returns the center of the circle that contains the rounded tail edge"""
+    return circle.find_center(p51(tail, system, center), p47e(tail, system, center), p47d(tail, system, center))
+
+def p49e(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarray, circleCenter: ndarray = None) -> ndarray:
 
     v1 = p51(tail, system, center)
     v2e = p47e(tail, system, center)
@@ -504,12 +494,12 @@ def p49e(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarray)
 
     if tail.shape == TailShape.rounded:
 
-        circleCenter = circle.find_center(v1, v2e, v2d)
+        if circleCenter is None: circleCenter = tail_circle_center(tail, system, center)
         radius = vector.norm(v1 - circleCenter)
         angle = body.h11 / radius
         normal = vector.unary(cross(v1 - circleCenter, v2e - circleCenter))
-        rot = R.from_rotvec(angle * normal)
-        p = circleCenter + rot.apply(v1 - circleCenter)
+        rot = vector.rotation_matrix(angle * normal)
+        p = circleCenter + dot(rot, v1 - circleCenter)
 
     else:
         
@@ -518,7 +508,7 @@ def p49e(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarray)
 
     return p
 
-def p49d(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarray) -> ndarray:
+def p49d(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarray, circleCenter: ndarray = None) -> ndarray:
 
     v1 = p51(tail, system, center)
     v2e = p47e(tail, system, center)
@@ -526,12 +516,12 @@ def p49d(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarray)
 
     if tail.shape == TailShape.rounded:
 
-        circleCenter = circle.find_center(v1, v2e, v2d)
+        if circleCenter is None: circleCenter = tail_circle_center(tail, system, center)
         radius = vector.norm(v1 - circleCenter)
         angle = body.h11 / radius
         normal = vector.unary(cross(v1 - circleCenter, v2d - circleCenter))
-        rot = R.from_rotvec(angle * normal)
-        p = circleCenter + rot.apply(v1 - circleCenter)
+        rot = vector.rotation_matrix(angle * normal)
+        p = circleCenter + dot(rot, v1 - circleCenter)
 
     else:
 
@@ -548,19 +538,17 @@ def p46(p37: ndarray, p51: ndarray) -> ndarray:
     p =  0.5 * (p37 + p51)
     return p
 
-def curve82e(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarray, n: int) -> ndarray:
+def curve82e(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarray, n: int, circleCenter: ndarray = None) -> ndarray:
     
     v1 = p47e(tail, system, center)
-    v2 = p49e(body, tail, system, center)
+    v2 = p49e(body, tail, system, center, circleCenter)
 
     t = linspace(0, 1, num=n + 2)
     curve = zeros((n, 3))
 
     if tail.shape == TailShape.rounded:
 
-        v3 = p49d(body, tail, system, center)
-
-        circleCenter = circle.find_center(v1, v2, v3)
+        if circleCenter is None: circleCenter = tail_circle_center(tail, system, center)
         curve = circle.circle_arc(circleCenter, v1, v2, n + 2, removeEdges=True)
 
         return curve
@@ -576,19 +564,17 @@ def curve82e(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarr
 
         return curve
 
-def curve82d(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarray, n: int) -> ndarray:
+def curve82d(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarray, n: int, circleCenter: ndarray = None) -> ndarray:
 
     v1 = p47d(tail, system, center)
-    v2 = p49d(body, tail, system, center)
+    v2 = p49d(body, tail, system, center, circleCenter)
 
     t = linspace(0, 1, num=n + 2)
     curve = zeros((n, 3))
 
     if tail.shape == TailShape.rounded:
 
-        v3 = p49e(body, tail, system, center)
-
-        circleCenter = circle.find_center(v1, v2, v3)
+        if circleCenter is None: circleCenter = tail_circle_center(tail, system, center)
         curve = circle.circle_arc(circleCenter, v1, v2, n + 2, removeEdges=True)
 
         return curve
@@ -604,9 +590,9 @@ def curve82d(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarr
 
         return curve
 
-def curve83e(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarray, n: int) -> ndarray:
+def curve83e(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarray, n: int, circleCenter: ndarray = None) -> ndarray:
     
-    v1 = p49e(body, tail, system, center)
+    v1 = p49e(body, tail, system, center, circleCenter)
     v2 = p51(tail, system, center)
 
     t = linspace(0, 1, num=n + 2)
@@ -614,9 +600,7 @@ def curve83e(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarr
 
     if tail.shape == TailShape.rounded:
 
-        v3 = p49d(body, tail, system, center)
-
-        circleCenter = circle.find_center(v1, v2, v3)
+        if circleCenter is None: circleCenter = tail_circle_center(tail, system, center)
         curve = circle.circle_arc(circleCenter, v1, v2, n + 2, removeEdges=True)
 
         return curve
@@ -632,9 +616,9 @@ def curve83e(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarr
 
         return curve
 
-def curve83d(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarray, n: int) -> ndarray:
+def curve83d(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarray, n: int, circleCenter: ndarray = None) -> ndarray:
 
-    v1 = p49d(body, tail, system, center)
+    v1 = p49d(body, tail, system, center, circleCenter)
     v2 = p51(tail, system, center)
 
     t = linspace(0, 1, num=n + 2)
@@ -642,9 +626,7 @@ def curve83d(body: BodyModel, tail: TailModel, system: TailSystem, center: ndarr
 
     if tail.shape == TailShape.rounded:
 
-        v3 = p49e(body, tail, system, center)
-
-        circleCenter = circle.find_center(v1, v2, v3)
+        if circleCenter is None: circleCenter = tail_circle_center(tail, system, center)
         curve = circle.circle_arc(circleCenter, v1, v2, n + 2, removeEdges=True)
 
         return curve
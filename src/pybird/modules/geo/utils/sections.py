@@ -1,42 +1,30 @@
 from typing import List
-from numpy import argmax, array, cross, dot, flip, loadtxt, zeros, ndarray
+from numpy import array, asarray, dot, einsum, fabs, flatnonzero, flip, ndarray
 from numpy.linalg import norm
 
 from pybird.modules.geo.utils import vector
-from pybird.modules.geo.utils.curve import interpolate_2D, interpolate_3D
+from pybird.modules.geo.utils import foils
+from pybird.modules.geo.utils.curve import interpolate_3D
 
-def process_section(file: str, v1: ndarray, v2: ndarray, x: ndarray, z: ndarray, n: int) -> List:
-
-    nFoil = 400
-
-    # Load airfoil
-    foil = interpolate_2D(loadtxt(file), nFoil)
-
-    # Scale and center foil
-    scale = 1 / (max(foil[:, 0]) - min(foil[:, 0]))
-    foil[:, 0], foil[:, 1] = -foil[:, 0] * scale, foil[:, 1] * scale
-    foil[:, 0], foil[:, 1] = foil[:, 0] - foil[0, 0],  foil[:, 1] - foil[0, 1]
+nFoil = 400
 
-    # Align foil
+def _frame(v1: ndarray, v2: ndarray, x: ndarray, z: ndarray) -> ndarray:
+    """Returns the (2, 3) matrix that maps the foil system to the section"""
     chord = norm(v1 - v2)
     xAux = vector.unary(v1 - v2)
     rotData = vector.angle(x, xAux)
     x = xAux * chord
     z = vector.unary(vector.rot(z, rotData[0], rotData[1])) * chord
+    return array([x, z])
 
-    # Find leading edge index
-    index2 = argmax(foil[:, 0])
-    index1 = round(index2 / 2)
-    index4 = 3 * index1
+def _process_section_splines(file: str, frame: ndarray, v2: ndarray, n: int) -> List:
+    """Resamples each surface after the placement. Only used when the section system is not orthogonal"""
 
-    # Create curve
-    curve = zeros((nFoil, 3))
-    xCurve = vector.unary(foil[index2, :] - foil[0, :])
-    zCurve = vector.unary(cross(array([0, 0, 1]), array([xCurve[0], xCurve[1], 0])))[:2]
+    foil = foils.load(file, nFoil)
+    index1, index2, index4 = foil.index1, foil.index2, foil.index4
 
-    for i in range(nFoil):
-        vec = foil[i, :]
-        curve[i, :] = x * dot(vec, xCurve) + z * dot(vec, zCurve) + v2
+    # Create curve
+    curve = dot(dot(foil.points, array([foil.x, foil.z]).T), frame) + v2
 
     # Separate curves and points
     pUpper = curve[index1, :]
@@ -47,4 +35,28 @@ def process_section(file: str, v1: ndarray, v2: ndarray, x: ndarray, z: ndarray,
     lowerSurface1 = flip(interpolate_3D(curve[index2:index4 + 1, :], n + 2)[1:n + 1], axis=0)
     lowerSurface2 = flip(interpolate_3D(curve[index4:, :], n + 2)[1:n + 1], axis=0)
 
-    return pUpper, pLower, upperSurface1, lowerSurface1, upperSurface2, lowerSurface2
\ No newline at end of file
+    return pUpper, pLower, upperSurface1, lowerSurface1, upperSurface2, lowerSurface2
+
+def process_sections(file: str, v1: ndarray, v2: ndarray, x: ndarray, z: ndarray, n: int) -> List:
+    """Places the same foil in K sections. v1, v2, x and z have shape (K, 3) and each output has a leading K axis"""
+
+    v1, v2, x, z = asarray(v1), asarray(v2), asarray(x), asarray(z)
+    frames = array([_frame(v1[k], v2[k], x[k], z[k]) for k in range(v1.shape[0])])
+
+    surfaces = foils.surfaces(file, nFoil, n)
+
+    pUpper = einsum('i,kij->kj', surfaces.upper, frames) + v2
+    pLower = einsum('i,kij->kj', surfaces.lower, frames) + v2
+    upperSurface1, lowerSurface1, upperSurface2, lowerSurface2 = [einsum('ni,kij->knj', surface, frames) + v2[:, None, :] for surface in surfaces[2:]]
+
+    out = [pUpper, pLower, upperSurface1, lowerSurface1, upperSurface2, lowerSurface2]
+
+    # The surfaces resampled in the foil system are only valid for orthogonal systems
+    for k in flatnonzero(fabs(einsum('ki,ki->k', frames[:, 0], frames[:, 1])) > 1e-8 * einsum('ki,ki->k', frames[:, 0], frames[:, 0])):
+        for arr, value in zip(out, _process_section_splines(file, frames[k], v2[k], n)):
+            arr[k] = value
+
+    return out
+
+def process_section(file: str, v1: ndarray, v2: ndarray, x: ndarray, z: ndarray, n: int) -> List:
+    return [out[0] for out in process_sections(file, array([v1]), array([v2]), array([x]), array([z]), n)]
@@ -1,52 +1,53 @@
-from matplotlib.pyplot import axis
-from numpy import cross, dot, linspace, zeros, ndarray
+from numpy import arange, asarray, cross, deg2rad, dot, einsum, linspace, where, zeros, ndarray
 
 from pybird.modules.geo.utils import vector
 
-def interpolate_curve(p1: ndarray, p2: ndarray, left: ndarray, right: ndarray) -> ndarray:
-    """Interpolate a curve at a given index from bottom to top, using left and right as bounds"""
+def interpolate_curves(p1: ndarray, p2: ndarray, left: ndarray, right: ndarray) -> ndarray:
+    """Interpolate K curves from bottom to top sharing the same bounds. p1 and p2 have shape (K, 3) and the output (K, nSide - 2, 3)"""
+
+    p1, p2 = asarray(p1), asarray(p2)
 
     # Bottom and top base vectors
     nSide = len(left)
     start1, start2 = left[0, :], left[nSide - 1, :]
 
     x1 = vector.unary(right[0, :] - left[0, :])
-    y1 = vector.unary(cross(x1, p1 - start1))
-    z1 = vector.unary(cross(x1, y1))
+    y1 = vector.unary_array(cross(x1, p1 - start1))
+    z1 = vector.unary_array(cross(x1, y1))
 
     x2 = vector.unary(right[nSide - 1, :] - left[nSide - 1, :])
-    y2 = vector.unary(cross(x2, p2 - start2))
-    z2 = vector.unary(cross(x2, y2))
+    y2 = vector.unary_array(cross(x2, p2 - start2))
+    z2 = vector.unary_array(cross(x2, y2))
 
     # Index values
-    p1x, p1z = dot(p1 - start1, x1), dot(p1 - start1, z1)
-    p2x, p2z = dot(p2 - start2, x2), dot(p2 - start2, z2)
+    p1x, p1z = dot(p1 - start1, x1), einsum('ki,ki->k', p1 - start1, z1)
+    p2x, p2z = dot(p2 - start2, x2), einsum('ki,ki->k', p2 - start2, z2)
 
     # Find the angle to rotate z
     rotData = vector.angle(x1, x2)
     zAux = vector.rot(z1, rotData[0], rotData[1])
-    zAngle, axis = vector.angle(zAux, z2)
-    rotSign = 1 if dot(axis, x2) > 0 else -1
+    zAngle, axis = vector.angle_array(zAux, z2)
+    rotSign = where(dot(axis, x2) > 0, 1, -1)
 
-    # Output
+    # Section base vectors
     nPoints = nSide - 2
-    points = zeros((nPoints, 3))
+    i1 = arange(1, nPoints + 1) / nPoints
+    i2 = 1 - i1
 
-    for i in range(nPoints):
+    x = vector.unary_array(right[1:nSide - 1, :] - left[1:nSide - 1, :])
+    theta, axis = vector.angle_array(x1, x)
+    zAux = einsum('nij,kj->kni', vector.rotation_matrix(deg2rad(theta)[:, None] * axis), z1)
+    z = vector.rotate(zAux, deg2rad(zAngle * rotSign)[:, None, None] * i1[None, :, None] * x[None, :, :])
 
-        i1 = ((i + 1) / (nPoints))
-        i2 = (1 - i1)
+    # Output
+    cx = i2 * p1x[:, None] + i1 * p2x[:, None]
+    cz = i2 * p1z[:, None] + i1 * p2z[:, None]
 
-        # Section base vectors
-        x = vector.unary(right[i + 1, :] - left[i + 1, :])
-        rotData = vector.angle(x1, x)
-        zAux = vector.rot(z1, rotData[0], rotData[1])
-        z = vector.rot(zAux, zAngle * i1, rotSign * x)
+    return cx[:, :, None] * x + cz[:, :, None] * z + left[1:nSide - 1, :]
 
-        # Save
-        points[i, :] = i2 * (p1x * x + p1z * z) + i1 * (p2x * x + p2z * z) + left[i + 1, :]
-    
-    return points
+def interpolate_curve(p1: ndarray, p2: ndarray, left: ndarray, right: ndarray) -> ndarray:
+    """Interpolate a curve at a given index from bottom to top, using left and right as bounds"""
+    return interpolate_curves(p1[None, :], p2[None, :], left, right)[0]
 
 def interpolate_tip_curve(p1: ndarray, p2: ndarray) -> ndarray:
     """Interpolate a curve at a given index from bottom to top, using left and right as bounds"""
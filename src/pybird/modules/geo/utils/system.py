@@ -1,5 +1,6 @@
-from numpy import array, copy, deg2rad, ndarray
-from scipy.spatial.transform import Rotation as R
+from numpy import array, copy, deg2rad, dot, ndarray
+
+from pybird.modules.geo.utils import vector
 
 class BaseSystem:
 
@@ -10,7 +11,7 @@ class BaseSystem:
         return
 
 class WingSystem:
-    """Contains the base vectors of each section"""
+    """Contains the base vectors of each section. The angles can be (N, 1) arrays, one per design, and then the vectors are (N, 3) arrays"""
 
     def __init__(self, thetaRootY: float,
                        theta1: float,
@@ -49,19 +50,19 @@ class WingSystem:
         x1, y1, z1 = copy(self.x0), copy(self.y0), copy(self.z0)
 
         # Rotate about -y1
-        r = R.from_rotvec(-deg2rad(self._thetaRootY + self._theta1) * y1)
-        x1 = r.apply(x1)
-        z1 = r.apply(z1)
+        r = vector.rotation_matrix(-deg2rad(self._thetaRootY + self._theta1) * y1)
+        x1 = vector.transform(r, x1)
+        z1 = vector.transform(r, z1)
 
         # Rotate about x1
-        r = R.from_rotvec(deg2rad(self._theta2) * x1)
-        y1 = r.apply(y1)
-        z1 = r.apply(z1)
+        r = vector.rotation_matrix(deg2rad(self._theta2) * x1)
+        y1 = vector.transform(r, y1)
+        z1 = vector.transform(r, z1)
 
         # Rotate about z1
-        r = R.from_rotvec(deg2rad(self._theta3) * z1)
-        x1 = r.apply(x1)
-        y1 = r.apply(y1)
+        r = vector.rotation_matrix(deg2rad(self._theta3) * z1)
+        x1 = vector.transform(r, x1)
+        y1 = vector.transform(r, y1)
 
         # Save
         self.x1 = x1
@@ -76,16 +77,16 @@ class WingSystem:
         x2Base, y2Base, z2Base = copy(self.x1), copy(self.y1), copy(self.z1)
 
         # Rotate about z2
-        r = R.from_rotvec(-deg2rad(self._theta4) * z2Base)
-        x2Base = r.apply(x2Base)
-        y2Base = r.apply(y2Base)
+        r = vector.rotation_matrix(-deg2rad(self._theta4) * z2Base)
+        x2Base = vector.transform(r, x2Base)
+        y2Base = vector.transform(r, y2Base)
 
         x2Tip, y2Tip, z2Tip = copy(x2Base), copy(y2Base), copy(z2Base)
 
         # Rotate about y2
-        r = R.from_rotvec(-deg2rad(self._theta5) * y2Tip)
-        x2Tip = r.apply(x2Tip)
-        z2Tip = r.apply(z2Tip)
+        r = vector.rotation_matrix(-deg2rad(self._theta5) * y2Tip)
+        x2Tip = vector.transform(r, x2Tip)
+        z2Tip = vector.transform(r, z2Tip)
 
         # Save
         self.x2Base = x2Base
@@ -103,14 +104,14 @@ class WingSystem:
         x3, y3, z3 = copy(self.x2Tip), copy(self.y2Tip), copy(self.z2Tip)
 
         # Rotate about x3
-        r = R.from_rotvec(-deg2rad(self._theta6) * x3)
-        y3 = r.apply(y3)
-        z3 = r.apply(z3)
+        r = vector.rotation_matrix(-deg2rad(self._theta6) * x3)
+        y3 = vector.transform(r, y3)
+        z3 = vector.transform(r, z3)
 
         # Rotate about z3
-        r = R.from_rotvec(deg2rad(self._theta7) * z3)
-        x3 = r.apply(x3)
-        y3 = r.apply(y3)
+        r = vector.rotation_matrix(deg2rad(self._theta7) * z3)
+        x3 = vector.transform(r, x3)
+        y3 = vector.transform(r, y3)
 
         # Save
         self.x3 = x3
@@ -147,19 +148,19 @@ class TailSystem:
         x4, y4, z4 = copy(self.x0), copy(self.y0), copy(self.z0)
 
         # Rotate about x4
-        r = R.from_rotvec(deg2rad(self._theta8) * x4)
-        y4 = r.apply(y4)
-        z4 = r.apply(z4)
+        r = vector.rotation_matrix(deg2rad(self._theta8) * x4)
+        y4 = dot(r, y4)
+        z4 = dot(r, z4)
 
         # Rotate about y4
-        r = R.from_rotvec(deg2rad(self._theta9) * y4)
-        x4 = r.apply(x4)
-        z4 = r.apply(z4)
+        r = vector.rotation_matrix(deg2rad(self._theta9) * y4)
+        x4 = dot(r, x4)
+        z4 = dot(r, z4)
 
         # Rotate about z4
-        r = R.from_rotvec(deg2rad(self._theta10) * z4)
-        x4 = r.apply(x4)
-        y4 = r.apply(y4)
+        r = vector.rotation_matrix(deg2rad(self._theta10) * z4)
+        x4 = dot(r, x4)
+        y4 = dot(r, y4)
 
         # Save
         self.x4 = x4
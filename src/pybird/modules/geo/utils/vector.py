@@ -1,17 +1,33 @@
-from math import acos, fabs, pi
-from typing import List
-from numpy import cross, deg2rad, dot, zeros, ndarray
+from math import acos, cos, pi, sin, sqrt
+from typing import Any, List
+from numpy import arccos, array, asarray, clip, cos as np_cos, cross, dot, double, einsum, eye, ndim, sin as np_sin, where, zeros, ndarray
 from numpy.linalg import norm
-from scipy.spatial.transform import Rotation as R
 
 def unary(a: ndarray) -> ndarray:
-    """Returns a unary vector"""
+    """Returns a unary vector, or the unary vectors of an array of vectors (..., 3)"""
+    if ndim(a) > 1: return unary_array(a)
     lenght = norm(a)
     if -1e-8 < lenght < 1e-8:
         return zeros(len(a))
     
     return a / lenght
 
+def unary_array(a: ndarray) -> ndarray:
+    """Returns the unary vectors of an array of vectors (..., 3)"""
+    lenght = norm(a, axis=-1)[..., None]
+    small = (-1e-8 < lenght) & (lenght < 1e-8)
+    return where(small, 0, a / where(small, 1, lenght))
+
+def inner(a: ndarray, b: ndarray) -> Any:
+    """Returns the dot product of two vectors. With arrays of vectors (..., 3) it returns the products of the rows, with shape (..., 1)"""
+    if ndim(a) == 1 and ndim(b) == 1: return dot(a, b)
+    return einsum('...i,...i->...', a, b)[..., None]
+
+def length(a: ndarray) -> Any:
+    """Returns the norm of a vector, or the norms (..., 1) of an array of vectors"""
+    if ndim(a) == 1: return norm(a)
+    return norm(a, axis=-1)[..., None]
+
 def angle(a: ndarray, b: ndarray) -> List:
     """Returns the angle between two Points and the vector responsible to rotate a to b"""
     a = unary(a)
@@ -23,6 +39,56 @@ def angle(a: ndarray, b: ndarray) -> List:
     axis = unary(cross(a, b))
     return [theta, axis]
 
+def angle_array(a: ndarray, b: ndarray) -> List:
+    """Returns the angles (degrees) and the rotation axes between two arrays of vectors (..., 3)"""
+    a = unary_array(a)
+    b = unary_array(b)
+    val = clip(einsum('...i,...i->...', a, b), -1, 1)
+    theta = arccos(val) * 180 / pi
+    axis = unary_array(cross(a, b))
+    return [theta, axis]
+
+def rotation_matrix(rotvec: ndarray) -> ndarray:
+    """Returns the rotation matrix of a rotation vector (Rodrigues formula). An array of rotation vectors (..., 3) returns (..., 3, 3)"""
+
+    rotvec = asarray(rotvec, dtype=double)
+
+    if rotvec.ndim == 1:
+        x, y, z = rotvec.tolist()
+        theta = sqrt(x * x + y * y + z * z)
+        if theta < 1e-8:
+            a, b = 1 - theta * theta / 6, 0.5 - theta * theta / 24
+        else:
+            a, b = sin(theta) / theta, (1 - cos(theta)) / (theta * theta)
+        return array([
+            [1 - b * (y * y + z * z), b * x * y - a * z, b * x * z + a * y],
+            [b * x * y + a * z, 1 - b * (x * x + z * z), b * y * z - a * x],
+            [b * x * z - a * y, b * y * z + a * x, 1 - b * (x * x + y * y)],
+        ])
+
+    theta = norm(rotvec, axis=-1)[..., None, None]
+    small = theta < 1e-8
+    safe = where(small, 1, theta)
+    a = where(small, 1 - theta * theta / 6, np_sin(safe) / safe)
+    b = where(small, 0.5 - theta * theta / 24, (1 - np_cos(safe)) / (safe * safe))
+
+    k = zeros(rotvec.shape + (3,))
+    k[..., 0, 1], k[..., 0, 2], k[..., 1, 2] = -rotvec[..., 2], rotvec[..., 1], -rotvec[..., 0]
+    k[..., 1, 0], k[..., 2, 0], k[..., 2, 1] = rotvec[..., 2], -rotvec[..., 1], rotvec[..., 0]
+
+    return eye(3) + a * k + b * (k @ k)
+
+def rotate(a: ndarray, rotvec: ndarray) -> ndarray:
+    """Rotates a by the rotation vector. Both arguments can be arrays of vectors (..., 3), which are broadcast against each other"""
+    rotvec = asarray(rotvec, dtype=double)
+    if rotvec.ndim == 1:
+        return dot(a, rotation_matrix(rotvec).T)
+    return einsum('...ij,...j->...i', rotation_matrix(rotvec), a)
+
+def transform(r: ndarray, a: ndarray) -> ndarray:
+    """Applies the rotation matrix r to a. r can be an array of matrices (..., 3, 3) and a an array of vectors (..., 3)"""
+    if ndim(r) == 2 and ndim(a) == 1: return dot(r, a)
+    return einsum('...ij,...j->...i', r, a)
+
 def rot(a: ndarray, theta: float, axis: ndarray) -> ndarray:
-    r = R.from_rotvec(deg2rad(theta) * axis)
-    return r.apply(a)
\ No newline at end of file
+    return dot(a, rotation_matrix(theta * pi / 180 * asarray(axis, dtype=double)).T)
\ No newline at end of file
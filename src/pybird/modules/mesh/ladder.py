@@ -0,0 +1,82 @@
+from typing import List, NamedTuple
+from numpy import array, column_stack, concatenate, full, inf, isin, minimum, ndarray, unique
+from numpy.linalg import norm
+from scipy.spatial import cKDTree
+
+from pybird.models import refinement_model as refinement
+from pybird.modules.cache.cache import Cache
+from pybird.modules.geo.geo import Geometry
+from pybird.modules.mesh.mesh import Mesh
+
+class Level(NamedTuple):
+    factor: float            # scale of the number of intervals of each curve
+    ref: refinement.model    # scaled refinement
+    vertices: ndarray        # mesh vertices
+    faces: ndarray           # mesh faces
+    trailing_edge: ndarray   # trailing edge vertices
+    parent: ndarray          # index in this level of each vertex of the previous one (-1 when there is none), None in the first level
+
+def _edge_lengths(vertices: ndarray, faces: ndarray) -> ndarray:
+    """Returns the length of the shortest edge of each vertex"""
+
+    quads, triangles = faces[faces[:, 0] == 4, 1:], faces[faces[:, 0] == 3, 1:4]
+    edges = concatenate([column_stack([quads[:, i], quads[:, (i + 1) % 4]]) for i in range(4)] +
+                        [column_stack([triangles[:, i], triangles[:, (i + 1) % 3]]) for i in range(3)])
+    lengths = norm(vertices[edges[:, 0]] - vertices[edges[:, 1]], axis=1)
+
+    out = full(vertices.shape[0], inf)
+    minimum.at(out, edges[:, 0], lengths)
+    minimum.at(out, edges[:, 1], lengths)
+
+    return out
+
+def nest(coarse: ndarray, vertices: ndarray, faces: ndarray, tol: float) -> ndarray:
+    """Returns the index of the fine vertex that matches each coarse vertex (-1 when there is none). The match is the
+    closest fine vertex, if it is closer than tol times its shortest edge and no other coarse vertex matches it"""
+
+    distance, index = cKDTree(vertices).query(coarse)
+    index[distance > tol * _edge_lengths(vertices, faces)[index]] = -1
+
+    ids, counts = unique(index[index >= 0], return_counts=True)
+    index[isin(index, ids[counts > 1])] = -1
+
+    return index
+
+def build_ladder(geo: Geometry, ref: refinement.model, factors: List[float], backend: str = 'gmsh', cache: Cache = None, tol: float = 0.1) -> List[Level]:
+    """Builds the meshes of the geometry with the refinement scaled by each factor, remeshing a single model. When a
+    factor is an integer multiple of the previous one, the vertices of the previous level are kept in the new one
+    (the matching vertices are moved onto them, which only changes the interior of the patches slightly)"""
+
+    assert len(factors) > 0
+
+    mesh = Mesh(geo, cache)
+    levels: List[Level] = []
+
+    for factor in factors:
+
+        scaled = refinement.scale(ref, factor)
+
+        if len(levels) == 0:
+            mesh.build(scaled, False, backend)
+        else:
+            mesh.remesh(scaled)
+
+        vertices, parent = mesh.vertices, None
+
+        if len(levels) > 0:
+
+            previous = levels[-1]
+            ratio = factor / previous.factor
+
+            if ratio > 1 and abs(ratio - round(ratio)) < 1e-9:
+                parent = nest(previous.vertices, vertices, mesh.faces, tol)
+                vertices = array(vertices)
+                vertices[parent[parent >= 0]] = previous.vertices[parent >= 0]
+            else:
+                parent = full(previous.vertices.shape[0], -1)
+
+        levels.append(Level(factor, scaled, vertices, mesh.faces, mesh.trailing_edge, parent))
+
+    mesh.close()
+
+    return levels
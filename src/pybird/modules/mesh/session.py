@@ -0,0 +1,139 @@
+from contextlib import contextmanager
+from itertools import count
+from threading import RLock, current_thread, main_thread
+from typing import Any, Dict, Iterator, Union
+
+class Session:
+    """
+    Keeps gmsh initialized in the process. gmsh keeps a single global state, so
+    there is one session per process (see session()) and each mesh is created in
+    its own model, one at a time. Models can also be kept in the session to be
+    meshed again later.
+    """
+
+    def __init__(self) -> None:
+        self.__gmsh = None
+        self.__lock = RLock()
+        self.__names = count(1)
+        self.__models = set()
+        self.__options: Dict[str, Union[float, str]] = {'General.NumThreads': 1, 'General.Verbosity': 1}
+        return
+
+    @property
+    def options(self) -> Dict[str, Union[float, str]]:
+        """gmsh options applied when the session starts"""
+        return dict(self.__options)
+
+    def set_options(self, num_threads: int = None, verbosity: int = None, options: Dict[str, Union[float, str]] = None) -> None:
+        """Changes the gmsh options, also of a started session"""
+
+        new = {} if options is None else dict(options)
+        if num_threads is not None: new['General.NumThreads'] = num_threads
+        if verbosity is not None: new['General.Verbosity'] = verbosity
+
+        with self.__lock:
+            self.__options.update(new)
+            if self.__gmsh is not None:
+                self.__apply(new)
+
+        return
+
+    def start(self) -> Any:
+        """Initializes gmsh, if it was not initialized yet, and returns the gmsh module"""
+
+        with self.__lock:
+
+            if self.__gmsh is None:
+
+                # gmsh is only loaded when a mesh is created with it
+                import gmsh
+
+                # The interrupt handler can only be installed from the main thread
+                if not gmsh.isInitialized():
+                    if current_thread() is main_thread():
+                        gmsh.initialize()
+                    else:
+                        gmsh.initialize(interruptible=False)
+
+                self.__gmsh = gmsh
+                self.__apply(self.__options)
+
+            return self.__gmsh
+
+    def close(self) -> None:
+        """Finalizes gmsh. The next model starts it again"""
+
+        with self.__lock:
+            if self.__gmsh is not None:
+                self.__gmsh.finalize()
+                self.__gmsh = None
+                self.__models.clear()
+
+        return
+
+    def add(self, name: str = None) -> str:
+        """Adds a new gmsh model, which is kept until it is removed, and returns its name"""
+
+        with self.__lock:
+            gmsh = self.start()
+            name = 'pybird-{}'.format(next(self.__names)) if name is None else name
+            gmsh.model.add(name)
+            self.__models.add(name)
+            return name
+
+    def has(self, name: str) -> bool:
+        """Checks if a model is still kept (models are lost when the session is closed)"""
+        with self.__lock:
+            return name in self.__models
+
+    def remove(self, name: str) -> None:
+        """Removes a model, if it is still kept"""
+
+        with self.__lock:
+            if name in self.__models:
+                self.__gmsh.model.setCurrent(name)
+                self.__gmsh.model.remove()
+                self.__models.remove(name)
+
+        return
+
+    @contextmanager
+    def use(self, name: str) -> Iterator[Any]:
+        """Holds the session while a kept model is used"""
+
+        with self.__lock:
+            assert name in self.__models, 'model {} is not in the session'.format(name)
+            self.__gmsh.model.setCurrent(name)
+            yield self.__gmsh
+
+        return
+
+    @contextmanager
+    def model(self, name: str = None) -> Iterator[Any]:
+        """Holds the session while a new gmsh model is used and removes the model at the end"""
+
+        with self.__lock:
+
+            name = self.add(name)
+
+            try:
+                with self.use(name) as gmsh:
+                    yield gmsh
+            finally:
+                self.remove(name)
+
+        return
+
+    def __apply(self, options: Dict[str, Union[float, str]]) -> None:
+        for key, value in options.items():
+            if isinstance(value, str):
+                self.__gmsh.option.setString(key, value)
+            else:
+                self.__gmsh.option.setNumber(key, value)
+        return
+
+_session = Session()
+
+def session() -> Session:
+    """Returns the gmsh session of the process"""
+    return _session
@@ -0,0 +1,393 @@
+from math import atan2, log, sqrt
+from typing import Any, Callable, List
+from numpy import arange, arccos, array, asarray, concatenate, cos, cumsum, diff, dot, empty, floor, full, int64, interp, linspace, log as np_log, minimum, ndarray, sin
+from numpy.linalg import norm, solve
+
+from pybird.modules.geo.utils import bezier
+
+# Number of parameter samples used to integrate the node distribution along a curve
+nSamples = 2001
+
+# Largest distance between a vertex and the same vertex of the gmsh mesh (about 1e-3 in the examples)
+tolerance = 2e-3
+
+def _line(points: ndarray, t: ndarray) -> ndarray:
+    return points[0] + t[:, None] * (points[-1] - points[0])
+
+def _polyline(points: ndarray, t: ndarray) -> ndarray:
+    """Piecewise linear curve with the same parameter length for each segment, as in gmsh"""
+    n = points.shape[0] - 1
+    i = minimum(floor(t * n).astype(int64), n - 1)
+    s = (t * n - i)[:, None]
+    return points[i] * (1 - s) + points[i + 1] * s
+
+def _bezier(points: ndarray, t: ndarray) -> ndarray:
+    return dot(bezier.basis_matrix(points.shape[0] - 1, t), points)
+
+def _arc_system(start: ndarray, center: ndarray, end: ndarray) -> List[ndarray]:
+    e1 = start - center
+    e1 = e1 / norm(e1)
+    e2 = (end - center) - dot(end - center, e1) * e1
+    e2 = e2 / norm(e2)
+    return [e1, e2]
+
+def _circle_arc(points: ndarray, t: ndarray) -> ndarray:
+    start, center, end = points
+    e1, e2 = _arc_system(start, center, end)
+    radius = norm(start - center)
+    theta = t * arccos(max(-1., min(1., dot(end - center, e1) / norm(end - center))))
+    return center + radius * (cos(theta)[:, None] * e1 + sin(theta)[:, None] * e2)
+
+def _ellipse_arc(points: ndarray, t: ndarray) -> ndarray:
+    """The major axis points from the center to the third point and the ellipse passes through the end points"""
+    start, center, major, end = points
+    e1 = (major - center) / norm(major - center)
+    other = end if norm(start - major) < norm(end - major) else start
+    e2 = (other - center) - dot(other - center, e1) * e1
+    e2 = e2 / norm(e2)
+
+    # Semi axes from (x / a) ** 2 + (y / b) ** 2 = 1 at both points
+    x = array([dot(start - center, e1), dot(end - center, e1)])
+    y = array([dot(start - center, e2), dot(end - center, e2)])
+    if abs(x[0] * y[1]) + abs(x[1] * y[0]) > 1e-12 and abs(x[0] * x[0] * y[1] * y[1] - x[1] * x[1] * y[0] * y[0]) > 1e-12:
+        ia, ib = solve(array([[x[0] ** 2, y[0] ** 2], [x[1] ** 2, y[1] ** 2]]), array([1., 1.]))
+        a, b = 1 / sqrt(ia), 1 / sqrt(ib)
+    else:
+        a, b = norm(major - center), max(abs(y[0]), abs(y[1]))
+
+    f1, f2 = atan2(y[0] / b, x[0] / a), atan2(y[1] / b, x[1] / a)
+    theta = f1 + t * (f2 - f1)
+    return center + a * cos(theta)[:, None] * e1 + b * sin(theta)[:, None] * e2
+
+_evaluators = {
+    'line': _line,
+    'polyline': _polyline,
+    'bezier': _bezier,
+    'circle': _circle_arc,
+    'ellipse': _ellipse_arc,
+}
+
+def distribution(curve: Any, points: ndarray, nodes: int, ref_type: str, coef: float, ds: ndarray = None) -> ndarray:
+    """Returns the parameters of the nodes of a transfinite curve. The node density follows the gmsh rules, which are
+    written in terms of the curve parameter and of the curve length (ds, the lengths between the nSamples samples of
+    the curve, which are computed when they are not given)"""
+
+    if ref_type == 'Beta':
+        # Roberts one-sided stretching in the curve parameter
+        b = abs(coef)
+        x = linspace(0, 1, nodes)
+        r = (b + 1) / (b - 1)
+        t = ((b + 1) - (b - 1) * r ** (1 - x)) / (r ** (1 - x) + 1)
+        return t if coef > 0 else 1 - t[::-1]
+
+    t = linspace(0, 1, nSamples)
+    if ds is None:
+        ds = norm(diff(curve(points, t), axis=0), axis=1)
+    length = ds.sum()
+    tm = 0.5 * (t[1:] + t[:-1])
+
+    if ref_type == 'Bump':
+        c = abs(coef)
+        if abs(c - 1) < 1e-6:
+            density = full(tm.size, (nodes - 1) / length)
+        else:
+            if c > 1:
+                a = -4 * sqrt(c - 1) * atan2(1, sqrt(c - 1)) / (nodes * length)
+            else:
+                a = 4 * sqrt(1 - c) * log(abs((1 + 1 / sqrt(1 - c)) / (1 - 1 / sqrt(1 - c)))) / (nodes * length)
+            b = -a * length * length / (4 * (c - 1))
+            density = 1 / (-a * (tm * length - 0.5 * length) ** 2 + b)
+    else:
+        r = coef if coef >= 0 else -1 / coef
+        if abs(r - 1) < 1e-6:
+            density = full(tm.size, (nodes - 1) / length)
+        else:
+            a = length * (r - 1) / (r ** (nodes - 1) - 1)
+            i = floor(np_log(tm * length / a * (r - 1) + 1) / log(r))
+            density = 1 / (a * r ** i)
+
+    f = concatenate([[0.], cumsum(ds * density)])
+    return interp(linspace(0, f[-1], nodes), f, t)
+
+class _Option:
+
+    def setNumber(self, name: str, value: float) -> None:
+        return
+
+class _Geo:
+
+    def __init__(self, data: dict) -> None:
+        self.__data = data
+        return
+
+    def add_point(self, x: float, y: float, z: float, *args) -> int:
+        self.__data['points'].append([x, y, z])
+        return len(self.__data['points'])
+
+    def __add_curve(self, kind: str, tags: List[int], start: int, end: int) -> int:
+        self.__data['curves'].append([kind, tags, start, end])
+        return len(self.__data['curves'])
+
+    def add_line(self, start: int, end: int) -> int:
+        return self.__add_curve('line', [start, end], start, end)
+
+    def add_polyline(self, tags: List[int]) -> int:
+        return self.__add_curve('polyline', list(tags), tags[0], tags[-1])
+
+    def add_bezier(self, tags: List[int]) -> int:
+        return self.__add_curve('bezier', list(tags), tags[0], tags[-1])
+
+    def add_circle_arc(self, start: int, center: int, end: int) -> int:
+        return self.__add_curve('circle', [start, center, end], start, end)
+
+    def add_ellipse_arc(self, start: int, center: int, major: int, end: int) -> int:
+        return self.__add_curve('ellipse', [start, center, major, end], start, end)
+
+    def add_curve_loop(self, curves: List[int]) -> int:
+        self.__data['loops'].append(list(curves))
+        return len(self.__data['loops'])
+
+    def add_surface_filling(self, loops: List[int]) -> int:
+        assert len(loops) == 1, 'surfaces with holes are not supported'
+        self.__data['surfaces'].append(loops[0])
+        return len(self.__data['surfaces'])
+
+    def synchronize(self) -> None:
+        return
+
+class _Mesh:
+
+    def __init__(self, data: dict) -> None:
+        self.__data = data
+        self.__transfinite_curves = {}
+        self.__transfinite_surfaces = set()
+        self.__recombine = set()
+        self.__nodes = None
+        self.__curve_nodes = None
+        self.__faces3 = None
+        self.__faces4 = None
+        self.__lengths = {}
+        return
+
+    def set_transfinite_curve(self, tag: int, nodes: int, meshType: str = 'Progression', coef: float = 1.) -> None:
+        self.__transfinite_curves[tag] = [nodes, meshType, coef]
+        return
+
+    def set_transfinite_surface(self, tag: int, *args) -> None:
+        self.__transfinite_surfaces.add(tag)
+        return
+
+    def set_recombine(self, dim: int, tag: int, *args) -> None:
+        self.__recombine.add(tag)
+        return
+
+    def clear(self) -> None:
+        self.__nodes = None
+        self.__curve_nodes = None
+        self.__faces3 = None
+        self.__faces4 = None
+        return
+
+    def generate(self, dim: int = 2) -> None:
+        """Meshes the curves and then fills each surface by transfinite interpolation of the parameters of its boundary nodes"""
+
+        points = array(self.__data['points'], dtype=float)
+        nodes = [points]
+        count = points.shape[0]
+
+        # Curves
+        self.__curve_nodes = []
+        curves = []
+        for tag, (kind, tags, start, end) in enumerate(self.__data['curves'], start=1):
+            assert tag in self.__transfinite_curves, 'curve {} is not transfinite'.format(tag)
+            n, ref_type, coef = self.__transfinite_curves[tag]
+            curve, control = _evaluators[kind], points[asarray(tags) - 1]
+
+            # The curves do not change when the model is meshed again
+            if ref_type != 'Beta' and tag not in self.__lengths:
+                self.__lengths[tag] = norm(diff(curve(control, linspace(0, 1, nSamples)), axis=0), axis=1)
+
+            t = distribution(curve, control, n, ref_type, coef, self.__lengths.get(tag))
+            nodes.append(curve(control, t[1:-1]))
+            curves.append([curve, control, t])
+            self.__curve_nodes.append(concatenate([[start - 1], arange(count, count + n - 2), [end - 1]]))
+            count += n - 2
+
+        # Surfaces
+        vertices = concatenate(nodes)
+        faces3, faces4 = [], []
+        for tag, loop in enumerate(self.__data['surfaces'], start=1):
+            assert tag in self.__transfinite_surfaces, 'surface {} is not transfinite'.format(tag)
+
+            # Sides of the surface, each one with its nodes, their parameters and the curve, in the direction of the loop
+            sides = []
+            for c in self.__data['loops'][loop - 1]:
+                curve, control, t = curves[abs(c) - 1]
+                ids = self.__curve_nodes[abs(c) - 1]
+                if c > 0:
+                    sides.append([ids, t, lambda s, curve=curve, control=control: curve(control, s)])
+                else:
+                    sides.append([ids[::-1], 1 - t[::-1], lambda s, curve=curve, control=control: curve(control, 1 - s)])
+
+            reverse = self.__data['loops'][loop - 1][0] < 0
+            grid = self.__grid([side[0] for side in sides], reverse, tag)
+            uv = self.__grid(self.__parameters([side[1] for side in sides]), reverse, tag)
+            interior = self.__interpolate(vertices, grid, uv, [side[2] for side in sides], [vertices[side[0][0]] for side in sides])
+            ids = grid.copy()
+            ids[1:-1, 1:-1] = arange(count, count + interior.shape[0]).reshape(ids.shape[0] - 2, ids.shape[1] - 2)
+            vertices = concatenate([vertices, interior])
+            count += interior.shape[0]
+            self.__elements(ids, len(sides) == 3, tag in self.__recombine, reverse, faces3, faces4)
+
+        self.__nodes = vertices
+        self.__faces3 = concatenate(faces3) if len(faces3) > 0 else empty((0, 3), dtype=int64)
+        self.__faces4 = concatenate(faces4) if len(faces4) > 0 else empty((0, 4), dtype=int64)
+
+        return
+
+    def __grid(self, edges: List[ndarray], reverse: bool, tag: int) -> ndarray:
+        """Returns the (L + 1, H + 1) grid of the surface with the boundary filled with the values of the edges (node ids
+        or parameters). Triangles are quadrangles with the first corner collapsed, which must join the two edges with
+        the same size"""
+
+        # Like gmsh, the loop is walked so that its first curve keeps its own direction
+        if reverse:
+            edges = [edges[0][::-1]] + [e[::-1] for e in edges[:0:-1]]
+
+        if len(edges) == 3:
+            sizes = [len(e) for e in edges]
+            apex = next((k for k in (1, 0, 2) if sizes[k - 1] == sizes[k]), None)
+            assert apex is not None, 'surface {} cannot be meshed with the transfinite algorithm'.format(tag)
+            edges = edges[apex:] + edges[:apex]
+            edges = edges + [edges[0][:1].repeat(len(edges[1]), axis=0)]
+
+        assert len(edges) == 4, 'surface {} must have 3 or 4 edges'.format(tag)
+        assert len(edges[0]) == len(edges[2]) and len(edges[1]) == len(edges[3]), 'surface {} cannot be meshed with the transfinite algorithm'.format(tag)
+
+        grid = empty((len(edges[0]), len(edges[1])) + edges[0].shape[1:], dtype=edges[0].dtype)
+        grid[:, 0] = edges[0]
+        grid[-1, :] = edges[1]
+        grid[:, -1] = edges[2][::-1]
+        grid[0, :] = edges[3][::-1]
+
+        return grid
+
+    def __parameters(self, params: List[ndarray]) -> List[ndarray]:
+        """Returns the (u, v) parameters in the surface of the nodes of each side. gmsh defines them for the surfaces
+        filled from 4 curves as (s, 0), (1, s), (1 - s, 1) and (0, 1 - s), and for the ones filled from 3 curves as
+        (s, 0), (1, s) and (1 - s, 1 - s)"""
+
+        uv = []
+        for k, s in enumerate(params):
+            p = empty((s.size, 2))
+            p[:, 0] = [s, 1., 1 - s, 0.][k]
+            p[:, 1] = [0., s, 1. if len(params) == 4 else 1 - s, 1 - s][k]
+            uv.append(p)
+
+        return uv
+
+    def __interpolate(self, vertices: ndarray, grid: ndarray, uv: ndarray, sides: List[Callable[[ndarray], ndarray]], corners: List[ndarray]) -> ndarray:
+        """Transfinite interpolation of the parameters of the boundary nodes, with the blending parameters given by the
+        lengths of the first two edges, followed by the evaluation of the surface at the interpolated parameters, as in gmsh"""
+
+        L, H = grid.shape[0] - 1, grid.shape[1] - 1
+        if L < 2 or H < 2:
+            return empty((0, 3))
+
+        def lengths(ids: ndarray) -> ndarray:
+            s = concatenate([[0.], cumsum(norm(diff(vertices[ids], axis=0), axis=1))])
+            return s / s[-1]
+
+        u = lengths(grid[:, 0])[1:-1, None, None]
+        v = lengths(grid[-1, :])[None, 1:-1, None]
+
+        bottom, top = uv[1:-1, 0][:, None, :], uv[1:-1, -1][:, None, :]
+        left, right = uv[0, 1:-1][None, :, :], uv[-1, 1:-1][None, :, :]
+        c0, c1, c2, c3 = uv[0, 0], uv[-1, 0], uv[-1, -1], uv[0, -1]
+
+        p = (1 - u) * left + u * right + (1 - v) * bottom + v * top - ((1 - u) * (1 - v) * c0 + u * (1 - v) * c1 + u * v * c2 + (1 - u) * v * c3)
+        p = p.reshape(-1, 2)
+
+        return self.__surface(sides, corners, p[:, 0], p[:, 1])
+
+    def __surface(self, sides: List[Callable[[ndarray], ndarray]], corners: List[ndarray], u: ndarray, v: ndarray) -> ndarray:
+        """Evaluates the surface filled from the sides at the parameters u and v, as the gmsh ruled surfaces: the Coons
+        patch of the unit square or, for 3 sides, the one of the triangle (0, 0), (1, 0), (1, 1) in barycentric coordinates"""
+
+        U, V = u[:, None], v[:, None]
+
+        if len(sides) == 4:
+            return ((1 - U) * sides[3](1 - v) + U * sides[1](v) + (1 - V) * sides[0](u) + V * sides[2](1 - u) -
+                    ((1 - U) * (1 - V) * corners[0] + U * (1 - V) * corners[1] + U * V * corners[2] + (1 - U) * V * corners[3]))
+
+        a, b, c = 1 - U, U - V, V
+        return (b * sides[0](u) + a * sides[0](u - v) + b * sides[1](v) + c * sides[1](1 - u + v) + a * sides[2](1 - v) + c * sides[2](1 - u) -
+                (a * corners[0] + b * corners[1] + c * corners[2]))
+
+    def __elements(self, ids: ndarray, triangle: bool, recombine: bool, reverse: bool, faces3: List[ndarray], faces4: List[ndarray]) -> None:
+
+        # The elements follow the orientation of the loop
+        if reverse:
+            quads = array([ids[:-1, :-1], ids[:-1, 1:], ids[1:, 1:], ids[1:, :-1]]).transpose(1, 2, 0)
+        else:
+            quads = array([ids[:-1, :-1], ids[1:, :-1], ids[1:, 1:], ids[:-1, 1:]]).transpose(1, 2, 0)
+
+        # The triangles start at the collapsed corner, as in gmsh
+        if triangle:
+            faces3.append(quads[0, :, 1:] if reverse else quads[0, :, :3])
+            quads = quads[1:]
+
+        quads = quads.reshape(-1, 4)
+
+        if recombine:
+            faces4.append(quads)
+        else:
+            faces3.append(quads[:, [0, 1, 2]])
+            faces3.append(quads[:, [0, 2, 3]])
+
+        return
+
+    def get_nodes(self, dim: int = -1, tag: int = -1, includeBoundary: bool = False, *args) -> List[ndarray]:
+        """Returns all the nodes or the nodes of a curve (the interior ones followed by its end points, if includeBoundary)"""
+
+        if dim == -1:
+            return [arange(1, self.__nodes.shape[0] + 1), self.__nodes.ravel(), empty(0)]
+
+        assert dim == 1, 'only the nodes of the curves are supported'
+        ids = self.__curve_nodes[tag - 1]
+        ids = concatenate([ids[1:-1], ids[[0, -1]]]) if includeBoundary else ids[1:-1]
+        return [ids + 1, self.__nodes[ids].ravel(), empty(0)]
+
+    def get_elements_by_type(self, elementType: int, *args) -> List[ndarray]:
+        """Returns the triangles (type 2) or quadrangles (type 3)"""
+        assert elementType in (2, 3)
+        faces = self.__faces4 if elementType == 3 else self.__faces3
+        return [arange(1, faces.shape[0] + 1), (faces + 1).ravel()]
+
+class _Model:
+
+    def __init__(self) -> None:
+        self.__data = {'points': [], 'curves': [], 'loops': [], 'surfaces': []}
+        self.geo = _Geo(self.__data)
+        self.mesh = _Mesh(self.__data)
+        return
+
+class StructuredMesher:
+    """Implements the part of the gmsh api used by Mesh for meshes made only of transfinite curves and surfaces.
+    The nodes of each curve follow the gmsh distributions and each surface is filled directly by transfinite
+    interpolation in its parameters, so the mesh has the same nodes and faces as the gmsh one without calling gmsh.
+    The mesh is approximate: the nodes of the curves are placed from a sampled length (within about 1e-6 of gmsh) and
+    the interior nodes of the triangular surfaces differ from the gmsh ones (by up to tolerance)"""
+
+    def __init__(self) -> None:
+        self.option = _Option()
+        self.model = None
+        return
+
+    def initialize(self, *args, **kwargs) -> None:
+        self.model = _Model()
+        return
+
+    def finalize(self) -> None:
+        self.model = None
+        return
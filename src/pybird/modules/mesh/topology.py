@@ -0,0 +1,500 @@
+from math import ceil
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+from pybird.models import refinement_model as refinement
+
+# The topology of the bird mesh: the points, the edges between them and the
+# patches bounded by the edges. Mesh creates the gmsh model from these tables
+# in the order they are declared, which defines the numbering of the nodes.
+
+class Point(NamedTuple):
+    name: str                     # name used by the edges (and Geometry array of the point, if sources is empty)
+    sources: Tuple[str, ...] = () # Geometry arrays whose mean is the point
+
+class Edge(NamedTuple):
+    name: str                     # name used by the patches
+    kind: str                     # line, polyline, bezier, circle_arc or ellipse_arc
+    points: Tuple[str, ...]       # points in the order of the gmsh call (first and last are the end points)
+    source: str                   # Geometry array with the interior points of a polyline
+    refinement: str               # key of the node distribution in REFINEMENTS
+    sign: int                     # direction of the progression (1 is from the first point to the last one)
+
+class Patch(NamedTuple):
+    name: str
+    loop: Tuple[str, ...]         # edges of the boundary in the order of the gmsh curve loop ('-' reverses an edge)
+
+def _section(i: int) -> Callable[[refinement.model], Tuple[int, str, float]]:
+    return lambda ref: (ref.wing.sections[i].nodes, ref.wing.sections[i].ref_type, ref.wing.sections[i].coef)
+
+# Number of nodes, distribution type and coefficient of the edges
+REFINEMENTS: Dict[str, Callable[[refinement.model], Tuple[int, str, float]]] = {
+    'section_0': _section(0),
+    'section_1': _section(1),
+    'section_2': _section(2),
+    'section_3': _section(3),
+    'section_4': _section(4),
+    'section_5': _section(5),
+    'chord_le': lambda ref: (ref.wing.n_chord_le, 'Progression', ref.wing.coef_le),
+    'chord_le_uniform': lambda ref: (ref.wing.n_chord_le, 'Progression', 1.0),
+    'chord_te': lambda ref: (ref.wing.n_chord_te, 'Progression', ref.wing.coef_te),
+    'chord_te_uniform': lambda ref: (ref.wing.n_chord_te, 'Progression', 1.0),
+    'cross_body': lambda ref: (ceil(ref.body.n_cross_body / 2) + 1, 'Progression', ref.body.coef_cross_body),
+    'cross_body_uniform': lambda ref: (ceil(ref.body.n_cross_body / 2) + 1, 'Progression', 1.0),
+    'body_head': lambda ref: (ref.body.n_head, 'Progression', ref.body.coef_head),
+    'body_tail': lambda ref: (ref.body.n_tail, 'Progression', ref.body.coef_tail),
+    'head_1': lambda ref: (ref.head.n_1, 'Progression', ref.head.coef_1),
+    'head_2': lambda ref: (ref.head.n_2, 'Progression', ref.head.coef_2),
+    'tail_le': lambda ref: (ref.tail.n_1, 'Progression', ref.tail.coef_edge_le),
+    'tail_te': lambda ref: (ref.tail.n_2, 'Progression', ref.tail.coef_edge_te),
+    'tail_edge': lambda ref: (ref.tail.n_edge, 'Progression', ref.tail.coef_tip),
+}
+
+POINTS: List[Point] = [
+    Point('p1e'),
+    Point('p2e'),
+    Point('p3e'),
+    Point('p4e'),
+    Point('p5e'),
+    Point('p6e'),
+    Point('p7e'),
+    Point('p8e'),
+    Point('p9e'),
+    Point('p10e'),
+    Point('p11e'),
+    Point('p12e'),
+    Point('p13e'),
+    Point('p14e'),
+    Point('p15e'),
+    Point('p16e'),
+    Point('p17e'),
+    Point('p18e'),
+    Point('p19e'),
+    Point('p20e'),
+    Point('p21e'),
+    Point('p22e'),
+    Point('p23e'),
+    Point('p24e'),
+    Point('p25e'),
+    Point('c1e'),
+    Point('c2e'),
+    Point('c3e'),
+    Point('c4e'),
+    Point('c5e'),
+    Point('c6e'),
+    Point('c7e'),
+    Point('c8e'),
+    Point('c9e'),
+    Point('c10e'),
+    Point('c11e'),
+    Point('c12e'),
+    Point('c13e'),
+    Point('c14e'),
+    Point('c15e'),
+    Point('c16e'),
+    Point('c17e'),
+    Point('c18e'),
+    Point('c19e'),
+    Point('c20e'),
+    Point('c21e'),
+    Point('p1d'),
+    Point('p2d'),
+    Point('p3d'),
+    Point('p4d'),
+    Point('p5d'),
+    Point('p6d'),
+    Point('p7d'),
+    Point('p8d'),
+    Point('p9d'),
+    Point('p10d'),
+    Point('p11d'),
+    Point('p12d'),
+    Point('p13d'),
+    Point('p14d'),
+    Point('p15d'),
+    Point('p16d'),
+    Point('p17d'),
+    Point('p18d'),
+    Point('p19d'),
+    Point('p20d'),
+    Point('p21d'),
+    Point('p22d'),
+    Point('p23d'),
+    Point('p24d'),
+    Point('p25d'),
+    Point('c1d'),
+    Point('c2d'),
+    Point('c3d'),
+    Point('c4d'),
+    Point('c5d'),
+    Point('c6d'),
+    Point('c7d'),
+    Point('c8d'),
+    Point('c9d'),
+    Point('c10d'),
+    Point('c11d'),
+    Point('c12d'),
+    Point('c13d'),
+    Point('c14d'),
+    Point('c15d'),
+    Point('c16d'),
+    Point('c17d'),
+    Point('c18d'),
+    Point('c19d'),
+    Point('c20d'),
+    Point('c21d'),
+    Point('p26e'),
+    Point('p26d'),
+    Point('p27e'),
+    Point('p27d'),
+    Point('p28'),
+    Point('p29'),
+    Point('p30'),
+    Point('p31'),
+    Point('p32'),
+    Point('p33'),
+    Point('p34'),
+    Point('p35'),
+    Point('p36'),
+    Point('p37'),
+    Point('c22e'),
+    Point('c23e'),
+    Point('c24e'),
+    Point('c25e'),
+    Point('c22d'),
+    Point('c23d'),
+    Point('c24d'),
+    Point('c25d'),
+    Point('c26'),
+    Point('c27'),
+    Point('c28'),
+    Point('c29'),
+    Point('c30'),
+    Point('c31'),
+    Point('c32'),
+    Point('c33'),
+    Point('c34'),
+    Point('c35'),
+    Point('c36'),
+    Point('c37'),
+    Point('c38'),
+    Point('c39'),
+    Point('c40'),
+    Point('c41'),
+    Point('center_head', ('p26e', 'p26d')),
+    Point('c42e'),
+    Point('c43e'),
+    Point('c44e'),
+    Point('c45e'),
+    Point('c42d'),
+    Point('c43d'),
+    Point('c44d'),
+    Point('c45d'),
+    Point('c46e'),
+    Point('c47e'),
+    Point('c48e'),
+    Point('c49e'),
+    Point('c46d'),
+    Point('c47d'),
+    Point('c48d'),
+    Point('c49d'),
+    Point('c50e'),
+    Point('c51e'),
+    Point('c52e'),
+    Point('c53e'),
+    Point('c50d'),
+    Point('c51d'),
+    Point('c52d'),
+    Point('c53d'),
+    Point('center_tail', ('p27e', 'p27d')),
+    Point('p38'),
+    Point('p41e'),
+    Point('p41d'),
+    Point('p39'),
+    Point('p42'),
+    Point('c54'),
+    Point('c56e'),
+    Point('c56d'),
+    Point('c55'),
+    Point('c57'),
+    Point('c59e'),
+    Point('c59d'),
+    Point('c58'),
+    Point('head_center', ('p41e', 'p41d')),
+    Point('p45'),
+    Point('p46'),
+    Point('p51'),
+    Point('p43e'),
+    Point('p44e'),
+    Point('p49e'),
+    Point('p47e'),
+    Point('p43d'),
+    Point('p44d'),
+    Point('p49d'),
+    Point('p47d'),
+]
+
+EDGES: List[Edge] = [
+    Edge('1_2_e', 'bezier', ('p1e', 'c1e', 'p2e'), '', 'section_0', 1),
+    Edge('2_3_e', 'bezier', ('p2e', 'c2e', 'c3e', 'p3e'), '', 'section_1', -1),
+    Edge('3_4_e', 'bezier', ('p3e', 'c4e', 'c5e', 'p4e'), '', 'section_2', 1),
+    Edge('4_5_e', 'line', ('p4e', 'p5e'), '', 'section_3', 1),
+    Edge('5_6_e', 'bezier', ('p5e', 'c6e', 'c7e', 'p6e'), '', 'section_4', -1),
+    Edge('6_7_e', 'bezier', ('p6e', 'c8e', 'c9e', 'p7e'), '', 'section_5', -1),
+    Edge('7_8_e', 'bezier', ('p7e', 'c10e', 'c11e', 'p8e'), '', 'section_5', 1),
+    Edge('8_9_e', 'bezier', ('p8e', 'c12e', 'c13e', 'p9e'), '', 'section_4', 1),
+    Edge('9_10_e', 'bezier', ('p9e', 'c14e', 'c15e', 'p10e'), '', 'section_3', -1),
+    Edge('10_11_e', 'bezier', ('p10e', 'c16e', 'c17e', 'p11e'), '', 'section_2', -1),
+    Edge('11_12_e', 'bezier', ('p11e', 'c18e', 'c19e', 'p12e'), '', 'section_1', 1),
+    Edge('12_13_e', 'bezier', ('p12e', 'c20e', 'c21e', 'p13e'), '', 'section_0', -1),
+    Edge('14_16_e', 'polyline', ('p14e', 'p16e'), 'curve17e', 'section_0', 1),
+    Edge('16_18_e', 'polyline', ('p16e', 'p18e'), 'curve23e', 'section_1', -1),
+    Edge('18_20_e', 'polyline', ('p18e', 'p20e'), 'curve29e', 'section_2', 1),
+    Edge('20_22_e', 'polyline', ('p20e', 'p22e'), 'curve35e', 'section_3', 1),
+    Edge('22_24_e', 'polyline', ('p22e', 'p24e'), 'curve41e', 'section_4', -1),
+    Edge('24_7_e', 'line', ('p24e', 'p7e'), '', 'section_5', -1),
+    Edge('15_17_e', 'polyline', ('p15e', 'p17e'), 'curve18e', 'section_0', 1),
+    Edge('17_19_e', 'polyline', ('p17e', 'p19e'), 'curve24e', 'section_1', -1),
+    Edge('19_21_e', 'polyline', ('p19e', 'p21e'), 'curve30e', 'section_2', 1),
+    Edge('21_23_e', 'polyline', ('p21e', 'p23e'), 'curve36e', 'section_3', 1),
+    Edge('23_25_e', 'polyline', ('p23e', 'p25e'), 'curve42e', 'section_4', -1),
+    Edge('25_7_e', 'line', ('p25e', 'p7e'), '', 'section_5', -1),
+    Edge('13_14_e', 'polyline', ('p13e', 'p14e'), 'curve15e', 'chord_te', 1),
+    Edge('14_1_e', 'polyline', ('p14e', 'p1e'), 'curve13e', 'chord_le', -1),
+    Edge('13_15_e', 'polyline', ('p13e', 'p15e'), 'curve16e', 'chord_te', 1),
+    Edge('15_1_e', 'polyline', ('p15e', 'p1e'), 'curve14e', 'chord_le', -1),
+    Edge('12_16_e', 'polyline', ('p12e', 'p16e'), 'curve21e', 'chord_te', 1),
+    Edge('16_2_e', 'polyline', ('p16e', 'p2e'), 'curve19e', 'chord_le', -1),
+    Edge('12_17_e', 'polyline', ('p12e', 'p17e'), 'curve22e', 'chord_te', 1),
+    Edge('17_2_e', 'polyline', ('p17e', 'p2e'), 'curve20e', 'chord_le', -1),
+    Edge('11_18_e', 'polyline', ('p11e', 'p18e'), 'curve27e', 'chord_te', 1),
+    Edge('18_3_e', 'polyline', ('p18e', 'p3e'), 'curve25e', 'chord_le', -1),
+    Edge('11_19_e', 'polyline', ('p11e', 'p19e'), 'curve28e', 'chord_te', 1),
+    Edge('19_3_e', 'polyline', ('p19e', 'p3e'), 'curve26e', 'chord_le', -1),
+    Edge('10_20_e', 'polyline', ('p10e', 'p20e'), 'curve33e', 'chord_te', 1),
+    Edge('20_4_e', 'polyline', ('p20e', 'p4e'), 'curve31e', 'chord_le', -1),
+    Edge('10_21_e', 'polyline', ('p10e', 'p21e'), 'curve34e', 'chord_te', 1),
+    Edge('21_4_e', 'polyline', ('p21e', 'p4e'), 'curve32e', 'chord_le', -1),
+    Edge('9_22_e', 'polyline', ('p9e', 'p22e'), 'curve39e', 'chord_te', 1),
+    Edge('22_5_e', 'polyline', ('p22e', 'p5e'), 'curve37e', 'chord_le', -1),
+    Edge('9_23_e', 'polyline', ('p9e', 'p23e'), 'curve40e', 'chord_te', 1),
+    Edge('23_5_e', 'polyline', ('p23e', 'p5e'), 'curve38e', 'chord_le', -1),
+    Edge('8_24_e', 'polyline', ('p8e', 'p24e'), 'curve45e', 'chord_te_uniform', 1),
+    Edge('24_6_e', 'polyline', ('p24e', 'p6e'), 'curve43e', 'chord_le_uniform', 1),
+    Edge('8_25_e', 'polyline', ('p8e', 'p25e'), 'curve46e', 'chord_te_uniform', 1),
+    Edge('25_6_e', 'polyline', ('p25e', 'p6e'), 'curve44e', 'chord_le_uniform', 1),
+    Edge('1_2_d', 'bezier', ('p1d', 'c1d', 'p2d'), '', 'section_0', 1),
+    Edge('2_3_d', 'bezier', ('p2d', 'c2d', 'c3d', 'p3d'), '', 'section_1', -1),
+    Edge('3_4_d', 'bezier', ('p3d', 'c4d', 'c5d', 'p4d'), '', 'section_2', 1),
+    Edge('4_5_d', 'line', ('p4d', 'p5d'), '', 'section_3', 1),
+    Edge('5_6_d', 'bezier', ('p5d', 'c6d', 'c7d', 'p6d'), '', 'section_4', -1),
+    Edge('6_7_d', 'bezier', ('p6d', 'c8d', 'c9d', 'p7d'), '', 'section_5', -1),
+    Edge('7_8_d', 'bezier', ('p7d', 'c10d', 'c11d', 'p8d'), '', 'section_5', 1),
+    Edge('8_9_d', 'bezier', ('p8d', 'c12d', 'c13d', 'p9d'), '', 'section_4', 1),
+    Edge('9_10_d', 'bezier', ('p9d', 'c14d', 'c15d', 'p10d'), '', 'section_3', -1),
+    Edge('10_11_d', 'bezier', ('p10d', 'c16d', 'c17d', 'p11d'), '', 'section_2', -1),
+    Edge('11_12_d', 'bezier', ('p11d', 'c18d', 'c19d', 'p12d'), '', 'section_1', 1),
+    Edge('12_13_d', 'bezier', ('p12d', 'c20d', 'c21d', 'p13d'), '', 'section_0', -1),
+    Edge('14_16_d', 'polyline', ('p14d', 'p16d'), 'curve17d', 'section_0', 1),
+    Edge('16_18_d', 'polyline', ('p16d', 'p18d'), 'curve23d', 'section_1', -1),
+    Edge('18_20_d', 'polyline', ('p18d', 'p20d'), 'curve29d', 'section_2', 1),
+    Edge('20_22_d', 'polyline', ('p20d', 'p22d'), 'curve35d', 'section_3', 1),
+    Edge('22_24_d', 'polyline', ('p22d', 'p24d'), 'curve41d', 'section_4', -1),
+    Edge('24_7_d', 'line', ('p24d', 'p7d'), '', 'section_5', -1),
+    Edge('15_17_d', 'polyline', ('p15d', 'p17d'), 'curve18d', 'section_0', 1),
+    Edge('17_19_d', 'polyline', ('p17d', 'p19d'), 'curve24d', 'section_1', -1),
+    Edge('19_21_d', 'polyline', ('p19d', 'p21d'), 'curve30d', 'section_2', 1),
+    Edge('21_23_d', 'polyline', ('p21d', 'p23d'), 'curve36d', 'section_3', 1),
+    Edge('23_25_d', 'polyline', ('p23d', 'p25d'), 'curve42d', 'section_4', -1),
+    Edge('25_7_d', 'line', ('p25d', 'p7d'), '', 'section_5', -1),
+    Edge('13_14_d', 'polyline', ('p13d', 'p14d'), 'curve15d', 'chord_te', 1),
+    Edge('14_1_d', 'polyline', ('p14d', 'p1d'), 'curve13d', 'chord_le', -1),
+    Edge('13_15_d', 'polyline', ('p13d', 'p15d'), 'curve16d', 'chord_te', 1),
+    Edge('15_1_d', 'polyline', ('p15d', 'p1d'), 'curve14d', 'chord_le', -1),
+    Edge('12_16_d', 'polyline', ('p12d', 'p16d'), 'curve21d', 'chord_te', 1),
+    Edge('16_2_d', 'polyline', ('p16d', 'p2d'), 'curve19d', 'chord_le', -1),
+    Edge('12_17_d', 'polyline', ('p12d', 'p17d'), 'curve22d', 'chord_te', 1),
+    Edge('17_2_d', 'polyline', ('p17d', 'p2d'), 'curve20d', 'chord_le', -1),
+    Edge('11_18_d', 'polyline', ('p11d', 'p18d'), 'curve27d', 'chord_te', 1),
+    Edge('18_3_d', 'polyline', ('p18d', 'p3d'), 'curve25d', 'chord_le', -1),
+    Edge('11_19_d', 'polyline', ('p11d', 'p19d'), 'curve28d', 'chord_te', 1),
+    Edge('19_3_d', 'polyline', ('p19d', 'p3d'), 'curve26d', 'chord_le', -1),
+    Edge('10_20_d', 'polyline', ('p10d', 'p20d'), 'curve33d', 'chord_te', 1),
+    Edge('20_4_d', 'polyline', ('p20d', 'p4d'), 'curve31d', 'chord_le', -1),
+    Edge('10_21_d', 'polyline', ('p10d', 'p21d'), 'curve34d', 'chord_te', 1),
+    Edge('21_4_d', 'polyline', ('p21d', 'p4d'), 'curve32d', 'chord_le', -1),
+    Edge('9_22_d', 'polyline', ('p9d', 'p22d'), 'curve39d', 'chord_te', 1),
+    Edge('22_5_d', 'polyline', ('p22d', 'p5d'), 'curve37d', 'chord_le', -1),
+    Edge('9_23_d', 'polyline', ('p9d', 'p23d'), 'curve40d', 'chord_te', 1),
+    Edge('23_5_d', 'polyline', ('p23d', 'p5d'), 'curve38d', 'chord_le', -1),
+    Edge('8_24_d', 'polyline', ('p8d', 'p24d'), 'curve45d', 'chord_te_uniform', 1),
+    Edge('24_6_d', 'polyline', ('p24d', 'p6d'), 'curve43d', 'chord_le_uniform', 1),
+    Edge('8_25_d', 'polyline', ('p8d', 'p25d'), 'curve46d', 'chord_te_uniform', 1),
+    Edge('25_6_d', 'polyline', ('p25d', 'p6d'), 'curve44d', 'chord_le_uniform', 1),
+    Edge('26_1_e', 'bezier', ('p26e', 'c22e', 'c23e', 'p1e'), '', 'body_head', -1),
+    Edge('13_27_e', 'bezier', ('p13e', 'c24e', 'c25e', 'p27e'), '', 'body_tail', 1),
+    Edge('26_1_d', 'bezier', ('p26d', 'c22d', 'c23d', 'p1d'), '', 'body_head', -1),
+    Edge('13_27_d', 'bezier', ('p13d', 'c24d', 'c25d', 'p27d'), '', 'body_tail', 1),
+    Edge('28_29', 'bezier', ('p28', 'c26', 'c27', 'p29'), '', 'body_head', -1),
+    Edge('29_30', 'bezier', ('p29', 'c28', 'c29', 'p30'), '', 'chord_le', 1),
+    Edge('30_31', 'bezier', ('p30', 'c30', 'c31', 'p31'), '', 'chord_te', -1),
+    Edge('31_32', 'bezier', ('p31', 'c32', 'c33', 'p32'), '', 'body_tail', 1),
+    Edge('33_34', 'bezier', ('p33', 'c34', 'c35', 'p34'), '', 'body_head', -1),
+    Edge('34_35', 'bezier', ('p34', 'c36', 'c37', 'p35'), '', 'chord_le', 1),
+    Edge('35_36', 'bezier', ('p35', 'c38', 'c39', 'p36'), '', 'chord_te', -1),
+    Edge('36_37', 'bezier', ('p36', 'c40', 'c41', 'p37'), '', 'body_tail', 1),
+    Edge('28_26_e', 'circle_arc', ('p28', 'center_head', 'p26e'), '', 'cross_body', -1),
+    Edge('26e_33', 'circle_arc', ('p26e', 'center_head', 'p33'), '', 'cross_body', 1),
+    Edge('33_26_d', 'circle_arc', ('p33', 'center_head', 'p26d'), '', 'cross_body', -1),
+    Edge('26d_28', 'circle_arc', ('p26d', 'center_head', 'p28'), '', 'cross_body', 1),
+    Edge('29_1_e', 'bezier', ('p29', 'c42e', 'c43e', 'p1e'), '', 'cross_body', -1),
+    Edge('1e_34', 'bezier', ('p1e', 'c44e', 'c45e', 'p34'), '', 'cross_body', 1),
+    Edge('29_1_d', 'bezier', ('p29', 'c42d', 'c43d', 'p1d'), '', 'cross_body', -1),
+    Edge('1d_34', 'bezier', ('p1d', 'c44d', 'c45d', 'p34'), '', 'cross_body', 1),
+    Edge('30_14_e', 'bezier', ('p30', 'c46e', 'c47e', 'p14e'), '', 'cross_body', -1),
+    Edge('15e_35', 'bezier', ('p15e', 'c48e', 'c49e', 'p35'), '', 'cross_body', 1),
+    Edge('30_14_d', 'bezier', ('p30', 'c46d', 'c47d', 'p14d'), '', 'cross_body', -1),
+    Edge('15d_35', 'bezier', ('p15d', 'c48d', 'c49d', 'p35'), '', 'cross_body', 1),
+    Edge('31_13_e', 'bezier', ('p31', 'c50e', 'c51e', 'p13e'), '', 'cross_body', -1),
+    Edge('13e_36', 'bezier', ('p13e', 'c52e', 'c53e', 'p36'), '', 'cross_body', 1),
+    Edge('31_13_d', 'bezier', ('p31', 'c50d', 'c51d', 'p13d'), '', 'cross_body', -1),
+    Edge('13d_36', 'bezier', ('p13d', 'c52d', 'c53d', 'p36'), '', 'cross_body', 1),
+    Edge('32_27_e', 'ellipse_arc', ('p32', 'center_tail', 'p27e', 'p27e'), '', 'cross_body', -1),
+    Edge('27e_37', 'ellipse_arc', ('p27e', 'center_tail', 'p27e', 'p37'), '', 'cross_body', 1),
+    Edge('32_27_d', 'ellipse_arc', ('p32', 'center_tail', 'p27d', 'p27d'), '', 'cross_body', -1),
+    Edge('27d_37', 'ellipse_arc', ('p27d', 'center_tail', 'p27d', 'p37'), '', 'cross_body', 1),
+    Edge('28_38', 'bezier', ('p28', 'c54', 'p38'), '', 'head_1', -1),
+    Edge('38_42', 'bezier', ('p38', 'c57', 'p42'), '', 'head_2', -1),
+    Edge('26_41_e', 'bezier', ('p26e', 'c56e', 'p41e'), '', 'head_1', -1),
+    Edge('41e_42', 'bezier', ('p41e', 'c59e', 'p42'), '', 'head_2', -1),
+    Edge('33_39', 'bezier', ('p33', 'c55', 'p39'), '', 'head_1', -1),
+    Edge('39_42', 'bezier', ('p39', 'c58', 'p42'), '', 'head_2', -1),
+    Edge('26_41_d', 'bezier', ('p26d', 'c56d', 'p41d'), '', 'head_1', -1),
+    Edge('41d_42', 'bezier', ('p41d', 'c59d', 'p42'), '', 'head_2', -1),
+    Edge('38_41e', 'circle_arc', ('p38', 'head_center', 'p41e'), '', 'cross_body_uniform', 1),
+    Edge('41e_39', 'circle_arc', ('p41e', 'head_center', 'p39'), '', 'cross_body_uniform', 1),
+    Edge('38_41d', 'circle_arc', ('p38', 'head_center', 'p41d'), '', 'cross_body_uniform', 1),
+    Edge('41d_39', 'circle_arc', ('p41d', 'head_center', 'p39'), '', 'cross_body_uniform', 1),
+    Edge('43_27_e', 'polyline', ('p43e', 'p27e'), 'curve84e', 'tail_le', -1),
+    Edge('44_27_e', 'polyline', ('p44e', 'p27e'), 'curve85e', 'tail_le', -1),
+    Edge('49_43_e', 'polyline', ('p49e', 'p43e'), 'curve86e', 'tail_te', 1),
+    Edge('49_44_e', 'polyline', ('p49e', 'p44e'), 'curve87e', 'tail_te', 1),
+    Edge('43_27_d', 'polyline', ('p43d', 'p27d'), 'curve84d', 'tail_le', -1),
+    Edge('44_27_d', 'polyline', ('p44d', 'p27d'), 'curve85d', 'tail_le', -1),
+    Edge('49_43_d', 'polyline', ('p49d', 'p43d'), 'curve86d', 'tail_te', 1),
+    Edge('49_44_d', 'polyline', ('p49d', 'p44d'), 'curve87d', 'tail_te', 1),
+    Edge('47_49_e', 'polyline', ('p47e', 'p49e'), 'curve82e', 'tail_edge', 1),
+    Edge('47_49_d', 'polyline', ('p47d', 'p49d'), 'curve82d', 'tail_edge', 1),
+    Edge('49e_51', 'polyline', ('p49e', 'p51'), 'curve83e', 'cross_body_uniform', 1),
+    Edge('49d_51', 'polyline', ('p49d', 'p51'), 'curve83d', 'cross_body_uniform', 1),
+    Edge('27_47_e', 'line', ('p27e', 'p47e'), '', 'tail_edge', -1),
+    Edge('27_47_d', 'line', ('p27d', 'p47d'), '', 'tail_edge', -1),
+    Edge('32_45', 'line', ('p32', 'p45'), '', 'tail_le', 1),
+    Edge('37_46', 'line', ('p37', 'p46'), '', 'tail_le', 1),
+    Edge('45_51', 'line', ('p45', 'p51'), '', 'tail_te', -1),
+    Edge('46_51', 'line', ('p46', 'p51'), '', 'tail_te', -1),
+    Edge('43_47_e', 'line', ('p43e', 'p47e'), '', 'tail_edge', 1),
+    Edge('43_47_d', 'line', ('p43d', 'p47d'), '', 'tail_edge', 1),
+    Edge('45_43e', 'line', ('p45', 'p43e'), '', 'cross_body_uniform', 1),
+    Edge('45_43d', 'line', ('p45', 'p43d'), '', 'cross_body_uniform', 1),
+    Edge('44_47_e', 'line', ('p44e', 'p47e'), '', 'tail_edge', 1),
+    Edge('44_47_d', 'line', ('p44d', 'p47d'), '', 'tail_edge', 1),
+    Edge('46_44e', 'line', ('p46', 'p44e'), '', 'cross_body_uniform', 1),
+    Edge('46_44d', 'line', ('p46', 'p44d'), '', 'cross_body_uniform', 1),
+]
+
+PATCHES: List[Patch] = [
+    Patch('1_2_16_14_e', ('1_2_e', '-16_2_e', '-14_16_e', '14_1_e')),
+    Patch('2_3_18_16_e', ('2_3_e', '-18_3_e', '-16_18_e', '16_2_e')),
+    Patch('3_4_20_18_e', ('3_4_e', '-20_4_e', '-18_20_e', '18_3_e')),
+    Patch('4_5_22_20_e', ('4_5_e', '-22_5_e', '-20_22_e', '20_4_e')),
+    Patch('5_6_24_22_e', ('5_6_e', '-24_6_e', '-22_24_e', '22_5_e')),
+    Patch('6_7_24_e', ('6_7_e', '-24_7_e', '24_6_e')),
+    Patch('14_16_12_13_e', ('14_16_e', '-12_16_e', '12_13_e', '13_14_e')),
+    Patch('16_18_11_12_e', ('16_18_e', '-11_18_e', '11_12_e', '12_16_e')),
+    Patch('18_20_10_11_e', ('18_20_e', '-10_20_e', '10_11_e', '11_18_e')),
+    Patch('20_22_9_10_e', ('20_22_e', '-9_22_e', '9_10_e', '10_20_e')),
+    Patch('22_24_8_9_e', ('22_24_e', '-8_24_e', '8_9_e', '9_22_e')),
+    Patch('24_7_8_e', ('24_7_e', '7_8_e', '8_24_e')),
+    Patch('1_15_17_2_e', ('-15_1_e', '15_17_e', '17_2_e', '-1_2_e')),
+    Patch('2_17_19_3_e', ('-17_2_e', '17_19_e', '19_3_e', '-2_3_e')),
+    Patch('3_19_21_4_e', ('-19_3_e', '19_21_e', '21_4_e', '-3_4_e')),
+    Patch('4_21_23_5_e', ('-21_4_e', '21_23_e', '23_5_e', '-4_5_e')),
+    Patch('5_23_25_6_e', ('-23_5_e', '23_25_e', '25_6_e', '-5_6_e')),
+    Patch('6_25_7_e', ('25_7_e', '-6_7_e', '-25_6_e')),
+    Patch('15_13_12_17_e', ('-13_15_e', '-12_13_e', '12_17_e', '-15_17_e')),
+    Patch('17_12_11_19_e', ('-12_17_e', '-11_12_e', '11_19_e', '-17_19_e')),
+    Patch('19_11_10_21_e', ('-11_19_e', '-10_11_e', '10_21_e', '-19_21_e')),
+    Patch('21_10_9_23_e', ('-10_21_e', '-9_10_e', '9_23_e', '-21_23_e')),
+    Patch('23_9_8_25_e', ('-9_23_e', '-8_9_e', '8_25_e', '-23_25_e')),
+    Patch('25_8_7_e', ('-7_8_e', '-25_7_e', '-8_25_e')),
+    Patch('1_2_16_14_d', ('-14_1_d', '14_16_d', '16_2_d', '-1_2_d')),
+    Patch('2_3_18_16_d', ('-16_2_d', '16_18_d', '18_3_d', '-2_3_d')),
+    Patch('3_4_20_18_d', ('-18_3_d', '18_20_d', '20_4_d', '-3_4_d')),
+    Patch('4_5_22_20_d', ('-20_4_d', '20_22_d', '22_5_d', '-4_5_d')),
+    Patch('5_6_24_22_d', ('-22_5_d', '22_24_d', '24_6_d', '-5_6_d')),
+    Patch('6_7_24_d', ('24_7_d', '-6_7_d', '-24_6_d')),
+    Patch('14_16_12_13_d', ('-13_14_d', '-12_13_d', '12_16_d', '-14_16_d')),
+    Patch('16_18_11_12_d', ('-12_16_d', '-11_12_d', '11_18_d', '-16_18_d')),
+    Patch('18_20_10_11_d', ('-11_18_d', '-10_11_d', '10_20_d', '-18_20_d')),
+    Patch('20_22_9_10_d', ('-10_20_d', '-9_10_d', '9_22_d', '-20_22_d')),
+    Patch('22_24_8_9_d', ('-9_22_d', '-8_9_d', '8_24_d', '-22_24_d')),
+    Patch('24_7_8_d', ('-7_8_d', '-24_7_d', '-8_24_d')),
+    Patch('1_15_17_2_d', ('1_2_d', '-17_2_d', '-15_17_d', '15_1_d')),
+    Patch('2_17_19_3_d', ('2_3_d', '-19_3_d', '-17_19_d', '17_2_d')),
+    Patch('3_19_21_4_d', ('3_4_d', '-21_4_d', '-19_21_d', '19_3_d')),
+    Patch('4_21_23_5_d', ('4_5_d', '-23_5_d', '-21_23_d', '21_4_d')),
+    Patch('5_23_25_6_d', ('5_6_d', '-25_6_d', '-23_25_d', '23_5_d')),
+    Patch('6_25_7_d', ('6_7_d', '-25_7_d', '25_6_d')),
+    Patch('15_13_12_17_d', ('15_17_d', '-12_17_d', '12_13_d', '13_15_d')),
+    Patch('17_12_11_19_d', ('17_19_d', '-11_19_d', '11_12_d', '12_17_d')),
+    Patch('19_11_10_21_d', ('19_21_d', '-10_21_d', '10_11_d', '11_19_d')),
+    Patch('21_10_9_23_d', ('21_23_d', '-9_23_d', '9_10_d', '10_21_d')),
+    Patch('23_9_8_25_d', ('23_25_d', '-8_25_d', '8_9_d', '9_23_d')),
+    Patch('25_8_7_d', ('25_7_d', '7_8_d', '8_25_d')),
+    Patch('26e_1e_29_28', ('26_1_e', '-29_1_e', '-28_29', '28_26_e')),
+    Patch('1e_14e_30_29', ('-14_1_e', '-30_14_e', '-29_30', '29_1_e')),
+    Patch('14e_13e_31_30', ('-13_14_e', '-31_13_e', '-30_31', '30_14_e')),
+    Patch('31_13e_27e_32', ('13_27_e', '-32_27_e', '-31_32', '31_13_e')),
+    Patch('26d_1d_29_28', ('26d_28', '28_29', '29_1_d', '-26_1_d')),
+    Patch('1d_14d_30_29', ('29_30', '30_14_d', '14_1_d', '-29_1_d')),
+    Patch('14d_13d_31_30', ('30_31', '31_13_d', '13_14_d', '-30_14_d')),
+    Patch('31_13d_27d_32', ('31_32', '32_27_d', '-13_27_d', '-31_13_d')),
+    Patch('26e_33_34_1e', ('26e_33', '33_34', '-1e_34', '-26_1_e')),
+    Patch('1e_34_35_15e', ('1e_34', '34_35', '-15e_35', '15_1_e')),
+    Patch('15e_35_36_13e', ('15e_35', '35_36', '-13e_36', '13_15_e')),
+    Patch('13e_36_37_27e', ('13e_36', '36_37', '-27e_37', '-13_27_e')),
+    Patch('26d_33_34_1d', ('26_1_d', '1d_34', '-33_34', '33_26_d')),
+    Patch('1d_34_35_15d', ('-15_1_d', '15d_35', '-34_35', '-1d_34')),
+    Patch('15d_35_36_13d', ('-13_15_d', '13d_36', '-35_36', '-15d_35')),
+    Patch('13d_36_37_27d', ('13_27_d', '27d_37', '-36_37', '-13d_36')),
+    Patch('28_26e_41e_38', ('28_38', '38_41e', '-26_41_e', '-28_26_e')),
+    Patch('26e_33_39_41e', ('26_41_e', '41e_39', '-33_39', '-26e_33')),
+    Patch('28_26d_41d_38', ('26_41_d', '-38_41d', '-28_38', '-26d_28')),
+    Patch('26d_33_39_41d', ('33_39', '-41d_39', '-26_41_d', '-33_26_d')),
+    Patch('38_41e_42', ('38_42', '-41e_42', '-38_41e')),
+    Patch('41e_39_42', ('41e_42', '-39_42', '-41e_39')),
+    Patch('41d_38_42', ('41d_42', '-38_42', '38_41d')),
+    Patch('39_41d_42', ('39_42', '-41d_42', '41d_39')),
+    Patch('27_47_43_e', ('27_47_e', '-43_47_e', '43_27_e')),
+    Patch('27e_43e_45_32', ('-43_27_e', '-45_43e', '-32_45', '32_27_e')),
+    Patch('32_45_43d_27d', ('32_45', '45_43d', '43_27_d', '-32_27_d')),
+    Patch('43_47_27_d', ('43_47_d', '-27_47_d', '-43_27_d')),
+    Patch('43_47_49_e', ('43_47_e', '47_49_e', '49_43_e')),
+    Patch('43e_49e_51_45', ('-49_43_e', '49e_51', '-45_51', '45_43e')),
+    Patch('45_51_49d_43d', ('45_51', '-49d_51', '49_43_d', '-45_43d')),
+    Patch('49_47_43_d', ('-47_49_d', '-43_47_d', '-49_43_d')),
+    Patch('27_47_44_e', ('44_47_e', '-27_47_e', '-44_27_e')),
+    Patch('27e_44e_46_37', ('27e_37', '37_46', '46_44e', '44_27_e')),
+    Patch('37_46_44d_27d', ('-27d_37', '-44_27_d', '-46_44d', '-37_46')),
+    Patch('44_47_27_d', ('27_47_d', '-44_47_d', '44_27_d')),
+    Patch('44_47_49_e', ('-47_49_e', '-44_47_e', '-49_44_e')),
+    Patch('44e_49e_51_46', ('-46_44e', '46_51', '-49e_51', '49_44_e')),
+    Patch('46_51_49d_44d', ('46_44d', '-49_44_d', '49d_51', '-46_51')),
+    Patch('49_47_44_d', ('44_47_d', '47_49_d', '49_44_d')),
+]
+
+# Edges of the trailing edge, in the order of Mesh.trailing_edge
+TRAILING_EDGE: List[str] = [
+    '7_8_e', '8_9_e', '9_10_e', '10_11_e', '11_12_e', '12_13_e', '47_49_e', '49e_51',
+    '7_8_d', '8_9_d', '9_10_d', '10_11_d', '11_12_d', '12_13_d', '47_49_d', '49d_51',
+]
@@ -1,6 +1,7 @@
 from abc import ABC
-import vtkmodules.all as vtk
-from numpy import ndarray
+from numpy import arange, ascontiguousarray, concatenate, cumsum, float32, ndarray
+
+from pybird.modules.view import vtk_xml
 
 class VIEW_ABS(ABC):
 
@@ -8,8 +9,12 @@ class VIEW_ABS(ABC):
         """Stores the mesh"""
         pass
     
-    def gen_vtp_file(self, filename: str) -> None:
-        """Create a vtk file"""
+    def gen_vtp_file(self, filename: str, binary: bool, backend: str) -> None:
+        """Create a vtp file"""
+        pass
+
+    def gen_vtu_file(self, filename: str, binary: bool) -> None:
+        """Create a vtu file"""
         pass
 
 class View(VIEW_ABS):
@@ -19,7 +24,26 @@ class View(VIEW_ABS):
         self._fc = fc
         return
     
-    def gen_vtp_file(self, filename: str) -> None:
+    def gen_vtp_file(self, filename: str, binary: bool = False, backend: str = 'native') -> None:
+
+        assert backend in ['native', 'vtk']
+
+        if backend == 'vtk':
+            self.__gen_vtp_file_vtk(filename, binary)
+        else:
+            vtk_xml.write_vtp('{}.vtp'.format(filename), self._vt, self._fc, binary=binary)
+        
+        return
+
+    def gen_vtu_file(self, filename: str, binary: bool = False) -> None:
+        vtk_xml.write_vtu('{}.vtu'.format(filename), self._vt, self._fc, binary=binary)
+        return
+
+    def __gen_vtp_file_vtk(self, filename: str, binary: bool) -> None:
+
+        # Only loaded when requested, since importing vtk is slow and memory hungry
+        import vtkmodules.all as vtk
+        from vtkmodules.util import numpy_support
 
         pd = vtk.vtkPolyData()
 
@@ -27,30 +51,31 @@ class View(VIEW_ABS):
         cells = vtk.vtkCellArray()
 
         # Surface
-        for vertice in self._vt:
-            points.InsertNextPoint(vertice[0], vertice[1], vertice[2])
-
-        for face in self._fc:
-            if face[0] == 3:
-                cell = vtk.vtkTriangle()
-                cell.GetPointIds().SetId(0, face[1])
-                cell.GetPointIds().SetId(1, face[2])
-                cell.GetPointIds().SetId(2, face[3])
-            else:
-                cell = vtk.vtkQuad()
-                cell.GetPointIds().SetId(0, face[1])
-                cell.GetPointIds().SetId(1, face[2])
-                cell.GetPointIds().SetId(2, face[3])
-                cell.GetPointIds().SetId(3, face[4])
-        
-            cells.InsertNextCell(cell)
-                    
+        points.SetData(numpy_support.numpy_to_vtk(ascontiguousarray(self._vt, dtype=float32), deep=True))
+
+        # Each face is stored as [n, id1, id2, id3, id4], with id4 = -1 for triangles
+        sizes = self._fc[:, 0]
+        connectivity = self._fc[:, 1:][arange(4) < sizes[:, None]]
+        offsets = concatenate(([0], cumsum(sizes)))
+
+        id_type = numpy_support.get_vtk_to_numpy_typemap()[vtk.VTK_ID_TYPE]
+        cells.SetData(
+            numpy_support.numpy_to_vtkIdTypeArray(ascontiguousarray(offsets, dtype=id_type), deep=True),
+            numpy_support.numpy_to_vtkIdTypeArray(ascontiguousarray(connectivity, dtype=id_type), deep=True),
+        )
+
         pd.SetPoints(points)
         pd.SetPolys(cells)
 
         writer = vtk.vtkXMLPolyDataWriter()
         writer.SetFileName('{}.vtp'.format(filename))
         writer.SetInputData(pd)
+
+        if binary:
+            writer.SetDataModeToAppended()
+            writer.EncodeAppendedDataOff()
+            writer.SetCompressorTypeToZLib()
+
         writer.Write()
         
-        return
\ No newline at end of file
+        return
@@ -0,0 +1,119 @@
+from base64 import b64encode
+from typing import List
+from zlib import compress as zlib_compress
+from numpy import arange, array, ascontiguousarray, cumsum, float32, full, int64, ndarray, uint8, uint64
+
+# Block size used by vtkZLibDataCompressor
+BLOCK_SIZE = 32768
+
+# VTK cell types
+VTK_TRIANGLE = 5
+VTK_QUAD = 9
+
+_types = {
+    float32: 'Float32',
+    int64: 'Int64',
+    uint8: 'UInt8',
+}
+
+def _cells(fc: ndarray) -> List[ndarray]:
+    """Returns the connectivity, offsets and sizes of the faces. Each face is stored as [n, id1, id2, id3, id4], with id4 = -1 for triangles"""
+    sizes = fc[:, 0].astype(int64)
+    connectivity = ascontiguousarray(fc[:, 1:][arange(4) < sizes[:, None]], dtype=int64)
+    offsets = cumsum(sizes, dtype=int64)
+    return [connectivity, offsets, sizes]
+
+def _block(data: ndarray, compress: bool) -> List[bytes]:
+    """Returns the header and the content of an appended data block"""
+
+    raw = data.tobytes()
+
+    if not compress:
+        return [array([len(raw)], dtype=uint64).tobytes(), raw]
+
+    blocks = [zlib_compress(raw[i:i + BLOCK_SIZE]) for i in range(0, len(raw), BLOCK_SIZE)]
+    last_size = len(raw) - BLOCK_SIZE * (len(blocks) - 1) if len(blocks) > 0 else 0
+    header = array([len(blocks), BLOCK_SIZE, last_size] + [len(b) for b in blocks], dtype=uint64)
+
+    return [header.tobytes(), b''.join(blocks)]
+
+def _write(filename: str, data_type: str, piece: str, arrays: List[List], binary: bool, compress: bool) -> None:
+    """Writes a VTK XML file with all the data arrays stored in the appended section"""
+
+    # Encode data arrays
+    encoded = []
+    for arr in arrays:
+        header, content = _block(arr[2], compress)
+        encoded.append(header + content if binary else b64encode(header) + b64encode(content))
+
+    offsets = [0] + list(cumsum([len(e) for e in encoded]))
+
+    # Xml
+    compressor = ' compressor="vtkZLibDataCompressor"' if compress else ''
+    xml = [
+        '<?xml version="1.0"?>',
+        '<VTKFile type="{}" version="1.0" byte_order="LittleEndian" header_type="UInt64"{}>'.format(data_type, compressor),
+        '  <{}>'.format(data_type),
+        '    <Piece {}>'.format(piece),
+    ]
+
+    group = None
+    for i, (name, parent, arr, n_comp) in enumerate(arrays):
+        if parent != group:
+            if group is not None: xml.append('      </{}>'.format(group))
+            xml.append('      <{}>'.format(parent))
+            group = parent
+        xml.append('        <DataArray type="{}" Name="{}" NumberOfComponents="{}" format="appended" offset="{}"/>'.format(_types[arr.dtype.type], name, n_comp, offsets[i]))
+    xml.append('      </{}>'.format(group))
+
+    xml += [
+        '    </Piece>',
+        '  </{}>'.format(data_type),
+        '  <AppendedData encoding="{}">'.format('raw' if binary else 'base64'),
+    ]
+
+    # Write
+    with open(filename, 'wb') as f:
+        f.write('\n'.join(xml).encode('ascii'))
+        f.write(b'\n   _')
+        for e in encoded:
+            f.write(e)
+        f.write(b'\n  </AppendedData>\n</VTKFile>\n')
+
+    return
+
+def write_vtp(filename: str, vt: ndarray, fc: ndarray, binary: bool = False, compress: bool = True) -> None:
+    """Writes a PolyData (.vtp) file. The appended data is raw binary if binary is True and base64 encoded otherwise"""
+
+    connectivity, offsets, _ = _cells(fc)
+
+    piece = 'NumberOfPoints="{}" NumberOfVerts="0" NumberOfLines="0" NumberOfStrips="0" NumberOfPolys="{}"'.format(vt.shape[0], fc.shape[0])
+    arrays = [
+        ['Points', 'Points', ascontiguousarray(vt, dtype=float32), 3],
+        ['connectivity', 'Polys', connectivity, 1],
+        ['offsets', 'Polys', offsets, 1],
+    ]
+
+    _write(filename, 'PolyData', piece, arrays, binary, compress)
+
+    return
+
+def write_vtu(filename: str, vt: ndarray, fc: ndarray, binary: bool = False, compress: bool = True) -> None:
+    """Writes an UnstructuredGrid (.vtu) file. The appended data is raw binary if binary is True and base64 encoded otherwise"""
+
+    connectivity, offsets, sizes = _cells(fc)
+
+    types = full(sizes.shape[0], VTK_QUAD, dtype=uint8)
+    types[sizes == 3] = VTK_TRIANGLE
+
+    piece = 'NumberOfPoints="{}" NumberOfCells="{}"'.format(vt.shape[0], fc.shape[0])
+    arrays = [
+        ['Points', 'Points', ascontiguousarray(vt, dtype=float32), 3],
+        ['connectivity', 'Cells', connectivity, 1],
+        ['offsets', 'Cells', offsets, 1],
+        ['types', 'Cells', types, 1],
+    ]
+
+    _write(filename, 'UnstructuredGrid', piece, arrays, binary, compress)
+
+    return
@@ -0,0 +1,48 @@
+from glob import glob
+from os.path import dirname, join
+
+import pytest
+from numpy import array_equal
+from numpy.linalg import norm
+
+pytest.importorskip('gmsh')
+
+import pybird
+from pybird.modules.geo.geo import Geometry
+from pybird.modules.mesh.mesh import Mesh
+from pybird.modules.mesh.structured import tolerance
+
+CASES = sorted(glob(join(dirname(__file__), '..', 'examples', 'data', '*.case')))
+
+R = pybird.refinement
+REFINEMENTS = [
+    R.model(wing=R.wing(), body=R.body(), head=R.head(), tail=R.tail()),
+    R.model(
+        wing=R.wing(sections=[R.wing_section(12, 'Progression', 1.1), R.wing_section(8, 'Bump', 0.3), R.wing_section(4), R.wing_section(9, 'Beta', 1.2), R.wing_section(7), R.wing_section(5)], coef_te=1.2, coef_le=1.1),
+        body=R.body(n_cross_body=13, coef_cross_body=1.2, coef_head=1.3, coef_tail=1.05),
+        head=R.head(n_1=8, coef_1=1.2, coef_2=1.3),
+        tail=R.tail(coef_edge_le=1.5, coef_edge_te=1.2, coef_tip=1.3, n_1=7, n_2=9, n_edge=11),
+    ),
+]
+
+@pytest.mark.parametrize('ref', range(len(REFINEMENTS)))
+@pytest.mark.parametrize('case', CASES)
+def test_structured_mesh_within_tolerance_of_gmsh(case: str, ref: int) -> None:
+
+    pybird.init()
+    pybird.load(case)
+    geo = Geometry(pybird.model.geo)
+    geo.build()
+
+    meshes = {}
+    for backend in ['gmsh', 'structured']:
+        mesh = Mesh(geo)
+        mesh.build(REFINEMENTS[ref], False, backend)
+        meshes[backend] = mesh
+
+    gmsh, structured = meshes['gmsh'], meshes['structured']
+
+    assert array_equal(structured.faces, gmsh.faces)
+    assert array_equal(structured.trailing_edge, gmsh.trailing_edge)
+    assert structured.vertices.shape == gmsh.vertices.shape
+    assert norm(structured.vertices - gmsh.vertices, axis=1).max() <= tolerance